@@ -0,0 +1,248 @@
+import asyncio
+import queue
+import threading
+from database import HotelDatabase, AccountDatabase, NO_VALUE
+
+
+# ============== DATABASE POOL ==============
+
+def set_future_result(future, result):
+    # Runs on the event loop; the caller may have given up waiting already
+    if not future.done():
+        future.set_result(result)
+
+
+def set_future_error(future, error):
+    if not future.done():
+        future.set_exception(error)
+
+
+class DatabasePool:
+    # This class run database calls for asyncio code on a fixed number of
+    # threads, each with its own connection. Reads are shared by the reader
+    # threads; writes all go to one writer thread, so they run one at a time
+    # in the order they were made and never wait on each other's locks.
+
+    def __init__(self, open_database, readers=4):
+        self.open_database = open_database
+        self.read_jobs = queue.Queue()
+        self.write_jobs = queue.Queue()
+        self.closed = False
+        # Readers open their connection only after the writer has brought the
+        # schema up to date, so migrations never run twice at once
+        self.writer_ready = threading.Event()
+
+        self.threads = [threading.Thread(target=self.work, args=(self.write_jobs, True), daemon=True)]
+        for number in range(readers):
+            self.threads.append(threading.Thread(target=self.work, args=(self.read_jobs, False), daemon=True))
+        for thread in self.threads:
+            thread.start()
+
+    def work(self, jobs, is_writer):
+        # Thread loop: run jobs until a None job says to stop
+        if not is_writer:
+            self.writer_ready.wait()
+        try:
+            db = self.open_database()
+        finally:
+            if is_writer:
+                self.writer_ready.set()
+        try:
+            while True:
+                job = jobs.get()
+                if job is None:
+                    break
+                loop, future, call = job
+                try:
+                    result = call(db)
+                except Exception as e:
+                    loop.call_soon_threadsafe(set_future_error, future, e)
+                else:
+                    loop.call_soon_threadsafe(set_future_result, future, result)
+        finally:
+            db.close()
+
+    def submit(self, jobs, call):
+        if self.closed:
+            raise RuntimeError("Database pool is closed")
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        jobs.put((loop, future, call))
+        return future
+
+    async def read(self, call):
+        # Run call(db) on a reader thread
+        return await self.submit(self.read_jobs, call)
+
+    async def write(self, call):
+        # Run call(db) on the writer thread, after every earlier write
+        return await self.submit(self.write_jobs, call)
+
+    async def close(self):
+        # Let the threads finish the jobs already queued, then close their
+        # connections (each on its own thread)
+        if self.closed:
+            return
+        self.closed = True
+        self.write_jobs.put(None)
+        for thread in self.threads[1:]:
+            self.read_jobs.put(None)
+        await asyncio.to_thread(self.join)
+
+    def join(self):
+        for thread in self.threads:
+            thread.join()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, error_type, error, traceback):
+        await self.close()
+
+
+# ============== ASYNC HOTEL DATABASE ==============
+
+class AsyncHotelDatabase(DatabasePool):
+    # This class is HotelDatabase for asyncio code: the same methods and
+    # return values, awaited instead of blocking the event loop.
+    #
+    #     async with AsyncHotelDatabase("branch1") as db:
+    #         rooms = await db.get_available_rooms()
+
+    def __init__(self, username, readers=4, profile=None):
+        super().__init__(lambda: HotelDatabase(username, profile), readers)
+
+    # ========== ROOM OPERATIONS ==========
+
+    async def get_all_rooms(self):
+        return await self.read(lambda db: db.get_all_rooms())
+
+    async def get_available_rooms(self):
+        return await self.read(lambda db: db.get_available_rooms())
+
+    async def find_available_rooms(self, checkin, checkout, min_capacity=None, room_type=None,
+                                   exclude_guest_id=None):
+        return await self.read(lambda db: db.find_available_rooms(checkin, checkout, min_capacity, room_type,
+                                                                  exclude_guest_id))
+
+    async def get_room_by_number(self, room_number):
+        return await self.read(lambda db: db.get_room_by_number(room_number))
+
+    async def add_room(self, room_type, price_rate, capacity, description, status):
+        return await self.write(lambda db: db.add_room(room_type, price_rate, capacity, description, status))
+
+    async def update_room(self, room_number, room_type, price_rate, status, capacity, description):
+        return await self.write(
+            lambda db: db.update_room(room_number, room_type, price_rate, status, capacity, description))
+
+    async def update_room_status(self, room_number, status):
+        return await self.write(lambda db: db.update_room_status(room_number, status))
+
+    async def delete_room(self, room_number):
+        return await self.write(lambda db: db.delete_room(room_number))
+
+    # ========== SEARCH ==========
+
+    async def search_reservations(self, query, limit=200):
+        return await self.read(lambda db: db.search_reservations(query, limit))
+
+    async def search_rooms(self, query, limit=200):
+        return await self.read(lambda db: db.search_rooms(query, limit))
+
+    async def query_rooms(self, text, limit=500):
+        return await self.read(lambda db: db.query_rooms(text, limit))
+
+    async def query_reservations(self, text, limit=500):
+        return await self.read(lambda db: db.query_reservations(text, limit))
+
+    # ========== PAGED READS ==========
+
+    async def iter_rooms(self, after_number=None, limit=200, order_by="room_number", after_value=NO_VALUE):
+        return await self.read(lambda db: db.iter_rooms(after_number, limit, order_by, after_value))
+
+    async def iter_reservations(self, after_id=None, limit=200, order_by="guest_id", after_value=NO_VALUE):
+        return await self.read(lambda db: db.iter_reservations(after_id, limit, order_by, after_value))
+
+    # ========== BULK OPERATIONS ==========
+
+    async def add_rooms_bulk(self, rooms, chunk_size=500):
+        # rooms is iterated on the writer thread
+        return await self.write(lambda db: db.add_rooms_bulk(rooms, chunk_size))
+
+    async def add_reservations_bulk(self, reservations, chunk_size=500):
+        return await self.write(lambda db: db.add_reservations_bulk(reservations, chunk_size))
+
+    async def update_room_status_bulk(self, updates, chunk_size=500):
+        return await self.write(lambda db: db.update_room_status_bulk(updates, chunk_size))
+
+    # ========== CHANGE TRACKING ==========
+
+    async def last_change_seq(self):
+        return await self.read(lambda db: db.last_change_seq())
+
+    async def changes_since(self, after_seq):
+        return await self.read(lambda db: db.changes_since(after_seq))
+
+    # ========== RESERVATION OPERATIONS ==========
+
+    async def get_all_reservations(self):
+        return await self.read(lambda db: db.get_all_reservations())
+
+    async def get_reservation_by_id(self, guest_id):
+        return await self.read(lambda db: db.get_reservation_by_id(guest_id))
+
+    async def add_reservation(self, guest_name, contact, room_number, checkin_date, checkout_date, payment_status):
+        return await self.write(lambda db: db.add_reservation(guest_name, contact, room_number, checkin_date,
+                                                              checkout_date, payment_status))
+
+    async def update_reservation(self, guest_id, guest_name, contact, room_number, checkin_date, checkout_date,
+                                 payment_status, old_room_number):
+        return await self.write(lambda db: db.update_reservation(guest_id, guest_name, contact, room_number,
+                                                                 checkin_date, checkout_date, payment_status,
+                                                                 old_room_number))
+
+    async def delete_reservation(self, guest_id):
+        return await self.write(lambda db: db.delete_reservation(guest_id))
+
+
+# ============== ASYNC ACCOUNT DATABASE ==============
+
+class AsyncAccountDatabase(DatabasePool):
+    # This class is AccountDatabase (admin and branches) for asyncio code
+
+    def __init__(self, readers=2, profile=None):
+        super().__init__(lambda: AccountDatabase(profile), readers)
+
+    # ========== ADMIN OPERATIONS ==========
+
+    async def check_existing_admin(self):
+        return await self.read(lambda db: db.check_existing_admin())
+
+    async def create_administrator(self, password):
+        return await self.write(lambda db: db.create_administrator(password))
+
+    async def validate_admin(self, password):
+        return await self.read(lambda db: db.validate_admin(password))
+
+    # ========== BRANCH OPERATIONS ==========
+
+    async def get_branch_names(self):
+        return await self.read(lambda db: db.get_branch_names())
+
+    async def get_all_branches(self):
+        return await self.read(lambda db: db.get_all_branches())
+
+    async def get_branch_by_id(self, uid):
+        return await self.read(lambda db: db.get_branch_by_id(uid))
+
+    async def add_branch(self, username, address, contact, password):
+        return await self.write(lambda db: db.add_branch(username, address, contact, password))
+
+    async def update_branch(self, uid, username, address, contact, password):
+        return await self.write(lambda db: db.update_branch(uid, username, address, contact, password))
+
+    async def delete_branch(self, uid):
+        return await self.write(lambda db: db.delete_branch(uid))
+
+    async def validate_branches(self, username, password):
+        return await self.read(lambda db: db.validate_branches(username, password))
@@ -0,0 +1,149 @@
+# Form implementation generated from reading ui file 'branch_add_page.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_BranchAddPage(object):
+    def setupUi(self, BranchAddPage):
+        BranchAddPage.setObjectName("BranchAddPage")
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        BranchAddPage.setFont(font)
+        self.verticalLayout_18 = QtWidgets.QVBoxLayout(BranchAddPage)
+        self.verticalLayout_18.setObjectName("verticalLayout_18")
+        self.header_5 = QtWidgets.QFrame(parent=BranchAddPage)
+        self.header_5.setStyleSheet("background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:0.931, y2:0, stop:0.265957 rgba(102, 173, 255, 255), stop:0.547872 rgba(55, 111, 186, 255), stop:1 rgba(16, 36, 62, 255));\n"
+"color: rgb(255, 255, 255);\n"
+"border: None;\n"
+"")
+        self.header_5.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.header_5.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.header_5.setObjectName("header_5")
+        self.verticalLayout_17 = QtWidgets.QVBoxLayout(self.header_5)
+        self.verticalLayout_17.setObjectName("verticalLayout_17")
+        self.label_31 = QtWidgets.QLabel(parent=self.header_5)
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        self.label_31.setFont(font)
+        self.label_31.setObjectName("label_31")
+        self.verticalLayout_17.addWidget(self.label_31)
+        self.label_32 = QtWidgets.QLabel(parent=self.header_5)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.label_32.setFont(font)
+        self.label_32.setObjectName("label_32")
+        self.verticalLayout_17.addWidget(self.label_32)
+        self.verticalLayout_18.addWidget(self.header_5)
+        self.gridLayout_2 = QtWidgets.QGridLayout()
+        self.gridLayout_2.setObjectName("gridLayout_2")
+        self.label_37 = QtWidgets.QLabel(parent=BranchAddPage)
+        self.label_37.setObjectName("label_37")
+        self.gridLayout_2.addWidget(self.label_37, 5, 1, 1, 1)
+        self.lineEdit_branchContact = QtWidgets.QLineEdit(parent=BranchAddPage)
+        self.lineEdit_branchContact.setObjectName("lineEdit_branchContact")
+        self.gridLayout_2.addWidget(self.lineEdit_branchContact, 6, 1, 1, 1)
+        spacerItem = QtWidgets.QSpacerItem(40, 25, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.gridLayout_2.addItem(spacerItem, 0, 2, 1, 1)
+        self.lineEdit_branchAddress = QtWidgets.QLineEdit(parent=BranchAddPage)
+        self.lineEdit_branchAddress.setObjectName("lineEdit_branchAddress")
+        self.gridLayout_2.addWidget(self.lineEdit_branchAddress, 4, 1, 1, 1)
+        self.label_33 = QtWidgets.QLabel(parent=BranchAddPage)
+        self.label_33.setMinimumSize(QtCore.QSize(0, 18))
+        self.label_33.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeading|QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.label_33.setObjectName("label_33")
+        self.gridLayout_2.addWidget(self.label_33, 0, 1, 1, 1)
+        self.label_36 = QtWidgets.QLabel(parent=BranchAddPage)
+        self.label_36.setObjectName("label_36")
+        self.gridLayout_2.addWidget(self.label_36, 3, 1, 1, 1)
+        self.lineEdit_branchName = QtWidgets.QLineEdit(parent=BranchAddPage)
+        self.lineEdit_branchName.setObjectName("lineEdit_branchName")
+        self.gridLayout_2.addWidget(self.lineEdit_branchName, 1, 1, 1, 1)
+        spacerItem1 = QtWidgets.QSpacerItem(37, 25, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.gridLayout_2.addItem(spacerItem1, 0, 0, 1, 1)
+        self.gridLayout_4 = QtWidgets.QGridLayout()
+        self.gridLayout_4.setObjectName("gridLayout_4")
+        self.label_45 = QtWidgets.QLabel(parent=BranchAddPage)
+        self.label_45.setObjectName("label_45")
+        self.gridLayout_4.addWidget(self.label_45, 0, 2, 1, 1)
+        self.horizontalLayout_9 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_9.setObjectName("horizontalLayout_9")
+        self.lineEdit_branchPass_3 = QtWidgets.QLineEdit(parent=BranchAddPage)
+        self.lineEdit_branchPass_3.setMinimumSize(QtCore.QSize(0, 26))
+        self.lineEdit_branchPass_3.setEchoMode(QtWidgets.QLineEdit.EchoMode.Password)
+        self.lineEdit_branchPass_3.setObjectName("lineEdit_branchPass_3")
+        self.horizontalLayout_9.addWidget(self.lineEdit_branchPass_3)
+        self.btn_showpass = QtWidgets.QPushButton(parent=BranchAddPage)
+        self.btn_showpass.setStyleSheet("")
+        self.btn_showpass.setText("")
+        self.btn_showpass.setObjectName("btn_showpass")
+        self.horizontalLayout_9.addWidget(self.btn_showpass)
+        self.gridLayout_4.addLayout(self.horizontalLayout_9, 1, 0, 1, 1)
+        self.horizontalLayout_8 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_8.setObjectName("horizontalLayout_8")
+        self.lineEdit_branchConfPass_3 = QtWidgets.QLineEdit(parent=BranchAddPage)
+        self.lineEdit_branchConfPass_3.setMinimumSize(QtCore.QSize(0, 26))
+        self.lineEdit_branchConfPass_3.setEchoMode(QtWidgets.QLineEdit.EchoMode.Password)
+        self.lineEdit_branchConfPass_3.setObjectName("lineEdit_branchConfPass_3")
+        self.horizontalLayout_8.addWidget(self.lineEdit_branchConfPass_3)
+        self.btn_showpass_2 = QtWidgets.QPushButton(parent=BranchAddPage)
+        self.btn_showpass_2.setStyleSheet("")
+        self.btn_showpass_2.setText("")
+        self.btn_showpass_2.setObjectName("btn_showpass_2")
+        self.horizontalLayout_8.addWidget(self.btn_showpass_2)
+        self.gridLayout_4.addLayout(self.horizontalLayout_8, 1, 2, 1, 1)
+        self.label_46 = QtWidgets.QLabel(parent=BranchAddPage)
+        self.label_46.setObjectName("label_46")
+        self.gridLayout_4.addWidget(self.label_46, 0, 0, 1, 1)
+        spacerItem2 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.gridLayout_4.addItem(spacerItem2, 1, 1, 1, 1)
+        self.gridLayout_2.addLayout(self.gridLayout_4, 2, 1, 1, 1)
+        self.verticalLayout_18.addLayout(self.gridLayout_2)
+        spacerItem3 = QtWidgets.QSpacerItem(20, 10, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Fixed)
+        self.verticalLayout_18.addItem(spacerItem3)
+        self.footer_5 = QtWidgets.QHBoxLayout()
+        self.footer_5.setObjectName("footer_5")
+        spacerItem4 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.footer_5.addItem(spacerItem4)
+        self.cancel_btn_5 = QtWidgets.QPushButton(parent=BranchAddPage)
+        self.cancel_btn_5.setObjectName("cancel_btn_5")
+        self.footer_5.addWidget(self.cancel_btn_5)
+        self.btn_addBranch = QtWidgets.QPushButton(parent=BranchAddPage)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.btn_addBranch.setFont(font)
+        self.btn_addBranch.setStyleSheet("background-color: rgb(0, 0, 0);\n"
+"color: rgb(255, 255, 255);")
+        self.btn_addBranch.setObjectName("btn_addBranch")
+        self.footer_5.addWidget(self.btn_addBranch)
+        spacerItem5 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.footer_5.addItem(spacerItem5)
+        self.verticalLayout_18.addLayout(self.footer_5)
+
+        self.retranslateUi(BranchAddPage)
+        QtCore.QMetaObject.connectSlotsByName(BranchAddPage)
+        BranchAddPage.setTabOrder(self.lineEdit_branchName, self.lineEdit_branchPass_3)
+        BranchAddPage.setTabOrder(self.lineEdit_branchPass_3, self.btn_showpass)
+        BranchAddPage.setTabOrder(self.btn_showpass, self.lineEdit_branchConfPass_3)
+        BranchAddPage.setTabOrder(self.lineEdit_branchConfPass_3, self.btn_showpass_2)
+        BranchAddPage.setTabOrder(self.btn_showpass_2, self.lineEdit_branchAddress)
+        BranchAddPage.setTabOrder(self.lineEdit_branchAddress, self.lineEdit_branchContact)
+        BranchAddPage.setTabOrder(self.lineEdit_branchContact, self.cancel_btn_5)
+        BranchAddPage.setTabOrder(self.cancel_btn_5, self.btn_addBranch)
+
+    def retranslateUi(self, BranchAddPage):
+        _translate = QtCore.QCoreApplication.translate
+        self.label_31.setText(_translate("BranchAddPage", "Add Branch"))
+        self.label_32.setText(_translate("BranchAddPage", "Enter details for the new branch"))
+        self.label_37.setText(_translate("BranchAddPage", "Contact"))
+        self.label_33.setText(_translate("BranchAddPage", "Branch Name"))
+        self.label_36.setText(_translate("BranchAddPage", "Address"))
+        self.label_45.setText(_translate("BranchAddPage", "Confirm Password"))
+        self.label_46.setText(_translate("BranchAddPage", "Password"))
+        self.cancel_btn_5.setText(_translate("BranchAddPage", "Cancel"))
+        self.btn_addBranch.setText(_translate("BranchAddPage", "Add Branch"))
@@ -0,0 +1,143 @@
+# Form implementation generated from reading ui file 'branch_edit_page.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_BranchEditPage(object):
+    def setupUi(self, BranchEditPage):
+        BranchEditPage.setObjectName("BranchEditPage")
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        BranchEditPage.setFont(font)
+        self.verticalLayout_27 = QtWidgets.QVBoxLayout(BranchEditPage)
+        self.verticalLayout_27.setObjectName("verticalLayout_27")
+        self.header_6 = QtWidgets.QFrame(parent=BranchEditPage)
+        self.header_6.setStyleSheet("background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:0.931, y2:0, stop:0.265957 rgba(102, 173, 255, 255), stop:0.547872 rgba(55, 111, 186, 255), stop:1 rgba(16, 36, 62, 255));\n"
+"color: rgb(255, 255, 255);\n"
+"border: None;\n"
+"")
+        self.header_6.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.header_6.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.header_6.setObjectName("header_6")
+        self.verticalLayout_19 = QtWidgets.QVBoxLayout(self.header_6)
+        self.verticalLayout_19.setObjectName("verticalLayout_19")
+        self.label_38 = QtWidgets.QLabel(parent=self.header_6)
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        self.label_38.setFont(font)
+        self.label_38.setObjectName("label_38")
+        self.verticalLayout_19.addWidget(self.label_38)
+        self.label_39 = QtWidgets.QLabel(parent=self.header_6)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.label_39.setFont(font)
+        self.label_39.setObjectName("label_39")
+        self.verticalLayout_19.addWidget(self.label_39)
+        self.verticalLayout_27.addWidget(self.header_6)
+        self.gridLayout = QtWidgets.QGridLayout()
+        self.gridLayout.setObjectName("gridLayout")
+        self.label_44 = QtWidgets.QLabel(parent=BranchEditPage)
+        self.label_44.setObjectName("label_44")
+        self.gridLayout.addWidget(self.label_44, 5, 1, 1, 1)
+        spacerItem = QtWidgets.QSpacerItem(40, 25, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.gridLayout.addItem(spacerItem, 0, 0, 1, 1)
+        self.lineEdit_branchContact_2 = QtWidgets.QLineEdit(parent=BranchEditPage)
+        self.lineEdit_branchContact_2.setObjectName("lineEdit_branchContact_2")
+        self.gridLayout.addWidget(self.lineEdit_branchContact_2, 6, 1, 1, 1)
+        spacerItem1 = QtWidgets.QSpacerItem(40, 25, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.gridLayout.addItem(spacerItem1, 0, 2, 1, 1)
+        self.lineEdit_branchAddress_2 = QtWidgets.QLineEdit(parent=BranchEditPage)
+        self.lineEdit_branchAddress_2.setObjectName("lineEdit_branchAddress_2")
+        self.gridLayout.addWidget(self.lineEdit_branchAddress_2, 4, 1, 1, 1)
+        self.label_42 = QtWidgets.QLabel(parent=BranchEditPage)
+        self.label_42.setObjectName("label_42")
+        self.gridLayout.addWidget(self.label_42, 3, 1, 1, 1)
+        self.label_40 = QtWidgets.QLabel(parent=BranchEditPage)
+        self.label_40.setObjectName("label_40")
+        self.gridLayout.addWidget(self.label_40, 0, 1, 1, 1)
+        self.lineEdit_branchName_2 = QtWidgets.QLineEdit(parent=BranchEditPage)
+        self.lineEdit_branchName_2.setObjectName("lineEdit_branchName_2")
+        self.gridLayout.addWidget(self.lineEdit_branchName_2, 1, 1, 1, 1)
+        self.gridLayout_5 = QtWidgets.QGridLayout()
+        self.gridLayout_5.setObjectName("gridLayout_5")
+        self.horizontalLayout_4 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
+        self.lineEdit_branchPass_2 = QtWidgets.QLineEdit(parent=BranchEditPage)
+        self.lineEdit_branchPass_2.setEchoMode(QtWidgets.QLineEdit.EchoMode.Password)
+        self.lineEdit_branchPass_2.setObjectName("lineEdit_branchPass_2")
+        self.horizontalLayout_4.addWidget(self.lineEdit_branchPass_2)
+        self.btn_showpass_3 = QtWidgets.QPushButton(parent=BranchEditPage)
+        self.btn_showpass_3.setText("")
+        self.btn_showpass_3.setObjectName("btn_showpass_3")
+        self.horizontalLayout_4.addWidget(self.btn_showpass_3)
+        self.gridLayout_5.addLayout(self.horizontalLayout_4, 1, 0, 1, 1)
+        self.label_43 = QtWidgets.QLabel(parent=BranchEditPage)
+        self.label_43.setObjectName("label_43")
+        self.gridLayout_5.addWidget(self.label_43, 0, 2, 1, 1)
+        self.horizontalLayout_10 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_10.setObjectName("horizontalLayout_10")
+        self.lineEdit_branchConfPass_2 = QtWidgets.QLineEdit(parent=BranchEditPage)
+        self.lineEdit_branchConfPass_2.setEchoMode(QtWidgets.QLineEdit.EchoMode.Password)
+        self.lineEdit_branchConfPass_2.setObjectName("lineEdit_branchConfPass_2")
+        self.horizontalLayout_10.addWidget(self.lineEdit_branchConfPass_2)
+        self.btn_showpass_4 = QtWidgets.QPushButton(parent=BranchEditPage)
+        self.btn_showpass_4.setText("")
+        self.btn_showpass_4.setObjectName("btn_showpass_4")
+        self.horizontalLayout_10.addWidget(self.btn_showpass_4)
+        self.gridLayout_5.addLayout(self.horizontalLayout_10, 1, 2, 1, 1)
+        self.label_41 = QtWidgets.QLabel(parent=BranchEditPage)
+        self.label_41.setObjectName("label_41")
+        self.gridLayout_5.addWidget(self.label_41, 0, 0, 1, 1)
+        spacerItem2 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.gridLayout_5.addItem(spacerItem2, 1, 1, 1, 1)
+        self.gridLayout.addLayout(self.gridLayout_5, 2, 1, 1, 1)
+        self.verticalLayout_27.addLayout(self.gridLayout)
+        spacerItem3 = QtWidgets.QSpacerItem(20, 10, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Fixed)
+        self.verticalLayout_27.addItem(spacerItem3)
+        self.footer_6 = QtWidgets.QHBoxLayout()
+        self.footer_6.setObjectName("footer_6")
+        spacerItem4 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.footer_6.addItem(spacerItem4)
+        self.cancel_btn_6 = QtWidgets.QPushButton(parent=BranchEditPage)
+        self.cancel_btn_6.setObjectName("cancel_btn_6")
+        self.footer_6.addWidget(self.cancel_btn_6)
+        self.btn_updateBranch = QtWidgets.QPushButton(parent=BranchEditPage)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.btn_updateBranch.setFont(font)
+        self.btn_updateBranch.setStyleSheet("background-color: rgb(0, 0, 0);\n"
+"color: rgb(255, 255, 255);")
+        self.btn_updateBranch.setObjectName("btn_updateBranch")
+        self.footer_6.addWidget(self.btn_updateBranch)
+        spacerItem5 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.footer_6.addItem(spacerItem5)
+        self.verticalLayout_27.addLayout(self.footer_6)
+
+        self.retranslateUi(BranchEditPage)
+        QtCore.QMetaObject.connectSlotsByName(BranchEditPage)
+        BranchEditPage.setTabOrder(self.lineEdit_branchName_2, self.lineEdit_branchPass_2)
+        BranchEditPage.setTabOrder(self.lineEdit_branchPass_2, self.btn_showpass_3)
+        BranchEditPage.setTabOrder(self.btn_showpass_3, self.lineEdit_branchConfPass_2)
+        BranchEditPage.setTabOrder(self.lineEdit_branchConfPass_2, self.btn_showpass_4)
+        BranchEditPage.setTabOrder(self.btn_showpass_4, self.lineEdit_branchAddress_2)
+        BranchEditPage.setTabOrder(self.lineEdit_branchAddress_2, self.lineEdit_branchContact_2)
+        BranchEditPage.setTabOrder(self.lineEdit_branchContact_2, self.cancel_btn_6)
+        BranchEditPage.setTabOrder(self.cancel_btn_6, self.btn_updateBranch)
+
+    def retranslateUi(self, BranchEditPage):
+        _translate = QtCore.QCoreApplication.translate
+        self.label_38.setText(_translate("BranchEditPage", "Edit Branch"))
+        self.label_39.setText(_translate("BranchEditPage", "Update branch information"))
+        self.label_44.setText(_translate("BranchEditPage", "Contact"))
+        self.label_42.setText(_translate("BranchEditPage", "Address"))
+        self.label_40.setText(_translate("BranchEditPage", "Branch Name"))
+        self.label_43.setText(_translate("BranchEditPage", "Confirm Password"))
+        self.label_41.setText(_translate("BranchEditPage", "Password"))
+        self.cancel_btn_6.setText(_translate("BranchEditPage", "Cancel"))
+        self.btn_updateBranch.setText(_translate("BranchEditPage", "Update Branch"))
@@ -0,0 +1,40 @@
+import os
+
+# Writes icons_rc.py, a module holding every image of the icons folder, so
+# the app does not read image files from disk (or depend on the folder it
+# starts from). PyQt6 has no resource compiler, so the bytes go in a dict.
+# Run again after adding or changing an icon:
+#
+#     python build_resources.py
+
+ICON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icons")
+OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icons_rc.py")
+IMAGE_TYPES = (".png", ".jpg", ".svg", ".ico")
+BYTES_PER_LINE = 48
+
+
+def build_resources(icon_dir=ICON_DIR, output=OUTPUT):
+    names = sorted(name for name in os.listdir(icon_dir) if name.lower().endswith(IMAGE_TYPES))
+    lines = [
+        "# Generated by build_resources.py from the icons folder.",
+        "# Do not edit, run python build_resources.py again instead.",
+        "",
+        "ICONS = {",
+    ]
+    for name in names:
+        with open(os.path.join(icon_dir, name), "rb") as image:
+            data = image.read()
+        lines.append(f"    {name!r}: (")
+        for start in range(0, len(data), BYTES_PER_LINE):
+            lines.append(f"        {data[start:start + BYTES_PER_LINE]!r}")
+        lines.append("    ),")
+    lines.append("}")
+
+    with open(output, "w") as module:
+        module.write("\n".join(lines) + "\n")
+    return names
+
+
+if __name__ == "__main__":
+    names = build_resources()
+    print(f"Bundled {len(names)} images into {os.path.basename(OUTPUT)}")
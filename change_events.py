@@ -0,0 +1,103 @@
+import threading
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from database import change_bus, merge_changes
+
+
+class ChangeNotifier(QObject):
+    # This class bring the changes written to one database file into the GUI.
+    # Everything published during one pass of the event loop is merged and
+    # delivered once through changes_ready, so a burst of writes costs one
+    # table update. Writes made on other threads are queued to this one.
+
+    changes_ready = pyqtSignal(object)
+    # Internal: carries published changes over to the thread of this object
+    published = pyqtSignal(object)
+
+    def __init__(self, db_path, parent=None):
+        super().__init__(parent)
+        self.db_path = db_path
+        self.pending = []
+
+        # Zero interval: fires once the event loop is back, after the burst
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(0)
+        self.timer.timeout.connect(self.flush)
+
+        self.published.connect(self.queue_changes)
+        change_bus.subscribe(self.db_path, self.on_publish)
+
+    def on_publish(self, changes, seqs=None):
+        # Called by the bus on the writing thread
+        self.published.emit(list(changes))
+
+    def queue_changes(self, changes):
+        self.pending.extend(changes)
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def flush(self):
+        # Deliver everything collected since the last pass
+        changes = merge_changes(self.pending)
+        self.pending = []
+        if changes:
+            self.changes_ready.emit(changes)
+
+    def close(self):
+        # Stop listening (call before the owner goes away)
+        change_bus.unsubscribe(self.db_path, self.on_publish)
+        self.timer.stop()
+        self.pending = []
+
+
+class DatabaseWatcher(QObject):
+    # This class notice writes made to a branch file by other StayBook
+    # windows or PCs. It polls the SQLite data version (cheap, no table read)
+    # and only when it moved reads the rows logged since the last look, then
+    # publishes them on the change bus like a local write.
+
+    POLL_MS = 500
+
+    def __init__(self, db, parent=None, poll_ms=None):
+        super().__init__(parent)
+        self.db = db
+        self.version = db.data_version()
+        # Everything up to here is already shown
+        self.seq = db.last_change_seq()
+        # Local writes may be published from the database thread
+        self.lock = threading.Lock()
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(poll_ms or self.POLL_MS)
+        self.timer.timeout.connect(self.poll)
+        self.timer.start()
+        change_bus.subscribe(self.db.db_path, self.on_local_write)
+
+    def poll(self):
+        version = self.db.data_version()
+        if version == self.version:
+            return
+        self.version = version
+        with self.lock:
+            after_seq = self.seq
+        last_seq, changes = self.db.changes_since(after_seq)
+        with self.lock:
+            self.seq = max(self.seq, last_seq)
+        self.db.publish(changes)
+
+    def on_local_write(self, changes, seqs):
+        # Writes made by this application (on any thread) are already shown,
+        # so skip their log entries. If someone else wrote between the last
+        # poll and this write, leave them for the next poll (it reports ours
+        # again too, applying a row twice is harmless). Changes relayed by
+        # poll have no seqs.
+        if seqs is None:
+            return
+        first_seq, last_seq = seqs
+        with self.lock:
+            if first_seq <= self.seq:
+                self.seq = max(self.seq, last_seq)
+
+    def stop(self):
+        self.timer.stop()
+        change_bus.unsubscribe(self.db.db_path, self.on_local_write)
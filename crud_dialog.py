@@ -1,6 +1,6 @@
 # Form implementation generated from reading ui file 'crud_dialog.ui'
 #
-# Created by: PyQt6 UI code generator 6.10.0
+# Created by: PyQt6 UI code generator 6.11.0
 #
 # WARNING: Any manual changes made to this file will be lost when pyuic6 is
 # run again.  Do not edit this file unless you know what you are doing.
@@ -27,867 +27,11 @@ class Ui_Dialog(object):
         font.setPointSize(11)
         self.stackedWidget.setFont(font)
         self.stackedWidget.setObjectName("stackedWidget")
-        self.roomedit_page = QtWidgets.QWidget()
-        self.roomedit_page.setObjectName("roomedit_page")
-        self.verticalLayout_6 = QtWidgets.QVBoxLayout(self.roomedit_page)
-        self.verticalLayout_6.setObjectName("verticalLayout_6")
-        self.header = QtWidgets.QFrame(parent=self.roomedit_page)
-        self.header.setStyleSheet("background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:0.931, y2:0, stop:0.265957 rgba(102, 173, 255, 255), stop:0.547872 rgba(55, 111, 186, 255), stop:1 rgba(16, 36, 62, 255));\n"
-"color: rgb(255, 255, 255);\n"
-"border: None;\n"
-"")
-        self.header.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
-        self.header.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
-        self.header.setObjectName("header")
-        self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.header)
-        self.verticalLayout_3.setObjectName("verticalLayout_3")
-        self.label = QtWidgets.QLabel(parent=self.header)
-        font = QtGui.QFont()
-        font.setPointSize(14)
-        self.label.setFont(font)
-        self.label.setObjectName("label")
-        self.verticalLayout_3.addWidget(self.label)
-        self.label_2 = QtWidgets.QLabel(parent=self.header)
-        font = QtGui.QFont()
-        font.setPointSize(11)
-        self.label_2.setFont(font)
-        self.label_2.setObjectName("label_2")
-        self.verticalLayout_3.addWidget(self.label_2)
-        self.verticalLayout_6.addWidget(self.header)
-        self.line = QtWidgets.QFrame(parent=self.roomedit_page)
-        self.line.setFrameShape(QtWidgets.QFrame.Shape.HLine)
-        self.line.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
-        self.line.setObjectName("line")
-        self.verticalLayout_6.addWidget(self.line)
-        self.body = QtWidgets.QHBoxLayout()
-        self.body.setObjectName("body")
-        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.body.addItem(spacerItem)
-        self.verticalLayout_2 = QtWidgets.QVBoxLayout()
-        self.verticalLayout_2.setObjectName("verticalLayout_2")
-        self.horizontalLayout = QtWidgets.QHBoxLayout()
-        self.horizontalLayout.setObjectName("horizontalLayout")
-        self.formLayout = QtWidgets.QFormLayout()
-        self.formLayout.setObjectName("formLayout")
-        self.label_4 = QtWidgets.QLabel(parent=self.roomedit_page)
-        font = QtGui.QFont()
-        font.setPointSize(11)
-        self.label_4.setFont(font)
-        self.label_4.setObjectName("label_4")
-        self.formLayout.setWidget(1, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_4)
-        self.roomtype_edit = QtWidgets.QComboBox(parent=self.roomedit_page)
-        font = QtGui.QFont()
-        font.setPointSize(11)
-        self.roomtype_edit.setFont(font)
-        self.roomtype_edit.setObjectName("roomtype_edit")
-        self.roomtype_edit.addItem("")
-        self.roomtype_edit.addItem("")
-        self.roomtype_edit.addItem("")
-        self.roomtype_edit.addItem("")
-        self.roomtype_edit.addItem("")
-        self.formLayout.setWidget(1, QtWidgets.QFormLayout.ItemRole.FieldRole, self.roomtype_edit)
-        self.label_7 = QtWidgets.QLabel(parent=self.roomedit_page)
-        font = QtGui.QFont()
-        font.setPointSize(11)
-        self.label_7.setFont(font)
-        self.label_7.setObjectName("label_7")
-        self.formLayout.setWidget(0, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_7)
-        self.status_edit = QtWidgets.QComboBox(parent=self.roomedit_page)
-        font = QtGui.QFont()
-        font.setPointSize(11)
-        self.status_edit.setFont(font)
-        self.status_edit.setObjectName("status_edit")
-        self.status_edit.addItem("")
-        self.status_edit.addItem("")
-        self.formLayout.setWidget(0, QtWidgets.QFormLayout.ItemRole.FieldRole, self.status_edit)
-        self.horizontalLayout.addLayout(self.formLayout)
-        self.formLayout_3 = QtWidgets.QFormLayout()
-        self.formLayout_3.setObjectName("formLayout_3")
-        self.price_edit = QtWidgets.QLineEdit(parent=self.roomedit_page)
-        font = QtGui.QFont()
-        font.setPointSize(11)
-        self.price_edit.setFont(font)
-        self.price_edit.setObjectName("price_edit")
-        self.formLayout_3.setWidget(0, QtWidgets.QFormLayout.ItemRole.FieldRole, self.price_edit)
-        self.label_6 = QtWidgets.QLabel(parent=self.roomedit_page)
-        font = QtGui.QFont()
-        font.setPointSize(11)
-        self.label_6.setFont(font)
-        self.label_6.setObjectName("label_6")
-        self.formLayout_3.setWidget(1, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_6)
-        self.capacity_edit = QtWidgets.QLineEdit(parent=self.roomedit_page)
-        font = QtGui.QFont()
-        font.setPointSize(11)
-        self.capacity_edit.setFont(font)
-        self.capacity_edit.setObjectName("capacity_edit")
-        self.formLayout_3.setWidget(1, QtWidgets.QFormLayout.ItemRole.FieldRole, self.capacity_edit)
-        self.label_5 = QtWidgets.QLabel(parent=self.roomedit_page)
-        font = QtGui.QFont()
-        font.setPointSize(11)
-        self.label_5.setFont(font)
-        self.label_5.setObjectName("label_5")
-        self.formLayout_3.setWidget(0, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_5)
-        self.horizontalLayout.addLayout(self.formLayout_3)
-        self.verticalLayout_2.addLayout(self.horizontalLayout)
-        self.label_8 = QtWidgets.QLabel(parent=self.roomedit_page)
-        font = QtGui.QFont()
-        font.setPointSize(11)
-        self.label_8.setFont(font)
-        self.label_8.setObjectName("label_8")
-        self.verticalLayout_2.addWidget(self.label_8)
-        self.description_edit = QtWidgets.QTextEdit(parent=self.roomedit_page)
-        font = QtGui.QFont()
-        font.setPointSize(11)
-        self.description_edit.setFont(font)
-        self.description_edit.setObjectName("description_edit")
-        self.verticalLayout_2.addWidget(self.description_edit)
-        self.body.addLayout(self.verticalLayout_2)
-        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.body.addItem(spacerItem1)
-        self.verticalLayout_6.addLayout(self.body)
-        self.footer = QtWidgets.QHBoxLayout()
-        self.footer.setObjectName("footer")
-        spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.footer.addItem(spacerItem2)
-        self.cancel_btn = QtWidgets.QPushButton(parent=self.roomedit_page)
-        self.cancel_btn.setObjectName("cancel_btn")
-        self.footer.addWidget(self.cancel_btn)
-        self.updateroom_btn = QtWidgets.QPushButton(parent=self.roomedit_page)
-        font = QtGui.QFont()
-        font.setPointSize(11)
-        self.updateroom_btn.setFont(font)
-        self.updateroom_btn.setStyleSheet("background-color: rgb(0, 0, 0);\n"
-"color: rgb(255, 255, 255);")
-        self.updateroom_btn.setObjectName("updateroom_btn")
-        self.footer.addWidget(self.updateroom_btn)
-        spacerItem3 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.footer.addItem(spacerItem3)
-        self.verticalLayout_6.addLayout(self.footer)
-        self.stackedWidget.addWidget(self.roomedit_page)
-        self.roomadd_page = QtWidgets.QWidget()
-        self.roomadd_page.setObjectName("roomadd_page")
-        self.verticalLayout = QtWidgets.QVBoxLayout(self.roomadd_page)
-        self.verticalLayout.setObjectName("verticalLayout")
-        self.header_2 = QtWidgets.QFrame(parent=self.roomadd_page)
-        self.header_2.setStyleSheet("background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:0.931, y2:0, stop:0.265957 rgba(102, 173, 255, 255), stop:0.547872 rgba(55, 111, 186, 255), stop:1 rgba(16, 36, 62, 255));\n"
-"color: rgb(255, 255, 255);\n"
-"border: None;\n"
-"")
-        self.header_2.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
-        self.header_2.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
-        self.header_2.setObjectName("header_2")
-        self.verticalLayout_4 = QtWidgets.QVBoxLayout(self.header_2)
-        self.verticalLayout_4.setObjectName("verticalLayout_4")
-        self.label_9 = QtWidgets.QLabel(parent=self.header_2)
-        font = QtGui.QFont()
-        font.setPointSize(14)
-        self.label_9.setFont(font)
-        self.label_9.setObjectName("label_9")
-        self.verticalLayout_4.addWidget(self.label_9)
-        self.label_10 = QtWidgets.QLabel(parent=self.header_2)
-        font = QtGui.QFont()
-        font.setPointSize(11)
-        self.label_10.setFont(font)
-        self.label_10.setObjectName("label_10")
-        self.verticalLayout_4.addWidget(self.label_10)
-        self.verticalLayout.addWidget(self.header_2)
-        self.line_2 = QtWidgets.QFrame(parent=self.roomadd_page)
-        self.line_2.setFrameShape(QtWidgets.QFrame.Shape.HLine)
-        self.line_2.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
-        self.line_2.setObjectName("line_2")
-        self.verticalLayout.addWidget(self.line_2)
-        self.body_2 = QtWidgets.QHBoxLayout()
-        self.body_2.setObjectName("body_2")
-        spacerItem4 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.body_2.addItem(spacerItem4)
-        self.verticalLayout_5 = QtWidgets.QVBoxLayout()
-        self.verticalLayout_5.setObjectName("verticalLayout_5")
-        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
-        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
-        self.formLayout_4 = QtWidgets.QFormLayout()
-        self.formLayout_4.setObjectName("formLayout_4")
-        self.label_11 = QtWidgets.QLabel(parent=self.roomadd_page)
-        font = QtGui.QFont()
-        font.setPointSize(11)
-        self.label_11.setFont(font)
-        self.label_11.setObjectName("label_11")
-        self.formLayout_4.setWidget(0, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_11)
-        self.label_12 = QtWidgets.QLabel(parent=self.roomadd_page)
-        font = QtGui.QFont()
-        font.setPointSize(11)
-        self.label_12.setFont(font)
-        self.label_12.setObjectName("label_12")
-        self.formLayout_4.setWidget(1, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_12)
-        self.roomtype_add = QtWidgets.QComboBox(parent=self.roomadd_page)
-        font = QtGui.QFont()
-        font.setPointSize(11)
-        self.roomtype_add.setFont(font)
-        self.roomtype_add.setObjectName("roomtype_add")
-        self.roomtype_add.addItem("")
-        self.roomtype_add.addItem("")
-        self.roomtype_add.addItem("")
-        self.roomtype_add.addItem("")
-        self.roomtype_add.addItem("")
-        self.formLayout_4.setWidget(1, QtWidgets.QFormLayout.ItemRole.FieldRole, self.roomtype_add)
-        self.status_add = QtWidgets.QComboBox(parent=self.roomadd_page)
-        font = QtGui.QFont()
-        font.setPointSize(11)
-        self.status_add.setFont(font)
-        self.status_add.setObjectName("status_add")
-        self.status_add.addItem("")
-        self.status_add.addItem("")
-        self.formLayout_4.setWidget(0, QtWidgets.QFormLayout.ItemRole.FieldRole, self.status_add)
-        self.horizontalLayout_3.addLayout(self.formLayout_4)
-        self.formLayout_5 = QtWidgets.QFormLayout()
-        self.formLayout_5.setObjectName("formLayout_5")
-        self.price_add = QtWidgets.QLineEdit(parent=self.roomadd_page)
-        font = QtGui.QFont()
-        font.setPointSize(11)
-        self.price_add.setFont(font)
-        self.price_add.setObjectName("price_add")
-        self.formLayout_5.setWidget(0, QtWidgets.QFormLayout.ItemRole.FieldRole, self.price_add)
-        self.label_13 = QtWidgets.QLabel(parent=self.roomadd_page)
-        font = QtGui.QFont()
-        font.setPointSize(11)
-        self.label_13.setFont(font)
-        self.label_13.setObjectName("label_13")
-        self.formLayout_5.setWidget(1, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_13)
-        self.capacity_add = QtWidgets.QLineEdit(parent=self.roomadd_page)
-        font = QtGui.QFont()
-        font.setPointSize(11)
-        self.capacity_add.setFont(font)
-        self.capacity_add.setObjectName("capacity_add")
-        self.formLayout_5.setWidget(1, QtWidgets.QFormLayout.ItemRole.FieldRole, self.capacity_add)
-        self.label_14 = QtWidgets.QLabel(parent=self.roomadd_page)
-        font = QtGui.QFont()
-        font.setPointSize(11)
-        self.label_14.setFont(font)
-        self.label_14.setObjectName("label_14")
-        self.formLayout_5.setWidget(0, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_14)
-        self.horizontalLayout_3.addLayout(self.formLayout_5)
-        self.verticalLayout_5.addLayout(self.horizontalLayout_3)
-        self.label_16 = QtWidgets.QLabel(parent=self.roomadd_page)
-        font = QtGui.QFont()
-        font.setPointSize(11)
-        self.label_16.setFont(font)
-        self.label_16.setObjectName("label_16")
-        self.verticalLayout_5.addWidget(self.label_16)
-        self.description_add = QtWidgets.QTextEdit(parent=self.roomadd_page)
-        font = QtGui.QFont()
-        font.setPointSize(11)
-        self.description_add.setFont(font)
-        self.description_add.setObjectName("description_add")
-        self.verticalLayout_5.addWidget(self.description_add)
-        self.body_2.addLayout(self.verticalLayout_5)
-        spacerItem5 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.body_2.addItem(spacerItem5)
-        self.verticalLayout.addLayout(self.body_2)
-        self.footer_2 = QtWidgets.QHBoxLayout()
-        self.footer_2.setObjectName("footer_2")
-        spacerItem6 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.footer_2.addItem(spacerItem6)
-        self.cancel_btn_2 = QtWidgets.QPushButton(parent=self.roomadd_page)
-        self.cancel_btn_2.setObjectName("cancel_btn_2")
-        self.footer_2.addWidget(self.cancel_btn_2)
-        self.addroom_btn = QtWidgets.QPushButton(parent=self.roomadd_page)
-        font = QtGui.QFont()
-        font.setPointSize(11)
-        self.addroom_btn.setFont(font)
-        self.addroom_btn.setStyleSheet("background-color: rgb(0, 0, 0);\n"
-"color: rgb(255, 255, 255);")
-        self.addroom_btn.setObjectName("addroom_btn")
-        self.footer_2.addWidget(self.addroom_btn)
-        spacerItem7 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.footer_2.addItem(spacerItem7)
-        self.verticalLayout.addLayout(self.footer_2)
-        self.stackedWidget.addWidget(self.roomadd_page)
-        self.reserveadd_page = QtWidgets.QWidget()
-        self.reserveadd_page.setObjectName("reserveadd_page")
-        self.verticalLayout_9 = QtWidgets.QVBoxLayout(self.reserveadd_page)
-        self.verticalLayout_9.setObjectName("verticalLayout_9")
-        self.header_3 = QtWidgets.QFrame(parent=self.reserveadd_page)
-        self.header_3.setStyleSheet("background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:0.931, y2:0, stop:0.265957 rgba(102, 173, 255, 255), stop:0.547872 rgba(55, 111, 186, 255), stop:1 rgba(16, 36, 62, 255));\n"
-"color: rgb(255, 255, 255);\n"
-"border: None;\n"
-"")
-        self.header_3.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
-        self.header_3.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
-        self.header_3.setObjectName("header_3")
-        self.verticalLayout_7 = QtWidgets.QVBoxLayout(self.header_3)
-        self.verticalLayout_7.setObjectName("verticalLayout_7")
-        self.label_15 = QtWidgets.QLabel(parent=self.header_3)
-        font = QtGui.QFont()
-        font.setPointSize(14)
-        self.label_15.setFont(font)
-        self.label_15.setObjectName("label_15")
-        self.verticalLayout_7.addWidget(self.label_15)
-        self.label_17 = QtWidgets.QLabel(parent=self.header_3)
-        font = QtGui.QFont()
-        font.setPointSize(11)
-        self.label_17.setFont(font)
-        self.label_17.setObjectName("label_17")
-        self.verticalLayout_7.addWidget(self.label_17)
-        self.verticalLayout_9.addWidget(self.header_3)
-        self.line_3 = QtWidgets.QFrame(parent=self.reserveadd_page)
-        self.line_3.setFrameShape(QtWidgets.QFrame.Shape.HLine)
-        self.line_3.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
-        self.line_3.setObjectName("line_3")
-        self.verticalLayout_9.addWidget(self.line_3)
-        self.body_3 = QtWidgets.QHBoxLayout()
-        self.body_3.setObjectName("body_3")
-        spacerItem8 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.body_3.addItem(spacerItem8)
-        self.verticalLayout_8 = QtWidgets.QVBoxLayout()
-        self.verticalLayout_8.setObjectName("verticalLayout_8")
-        self.label_3 = QtWidgets.QLabel(parent=self.reserveadd_page)
-        self.label_3.setObjectName("label_3")
-        self.verticalLayout_8.addWidget(self.label_3)
-        self.name_add = QtWidgets.QLineEdit(parent=self.reserveadd_page)
-        self.name_add.setObjectName("name_add")
-        self.verticalLayout_8.addWidget(self.name_add)
-        self.label_18 = QtWidgets.QLabel(parent=self.reserveadd_page)
-        self.label_18.setObjectName("label_18")
-        self.verticalLayout_8.addWidget(self.label_18)
-        self.contact_add = QtWidgets.QLineEdit(parent=self.reserveadd_page)
-        self.contact_add.setObjectName("contact_add")
-        self.verticalLayout_8.addWidget(self.contact_add)
-        self.horizontalLayout_5 = QtWidgets.QHBoxLayout()
-        self.horizontalLayout_5.setObjectName("horizontalLayout_5")
-        self.verticalLayout_10 = QtWidgets.QVBoxLayout()
-        self.verticalLayout_10.setObjectName("verticalLayout_10")
-        self.label_19 = QtWidgets.QLabel(parent=self.reserveadd_page)
-        self.label_19.setObjectName("label_19")
-        self.verticalLayout_10.addWidget(self.label_19)
-        self.roomnum_add = QtWidgets.QComboBox(parent=self.reserveadd_page)
-        self.roomnum_add.setObjectName("roomnum_add")
-        self.verticalLayout_10.addWidget(self.roomnum_add)
-        self.label_21 = QtWidgets.QLabel(parent=self.reserveadd_page)
-        self.label_21.setObjectName("label_21")
-        self.verticalLayout_10.addWidget(self.label_21)
-        self.checkindate_add = QtWidgets.QDateEdit(parent=self.reserveadd_page)
-        self.checkindate_add.setObjectName("checkindate_add")
-        self.verticalLayout_10.addWidget(self.checkindate_add)
-        self.horizontalLayout_5.addLayout(self.verticalLayout_10)
-        self.verticalLayout_11 = QtWidgets.QVBoxLayout()
-        self.verticalLayout_11.setObjectName("verticalLayout_11")
-        self.label_20 = QtWidgets.QLabel(parent=self.reserveadd_page)
-        self.label_20.setObjectName("label_20")
-        self.verticalLayout_11.addWidget(self.label_20)
-        self.payment_add = QtWidgets.QComboBox(parent=self.reserveadd_page)
-        self.payment_add.setObjectName("payment_add")
-        self.payment_add.addItem("")
-        self.payment_add.addItem("")
-        self.payment_add.addItem("")
-        self.verticalLayout_11.addWidget(self.payment_add)
-        self.label_22 = QtWidgets.QLabel(parent=self.reserveadd_page)
-        self.label_22.setObjectName("label_22")
-        self.verticalLayout_11.addWidget(self.label_22)
-        self.checkoutdate_add = QtWidgets.QDateEdit(parent=self.reserveadd_page)
-        self.checkoutdate_add.setObjectName("checkoutdate_add")
-        self.verticalLayout_11.addWidget(self.checkoutdate_add)
-        self.horizontalLayout_5.addLayout(self.verticalLayout_11)
-        self.verticalLayout_8.addLayout(self.horizontalLayout_5)
-        self.body_3.addLayout(self.verticalLayout_8)
-        spacerItem9 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.body_3.addItem(spacerItem9)
-        self.verticalLayout_9.addLayout(self.body_3)
-        self.footer_3 = QtWidgets.QHBoxLayout()
-        self.footer_3.setObjectName("footer_3")
-        spacerItem10 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.footer_3.addItem(spacerItem10)
-        self.cancel_btn_3 = QtWidgets.QPushButton(parent=self.reserveadd_page)
-        self.cancel_btn_3.setObjectName("cancel_btn_3")
-        self.footer_3.addWidget(self.cancel_btn_3)
-        self.addreserve_btn = QtWidgets.QPushButton(parent=self.reserveadd_page)
-        font = QtGui.QFont()
-        font.setPointSize(11)
-        self.addreserve_btn.setFont(font)
-        self.addreserve_btn.setStyleSheet("background-color: rgb(0, 0, 0);\n"
-"color: rgb(255, 255, 255);")
-        self.addreserve_btn.setObjectName("addreserve_btn")
-        self.footer_3.addWidget(self.addreserve_btn)
-        spacerItem11 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.footer_3.addItem(spacerItem11)
-        self.verticalLayout_9.addLayout(self.footer_3)
-        self.stackedWidget.addWidget(self.reserveadd_page)
-        self.page = QtWidgets.QWidget()
-        self.page.setObjectName("page")
-        self.verticalLayout_16 = QtWidgets.QVBoxLayout(self.page)
-        self.verticalLayout_16.setObjectName("verticalLayout_16")
-        self.header_4 = QtWidgets.QFrame(parent=self.page)
-        self.header_4.setStyleSheet("background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:0.931, y2:0, stop:0.265957 rgba(102, 173, 255, 255), stop:0.547872 rgba(55, 111, 186, 255), stop:1 rgba(16, 36, 62, 255));\n"
-"color: rgb(255, 255, 255);\n"
-"border: None;\n"
-"")
-        self.header_4.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
-        self.header_4.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
-        self.header_4.setObjectName("header_4")
-        self.verticalLayout_12 = QtWidgets.QVBoxLayout(self.header_4)
-        self.verticalLayout_12.setObjectName("verticalLayout_12")
-        self.label_23 = QtWidgets.QLabel(parent=self.header_4)
-        font = QtGui.QFont()
-        font.setPointSize(14)
-        self.label_23.setFont(font)
-        self.label_23.setObjectName("label_23")
-        self.verticalLayout_12.addWidget(self.label_23)
-        self.label_24 = QtWidgets.QLabel(parent=self.header_4)
-        font = QtGui.QFont()
-        font.setPointSize(11)
-        self.label_24.setFont(font)
-        self.label_24.setObjectName("label_24")
-        self.verticalLayout_12.addWidget(self.label_24)
-        self.verticalLayout_16.addWidget(self.header_4)
-        self.line_4 = QtWidgets.QFrame(parent=self.page)
-        self.line_4.setFrameShape(QtWidgets.QFrame.Shape.HLine)
-        self.line_4.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
-        self.line_4.setObjectName("line_4")
-        self.verticalLayout_16.addWidget(self.line_4)
-        self.body_4 = QtWidgets.QHBoxLayout()
-        self.body_4.setObjectName("body_4")
-        spacerItem12 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.body_4.addItem(spacerItem12)
-        self.verticalLayout_13 = QtWidgets.QVBoxLayout()
-        self.verticalLayout_13.setObjectName("verticalLayout_13")
-        self.label_25 = QtWidgets.QLabel(parent=self.page)
-        self.label_25.setObjectName("label_25")
-        self.verticalLayout_13.addWidget(self.label_25)
-        self.name_edit = QtWidgets.QLineEdit(parent=self.page)
-        self.name_edit.setObjectName("name_edit")
-        self.verticalLayout_13.addWidget(self.name_edit)
-        self.label_26 = QtWidgets.QLabel(parent=self.page)
-        self.label_26.setObjectName("label_26")
-        self.verticalLayout_13.addWidget(self.label_26)
-        self.contact_edit = QtWidgets.QLineEdit(parent=self.page)
-        self.contact_edit.setObjectName("contact_edit")
-        self.verticalLayout_13.addWidget(self.contact_edit)
-        self.horizontalLayout_6 = QtWidgets.QHBoxLayout()
-        self.horizontalLayout_6.setObjectName("horizontalLayout_6")
-        self.verticalLayout_14 = QtWidgets.QVBoxLayout()
-        self.verticalLayout_14.setObjectName("verticalLayout_14")
-        self.label_27 = QtWidgets.QLabel(parent=self.page)
-        self.label_27.setObjectName("label_27")
-        self.verticalLayout_14.addWidget(self.label_27)
-        self.roomnum_edit = QtWidgets.QComboBox(parent=self.page)
-        self.roomnum_edit.setObjectName("roomnum_edit")
-        self.verticalLayout_14.addWidget(self.roomnum_edit)
-        self.label_28 = QtWidgets.QLabel(parent=self.page)
-        self.label_28.setObjectName("label_28")
-        self.verticalLayout_14.addWidget(self.label_28)
-        self.checkindate_edit = QtWidgets.QDateEdit(parent=self.page)
-        self.checkindate_edit.setObjectName("checkindate_edit")
-        self.verticalLayout_14.addWidget(self.checkindate_edit)
-        self.horizontalLayout_6.addLayout(self.verticalLayout_14)
-        self.verticalLayout_15 = QtWidgets.QVBoxLayout()
-        self.verticalLayout_15.setObjectName("verticalLayout_15")
-        self.label_29 = QtWidgets.QLabel(parent=self.page)
-        self.label_29.setObjectName("label_29")
-        self.verticalLayout_15.addWidget(self.label_29)
-        self.payment_edit = QtWidgets.QComboBox(parent=self.page)
-        self.payment_edit.setObjectName("payment_edit")
-        self.payment_edit.addItem("")
-        self.payment_edit.addItem("")
-        self.payment_edit.addItem("")
-        self.verticalLayout_15.addWidget(self.payment_edit)
-        self.label_30 = QtWidgets.QLabel(parent=self.page)
-        self.label_30.setObjectName("label_30")
-        self.verticalLayout_15.addWidget(self.label_30)
-        self.checkoutdate_edit = QtWidgets.QDateEdit(parent=self.page)
-        self.checkoutdate_edit.setObjectName("checkoutdate_edit")
-        self.verticalLayout_15.addWidget(self.checkoutdate_edit)
-        self.horizontalLayout_6.addLayout(self.verticalLayout_15)
-        self.verticalLayout_13.addLayout(self.horizontalLayout_6)
-        self.body_4.addLayout(self.verticalLayout_13)
-        spacerItem13 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.body_4.addItem(spacerItem13)
-        self.verticalLayout_16.addLayout(self.body_4)
-        self.footer_4 = QtWidgets.QHBoxLayout()
-        self.footer_4.setObjectName("footer_4")
-        spacerItem14 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.footer_4.addItem(spacerItem14)
-        self.cancel_btn_4 = QtWidgets.QPushButton(parent=self.page)
-        self.cancel_btn_4.setObjectName("cancel_btn_4")
-        self.footer_4.addWidget(self.cancel_btn_4)
-        self.addreserve_btn_2 = QtWidgets.QPushButton(parent=self.page)
-        font = QtGui.QFont()
-        font.setPointSize(11)
-        self.addreserve_btn_2.setFont(font)
-        self.addreserve_btn_2.setStyleSheet("background-color: rgb(0, 0, 0);\n"
-"color: rgb(255, 255, 255);")
-        self.addreserve_btn_2.setObjectName("addreserve_btn_2")
-        self.footer_4.addWidget(self.addreserve_btn_2)
-        spacerItem15 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.footer_4.addItem(spacerItem15)
-        self.verticalLayout_16.addLayout(self.footer_4)
-        self.stackedWidget.addWidget(self.page)
-        self.branchadd_page = QtWidgets.QWidget()
-        self.branchadd_page.setObjectName("branchadd_page")
-        self.verticalLayout_18 = QtWidgets.QVBoxLayout(self.branchadd_page)
-        self.verticalLayout_18.setObjectName("verticalLayout_18")
-        self.header_5 = QtWidgets.QFrame(parent=self.branchadd_page)
-        self.header_5.setStyleSheet("background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:0.931, y2:0, stop:0.265957 rgba(102, 173, 255, 255), stop:0.547872 rgba(55, 111, 186, 255), stop:1 rgba(16, 36, 62, 255));\n"
-"color: rgb(255, 255, 255);\n"
-"border: None;\n"
-"")
-        self.header_5.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
-        self.header_5.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
-        self.header_5.setObjectName("header_5")
-        self.verticalLayout_17 = QtWidgets.QVBoxLayout(self.header_5)
-        self.verticalLayout_17.setObjectName("verticalLayout_17")
-        self.label_31 = QtWidgets.QLabel(parent=self.header_5)
-        font = QtGui.QFont()
-        font.setPointSize(14)
-        self.label_31.setFont(font)
-        self.label_31.setObjectName("label_31")
-        self.verticalLayout_17.addWidget(self.label_31)
-        self.label_32 = QtWidgets.QLabel(parent=self.header_5)
-        font = QtGui.QFont()
-        font.setPointSize(11)
-        self.label_32.setFont(font)
-        self.label_32.setObjectName("label_32")
-        self.verticalLayout_17.addWidget(self.label_32)
-        self.verticalLayout_18.addWidget(self.header_5)
-        self.gridLayout_2 = QtWidgets.QGridLayout()
-        self.gridLayout_2.setObjectName("gridLayout_2")
-        self.label_37 = QtWidgets.QLabel(parent=self.branchadd_page)
-        self.label_37.setObjectName("label_37")
-        self.gridLayout_2.addWidget(self.label_37, 5, 1, 1, 1)
-        self.lineEdit_branchContact = QtWidgets.QLineEdit(parent=self.branchadd_page)
-        self.lineEdit_branchContact.setObjectName("lineEdit_branchContact")
-        self.gridLayout_2.addWidget(self.lineEdit_branchContact, 6, 1, 1, 1)
-        spacerItem16 = QtWidgets.QSpacerItem(40, 25, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.gridLayout_2.addItem(spacerItem16, 0, 2, 1, 1)
-        self.lineEdit_branchAddress = QtWidgets.QLineEdit(parent=self.branchadd_page)
-        self.lineEdit_branchAddress.setObjectName("lineEdit_branchAddress")
-        self.gridLayout_2.addWidget(self.lineEdit_branchAddress, 4, 1, 1, 1)
-        self.label_33 = QtWidgets.QLabel(parent=self.branchadd_page)
-        self.label_33.setMinimumSize(QtCore.QSize(0, 18))
-        self.label_33.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeading|QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignVCenter)
-        self.label_33.setObjectName("label_33")
-        self.gridLayout_2.addWidget(self.label_33, 0, 1, 1, 1)
-        self.label_36 = QtWidgets.QLabel(parent=self.branchadd_page)
-        self.label_36.setObjectName("label_36")
-        self.gridLayout_2.addWidget(self.label_36, 3, 1, 1, 1)
-        self.lineEdit_branchName = QtWidgets.QLineEdit(parent=self.branchadd_page)
-        self.lineEdit_branchName.setObjectName("lineEdit_branchName")
-        self.gridLayout_2.addWidget(self.lineEdit_branchName, 1, 1, 1, 1)
-        spacerItem17 = QtWidgets.QSpacerItem(37, 25, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.gridLayout_2.addItem(spacerItem17, 0, 0, 1, 1)
-        self.gridLayout_4 = QtWidgets.QGridLayout()
-        self.gridLayout_4.setObjectName("gridLayout_4")
-        self.label_45 = QtWidgets.QLabel(parent=self.branchadd_page)
-        self.label_45.setObjectName("label_45")
-        self.gridLayout_4.addWidget(self.label_45, 0, 2, 1, 1)
-        self.horizontalLayout_9 = QtWidgets.QHBoxLayout()
-        self.horizontalLayout_9.setObjectName("horizontalLayout_9")
-        self.lineEdit_branchPass_3 = QtWidgets.QLineEdit(parent=self.branchadd_page)
-        self.lineEdit_branchPass_3.setMinimumSize(QtCore.QSize(0, 26))
-        self.lineEdit_branchPass_3.setEchoMode(QtWidgets.QLineEdit.EchoMode.Password)
-        self.lineEdit_branchPass_3.setObjectName("lineEdit_branchPass_3")
-        self.horizontalLayout_9.addWidget(self.lineEdit_branchPass_3)
-        self.btn_showpass = QtWidgets.QPushButton(parent=self.branchadd_page)
-        self.btn_showpass.setStyleSheet("")
-        self.btn_showpass.setText("")
-        icon = QtGui.QIcon()
-        icon.addPixmap(QtGui.QPixmap("../85fe6ff2/showpassword16.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
-        self.btn_showpass.setIcon(icon)
-        self.btn_showpass.setObjectName("btn_showpass")
-        self.horizontalLayout_9.addWidget(self.btn_showpass)
-        self.gridLayout_4.addLayout(self.horizontalLayout_9, 1, 0, 1, 1)
-        self.horizontalLayout_8 = QtWidgets.QHBoxLayout()
-        self.horizontalLayout_8.setObjectName("horizontalLayout_8")
-        self.lineEdit_branchConfPass_3 = QtWidgets.QLineEdit(parent=self.branchadd_page)
-        self.lineEdit_branchConfPass_3.setMinimumSize(QtCore.QSize(0, 26))
-        self.lineEdit_branchConfPass_3.setEchoMode(QtWidgets.QLineEdit.EchoMode.Password)
-        self.lineEdit_branchConfPass_3.setObjectName("lineEdit_branchConfPass_3")
-        self.horizontalLayout_8.addWidget(self.lineEdit_branchConfPass_3)
-        self.btn_showpass_2 = QtWidgets.QPushButton(parent=self.branchadd_page)
-        self.btn_showpass_2.setStyleSheet("")
-        self.btn_showpass_2.setText("")
-        self.btn_showpass_2.setIcon(icon)
-        self.btn_showpass_2.setObjectName("btn_showpass_2")
-        self.horizontalLayout_8.addWidget(self.btn_showpass_2)
-        self.gridLayout_4.addLayout(self.horizontalLayout_8, 1, 2, 1, 1)
-        self.label_46 = QtWidgets.QLabel(parent=self.branchadd_page)
-        self.label_46.setObjectName("label_46")
-        self.gridLayout_4.addWidget(self.label_46, 0, 0, 1, 1)
-        spacerItem18 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.gridLayout_4.addItem(spacerItem18, 1, 1, 1, 1)
-        self.gridLayout_2.addLayout(self.gridLayout_4, 2, 1, 1, 1)
-        self.verticalLayout_18.addLayout(self.gridLayout_2)
-        spacerItem19 = QtWidgets.QSpacerItem(20, 10, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Fixed)
-        self.verticalLayout_18.addItem(spacerItem19)
-        self.footer_5 = QtWidgets.QHBoxLayout()
-        self.footer_5.setObjectName("footer_5")
-        spacerItem20 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.footer_5.addItem(spacerItem20)
-        self.cancel_btn_5 = QtWidgets.QPushButton(parent=self.branchadd_page)
-        self.cancel_btn_5.setObjectName("cancel_btn_5")
-        self.footer_5.addWidget(self.cancel_btn_5)
-        self.btn_addBranch = QtWidgets.QPushButton(parent=self.branchadd_page)
-        font = QtGui.QFont()
-        font.setPointSize(11)
-        self.btn_addBranch.setFont(font)
-        self.btn_addBranch.setStyleSheet("background-color: rgb(0, 0, 0);\n"
-"color: rgb(255, 255, 255);")
-        self.btn_addBranch.setObjectName("btn_addBranch")
-        self.footer_5.addWidget(self.btn_addBranch)
-        spacerItem21 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.footer_5.addItem(spacerItem21)
-        self.verticalLayout_18.addLayout(self.footer_5)
-        self.stackedWidget.addWidget(self.branchadd_page)
-        self.branchedit_page = QtWidgets.QWidget()
-        self.branchedit_page.setObjectName("branchedit_page")
-        self.verticalLayout_27 = QtWidgets.QVBoxLayout(self.branchedit_page)
-        self.verticalLayout_27.setObjectName("verticalLayout_27")
-        self.header_6 = QtWidgets.QFrame(parent=self.branchedit_page)
-        self.header_6.setStyleSheet("background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:0.931, y2:0, stop:0.265957 rgba(102, 173, 255, 255), stop:0.547872 rgba(55, 111, 186, 255), stop:1 rgba(16, 36, 62, 255));\n"
-"color: rgb(255, 255, 255);\n"
-"border: None;\n"
-"")
-        self.header_6.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
-        self.header_6.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
-        self.header_6.setObjectName("header_6")
-        self.verticalLayout_19 = QtWidgets.QVBoxLayout(self.header_6)
-        self.verticalLayout_19.setObjectName("verticalLayout_19")
-        self.label_38 = QtWidgets.QLabel(parent=self.header_6)
-        font = QtGui.QFont()
-        font.setPointSize(14)
-        self.label_38.setFont(font)
-        self.label_38.setObjectName("label_38")
-        self.verticalLayout_19.addWidget(self.label_38)
-        self.label_39 = QtWidgets.QLabel(parent=self.header_6)
-        font = QtGui.QFont()
-        font.setPointSize(11)
-        self.label_39.setFont(font)
-        self.label_39.setObjectName("label_39")
-        self.verticalLayout_19.addWidget(self.label_39)
-        self.verticalLayout_27.addWidget(self.header_6)
-        self.gridLayout = QtWidgets.QGridLayout()
-        self.gridLayout.setObjectName("gridLayout")
-        self.label_44 = QtWidgets.QLabel(parent=self.branchedit_page)
-        self.label_44.setObjectName("label_44")
-        self.gridLayout.addWidget(self.label_44, 5, 1, 1, 1)
-        spacerItem22 = QtWidgets.QSpacerItem(40, 25, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.gridLayout.addItem(spacerItem22, 0, 0, 1, 1)
-        self.lineEdit_branchContact_2 = QtWidgets.QLineEdit(parent=self.branchedit_page)
-        self.lineEdit_branchContact_2.setObjectName("lineEdit_branchContact_2")
-        self.gridLayout.addWidget(self.lineEdit_branchContact_2, 6, 1, 1, 1)
-        spacerItem23 = QtWidgets.QSpacerItem(40, 25, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.gridLayout.addItem(spacerItem23, 0, 2, 1, 1)
-        self.lineEdit_branchAddress_2 = QtWidgets.QLineEdit(parent=self.branchedit_page)
-        self.lineEdit_branchAddress_2.setObjectName("lineEdit_branchAddress_2")
-        self.gridLayout.addWidget(self.lineEdit_branchAddress_2, 4, 1, 1, 1)
-        self.label_42 = QtWidgets.QLabel(parent=self.branchedit_page)
-        self.label_42.setObjectName("label_42")
-        self.gridLayout.addWidget(self.label_42, 3, 1, 1, 1)
-        self.label_40 = QtWidgets.QLabel(parent=self.branchedit_page)
-        self.label_40.setObjectName("label_40")
-        self.gridLayout.addWidget(self.label_40, 0, 1, 1, 1)
-        self.lineEdit_branchName_2 = QtWidgets.QLineEdit(parent=self.branchedit_page)
-        self.lineEdit_branchName_2.setObjectName("lineEdit_branchName_2")
-        self.gridLayout.addWidget(self.lineEdit_branchName_2, 1, 1, 1, 1)
-        self.gridLayout_5 = QtWidgets.QGridLayout()
-        self.gridLayout_5.setObjectName("gridLayout_5")
-        self.horizontalLayout_4 = QtWidgets.QHBoxLayout()
-        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
-        self.lineEdit_branchPass_2 = QtWidgets.QLineEdit(parent=self.branchedit_page)
-        self.lineEdit_branchPass_2.setEchoMode(QtWidgets.QLineEdit.EchoMode.Password)
-        self.lineEdit_branchPass_2.setObjectName("lineEdit_branchPass_2")
-        self.horizontalLayout_4.addWidget(self.lineEdit_branchPass_2)
-        self.btn_showpass_3 = QtWidgets.QPushButton(parent=self.branchedit_page)
-        self.btn_showpass_3.setText("")
-        self.btn_showpass_3.setIcon(icon)
-        self.btn_showpass_3.setObjectName("btn_showpass_3")
-        self.horizontalLayout_4.addWidget(self.btn_showpass_3)
-        self.gridLayout_5.addLayout(self.horizontalLayout_4, 1, 0, 1, 1)
-        self.label_43 = QtWidgets.QLabel(parent=self.branchedit_page)
-        self.label_43.setObjectName("label_43")
-        self.gridLayout_5.addWidget(self.label_43, 0, 2, 1, 1)
-        self.horizontalLayout_10 = QtWidgets.QHBoxLayout()
-        self.horizontalLayout_10.setObjectName("horizontalLayout_10")
-        self.lineEdit_branchConfPass_2 = QtWidgets.QLineEdit(parent=self.branchedit_page)
-        self.lineEdit_branchConfPass_2.setEchoMode(QtWidgets.QLineEdit.EchoMode.Password)
-        self.lineEdit_branchConfPass_2.setObjectName("lineEdit_branchConfPass_2")
-        self.horizontalLayout_10.addWidget(self.lineEdit_branchConfPass_2)
-        self.btn_showpass_4 = QtWidgets.QPushButton(parent=self.branchedit_page)
-        self.btn_showpass_4.setText("")
-        self.btn_showpass_4.setIcon(icon)
-        self.btn_showpass_4.setObjectName("btn_showpass_4")
-        self.horizontalLayout_10.addWidget(self.btn_showpass_4)
-        self.gridLayout_5.addLayout(self.horizontalLayout_10, 1, 2, 1, 1)
-        self.label_41 = QtWidgets.QLabel(parent=self.branchedit_page)
-        self.label_41.setObjectName("label_41")
-        self.gridLayout_5.addWidget(self.label_41, 0, 0, 1, 1)
-        spacerItem24 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.gridLayout_5.addItem(spacerItem24, 1, 1, 1, 1)
-        self.gridLayout.addLayout(self.gridLayout_5, 2, 1, 1, 1)
-        self.verticalLayout_27.addLayout(self.gridLayout)
-        spacerItem25 = QtWidgets.QSpacerItem(20, 10, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Fixed)
-        self.verticalLayout_27.addItem(spacerItem25)
-        self.footer_6 = QtWidgets.QHBoxLayout()
-        self.footer_6.setObjectName("footer_6")
-        spacerItem26 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.footer_6.addItem(spacerItem26)
-        self.cancel_btn_6 = QtWidgets.QPushButton(parent=self.branchedit_page)
-        self.cancel_btn_6.setObjectName("cancel_btn_6")
-        self.footer_6.addWidget(self.cancel_btn_6)
-        self.btn_updateBranch = QtWidgets.QPushButton(parent=self.branchedit_page)
-        font = QtGui.QFont()
-        font.setPointSize(11)
-        self.btn_updateBranch.setFont(font)
-        self.btn_updateBranch.setStyleSheet("background-color: rgb(0, 0, 0);\n"
-"color: rgb(255, 255, 255);")
-        self.btn_updateBranch.setObjectName("btn_updateBranch")
-        self.footer_6.addWidget(self.btn_updateBranch)
-        spacerItem27 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.footer_6.addItem(spacerItem27)
-        self.verticalLayout_27.addLayout(self.footer_6)
-        self.stackedWidget.addWidget(self.branchedit_page)
         self.verticalLayout_28.addWidget(self.stackedWidget)
 
         self.retranslateUi(Dialog)
-        self.stackedWidget.setCurrentIndex(4)
-        self.cancel_btn.clicked.connect(Dialog.close) # type: ignore
-        self.cancel_btn_2.clicked.connect(Dialog.close) # type: ignore
-        self.cancel_btn_3.clicked.connect(Dialog.close) # type: ignore
-        self.cancel_btn_4.clicked.connect(Dialog.close) # type: ignore
-        self.cancel_btn_5.clicked.connect(Dialog.close) # type: ignore
-        self.cancel_btn_6.clicked.connect(Dialog.close) # type: ignore
         QtCore.QMetaObject.connectSlotsByName(Dialog)
-        Dialog.setTabOrder(self.lineEdit_branchName, self.lineEdit_branchPass_3)
-        Dialog.setTabOrder(self.lineEdit_branchPass_3, self.btn_showpass)
-        Dialog.setTabOrder(self.btn_showpass, self.lineEdit_branchConfPass_3)
-        Dialog.setTabOrder(self.lineEdit_branchConfPass_3, self.btn_showpass_2)
-        Dialog.setTabOrder(self.btn_showpass_2, self.lineEdit_branchAddress)
-        Dialog.setTabOrder(self.lineEdit_branchAddress, self.lineEdit_branchContact)
-        Dialog.setTabOrder(self.lineEdit_branchContact, self.cancel_btn_5)
-        Dialog.setTabOrder(self.cancel_btn_5, self.btn_addBranch)
-        Dialog.setTabOrder(self.btn_addBranch, self.lineEdit_branchName_2)
-        Dialog.setTabOrder(self.lineEdit_branchName_2, self.lineEdit_branchPass_2)
-        Dialog.setTabOrder(self.lineEdit_branchPass_2, self.btn_showpass_3)
-        Dialog.setTabOrder(self.btn_showpass_3, self.lineEdit_branchConfPass_2)
-        Dialog.setTabOrder(self.lineEdit_branchConfPass_2, self.btn_showpass_4)
-        Dialog.setTabOrder(self.btn_showpass_4, self.lineEdit_branchAddress_2)
-        Dialog.setTabOrder(self.lineEdit_branchAddress_2, self.lineEdit_branchContact_2)
-        Dialog.setTabOrder(self.lineEdit_branchContact_2, self.cancel_btn_6)
-        Dialog.setTabOrder(self.cancel_btn_6, self.btn_updateBranch)
-        Dialog.setTabOrder(self.btn_updateBranch, self.status_edit)
-        Dialog.setTabOrder(self.status_edit, self.roomtype_edit)
-        Dialog.setTabOrder(self.roomtype_edit, self.price_edit)
-        Dialog.setTabOrder(self.price_edit, self.capacity_edit)
-        Dialog.setTabOrder(self.capacity_edit, self.description_edit)
-        Dialog.setTabOrder(self.description_edit, self.cancel_btn)
-        Dialog.setTabOrder(self.cancel_btn, self.updateroom_btn)
-        Dialog.setTabOrder(self.updateroom_btn, self.status_add)
-        Dialog.setTabOrder(self.status_add, self.roomtype_add)
-        Dialog.setTabOrder(self.roomtype_add, self.price_add)
-        Dialog.setTabOrder(self.price_add, self.capacity_add)
-        Dialog.setTabOrder(self.capacity_add, self.description_add)
-        Dialog.setTabOrder(self.description_add, self.cancel_btn_2)
-        Dialog.setTabOrder(self.cancel_btn_2, self.addroom_btn)
-        Dialog.setTabOrder(self.addroom_btn, self.name_add)
-        Dialog.setTabOrder(self.name_add, self.contact_add)
-        Dialog.setTabOrder(self.contact_add, self.roomnum_add)
-        Dialog.setTabOrder(self.roomnum_add, self.payment_add)
-        Dialog.setTabOrder(self.payment_add, self.checkindate_add)
-        Dialog.setTabOrder(self.checkindate_add, self.checkoutdate_add)
-        Dialog.setTabOrder(self.checkoutdate_add, self.cancel_btn_3)
-        Dialog.setTabOrder(self.cancel_btn_3, self.addreserve_btn)
-        Dialog.setTabOrder(self.addreserve_btn, self.name_edit)
-        Dialog.setTabOrder(self.name_edit, self.contact_edit)
-        Dialog.setTabOrder(self.contact_edit, self.roomnum_edit)
-        Dialog.setTabOrder(self.roomnum_edit, self.payment_edit)
-        Dialog.setTabOrder(self.payment_edit, self.checkindate_edit)
-        Dialog.setTabOrder(self.checkindate_edit, self.checkoutdate_edit)
-        Dialog.setTabOrder(self.checkoutdate_edit, self.cancel_btn_4)
-        Dialog.setTabOrder(self.cancel_btn_4, self.addreserve_btn_2)
 
     def retranslateUi(self, Dialog):
         _translate = QtCore.QCoreApplication.translate
         Dialog.setWindowTitle(_translate("Dialog", "Dialog"))
-        self.label.setText(_translate("Dialog", "Edit Room"))
-        self.label_2.setText(_translate("Dialog", "Update room information"))
-        self.label_4.setText(_translate("Dialog", "Room Type:"))
-        self.roomtype_edit.setItemText(0, _translate("Dialog", "Single"))
-        self.roomtype_edit.setItemText(1, _translate("Dialog", "Double"))
-        self.roomtype_edit.setItemText(2, _translate("Dialog", "Twin"))
-        self.roomtype_edit.setItemText(3, _translate("Dialog", "Deluxe"))
-        self.roomtype_edit.setItemText(4, _translate("Dialog", "Suite"))
-        self.label_7.setText(_translate("Dialog", "Status"))
-        self.status_edit.setItemText(0, _translate("Dialog", "Available"))
-        self.status_edit.setItemText(1, _translate("Dialog", "Maintenance"))
-        self.label_6.setText(_translate("Dialog", "Capacity"))
-        self.label_5.setText(_translate("Dialog", "Price/Night"))
-        self.label_8.setText(_translate("Dialog", "Description"))
-        self.cancel_btn.setText(_translate("Dialog", "Cancel"))
-        self.updateroom_btn.setText(_translate("Dialog", "Update Room"))
-        self.label_9.setText(_translate("Dialog", "Add New Room"))
-        self.label_10.setText(_translate("Dialog", "Enter details for the new room"))
-        self.label_11.setText(_translate("Dialog", "Status"))
-        self.label_12.setText(_translate("Dialog", "Room Type:"))
-        self.roomtype_add.setItemText(0, _translate("Dialog", "Single"))
-        self.roomtype_add.setItemText(1, _translate("Dialog", "Double"))
-        self.roomtype_add.setItemText(2, _translate("Dialog", "Twin"))
-        self.roomtype_add.setItemText(3, _translate("Dialog", "Deluxe"))
-        self.roomtype_add.setItemText(4, _translate("Dialog", "Suite"))
-        self.status_add.setItemText(0, _translate("Dialog", "Available"))
-        self.status_add.setItemText(1, _translate("Dialog", "Maintenance"))
-        self.label_13.setText(_translate("Dialog", "Capacity"))
-        self.label_14.setText(_translate("Dialog", "Price/Night"))
-        self.label_16.setText(_translate("Dialog", "Description"))
-        self.cancel_btn_2.setText(_translate("Dialog", "Cancel"))
-        self.addroom_btn.setText(_translate("Dialog", "Add Room"))
-        self.label_15.setText(_translate("Dialog", "Add New Reservation"))
-        self.label_17.setText(_translate("Dialog", "Enter details for the new reservation"))
-        self.label_3.setText(_translate("Dialog", "Guest Name"))
-        self.label_18.setText(_translate("Dialog", "Contact"))
-        self.label_19.setText(_translate("Dialog", "Room Number"))
-        self.label_21.setText(_translate("Dialog", "Check-in Date"))
-        self.label_20.setText(_translate("Dialog", "Payment Status"))
-        self.payment_add.setItemText(0, _translate("Dialog", "Paid"))
-        self.payment_add.setItemText(1, _translate("Dialog", "Pending"))
-        self.payment_add.setItemText(2, _translate("Dialog", "Cancelled"))
-        self.label_22.setText(_translate("Dialog", "Check-out Date"))
-        self.cancel_btn_3.setText(_translate("Dialog", "Cancel"))
-        self.addreserve_btn.setText(_translate("Dialog", "Add Reservation"))
-        self.label_23.setText(_translate("Dialog", "Edit Reservation"))
-        self.label_24.setText(_translate("Dialog", "Update reservation information"))
-        self.label_25.setText(_translate("Dialog", "Guest Name"))
-        self.label_26.setText(_translate("Dialog", "Contact"))
-        self.label_27.setText(_translate("Dialog", "Room Number"))
-        self.label_28.setText(_translate("Dialog", "Check-in Date"))
-        self.label_29.setText(_translate("Dialog", "Payment Status"))
-        self.payment_edit.setItemText(0, _translate("Dialog", "Paid"))
-        self.payment_edit.setItemText(1, _translate("Dialog", "Pending"))
-        self.payment_edit.setItemText(2, _translate("Dialog", "Cancelled"))
-        self.label_30.setText(_translate("Dialog", "Check-out Date"))
-        self.cancel_btn_4.setText(_translate("Dialog", "Cancel"))
-        self.addreserve_btn_2.setText(_translate("Dialog", "Update Reservation"))
-        self.label_31.setText(_translate("Dialog", "Add Branch"))
-        self.label_32.setText(_translate("Dialog", "Enter details for the new branch"))
-        self.label_37.setText(_translate("Dialog", "Contact"))
-        self.label_33.setText(_translate("Dialog", "Branch Name"))
-        self.label_36.setText(_translate("Dialog", "Address"))
-        self.label_45.setText(_translate("Dialog", "Confirm Password"))
-        self.label_46.setText(_translate("Dialog", "Password"))
-        self.cancel_btn_5.setText(_translate("Dialog", "Cancel"))
-        self.btn_addBranch.setText(_translate("Dialog", "Add Branch"))
-        self.label_38.setText(_translate("Dialog", "Edit Branch"))
-        self.label_39.setText(_translate("Dialog", "Update branch information"))
-        self.label_44.setText(_translate("Dialog", "Contact"))
-        self.label_42.setText(_translate("Dialog", "Address"))
-        self.label_40.setText(_translate("Dialog", "Branch Name"))
-        self.label_43.setText(_translate("Dialog", "Confirm Password"))
-        self.label_41.setText(_translate("Dialog", "Password"))
-        self.cancel_btn_6.setText(_translate("Dialog", "Cancel"))
-        self.btn_updateBranch.setText(_translate("Dialog", "Update Branch"))
-
-
-if __name__ == "__main__":
-    import sys
-    app = QtWidgets.QApplication(sys.argv)
-    Dialog = QtWidgets.QDialog()
-    ui = Ui_Dialog()
-    ui.setupUi(Dialog)
-    Dialog.show()
-    sys.exit(app.exec())
@@ -0,0 +1,471 @@
+from PyQt6.QtWidgets import QWidget, QMessageBox, QLineEdit
+from PyQt6.QtCore import QDate
+from room_add_page import Ui_RoomAddPage
+from room_edit_page import Ui_RoomEditPage
+from reservation_add_page import Ui_ReservationAddPage
+from reservation_edit_page import Ui_ReservationEditPage
+from branch_add_page import Ui_BranchAddPage
+from branch_edit_page import Ui_BranchEditPage
+from resource_cache import get_icon
+
+
+class CrudPage(QWidget):
+    # This class is one form of the add/edit dialog. The dialog builds a page
+    # the first time it is needed and calls open_form each time it is shown.
+
+    def __init__(self, dialog):
+        super().__init__()
+        self.dialog = dialog
+
+    def open_form(self, data):
+        # Empty an add form, or fill an edit form with data
+        pass
+
+    def on_database_changed(self, changes):
+        # Called with the merged changes while the page is shown
+        pass
+
+    def close_if_deleted(self, changes, entity, key):
+        # Close the dialog if the record being edited was deleted
+        for change in changes:
+            if change.op == "delete" and change.entity == entity and change.key == key:
+                QMessageBox.warning(self, "Deleted", f"This {entity} was deleted.")
+                self.dialog.reject()
+                return True
+        return False
+
+    # ============== PASSWORD VISIBILITY ==============
+
+    def setup_password_button(self, line_edit, button):
+        button.setIcon(get_icon("showpassword16.png"))
+        button.clicked.connect(lambda: self.toggle_password(line_edit, button))
+
+    def toggle_password(self, line_edit, button):
+        # Toggle password visibility
+        if line_edit.echoMode() == QLineEdit.EchoMode.Password:
+            line_edit.setEchoMode(QLineEdit.EchoMode.Normal)
+            button.setIcon(get_icon("hidepassword16.png"))
+        else:
+            self.hide_password(line_edit, button)
+
+    def hide_password(self, line_edit, button):
+        line_edit.setEchoMode(QLineEdit.EchoMode.Password)
+        button.setIcon(get_icon("showpassword16.png"))
+
+    # ============== SAVING ==============
+
+    def run_write(self, call, button, refresh=None):
+        # Save on the main window's database thread. The button stays disabled
+        # until the result is back so the same form cannot be sent twice.
+        button.setEnabled(False)
+        form = self.dialog.form_generation
+        self.dialog.parent_window.executor.submit(call,
+                                                  lambda result: self.write_finished(result, button, refresh, form),
+                                                  lambda error: self.write_failed(error, button))
+
+    def write_finished(self, result, button, refresh, form):
+        # Room and reservation tables update through the change notifier,
+        # branches are reloaded with refresh. refresh runs even if the form
+        # was closed meanwhile, the dialog is only touched if it still shows
+        # the form that was saved.
+        success, message = result[0], result[1]
+        button.setEnabled(True)
+        if not success:
+            QMessageBox.warning(self.dialog.parent_window, "Error", message)
+            return
+        if refresh:
+            refresh()
+        if form == self.dialog.form_generation:
+            QMessageBox.information(self, "Success", message)
+            self.dialog.close()
+
+    def write_failed(self, error, button):
+        button.setEnabled(True)
+        QMessageBox.warning(self.dialog.parent_window, "Error", error)
+
+
+# ============== ROOM PAGES ==============
+
+class RoomAddPage(CrudPage):
+    def __init__(self, dialog):
+        super().__init__(dialog)
+        self.ui = Ui_RoomAddPage()
+        self.ui.setupUi(self)
+        self.ui.cancel_btn_2.clicked.connect(dialog.close)
+        self.ui.addroom_btn.clicked.connect(self.add_room)
+
+    def open_form(self, data):
+        # Empty the form left over from the last time
+        self.ui.roomtype_add.setCurrentIndex(0)
+        self.ui.status_add.setCurrentIndex(0)
+        self.ui.price_add.clear()
+        self.ui.capacity_add.clear()
+        self.ui.description_add.clear()
+
+    def add_room(self):
+        # Get form values
+        room_type = self.ui.roomtype_add.currentText()
+        price_rate = self.ui.price_add.text().strip()
+        capacity = self.ui.capacity_add.text().strip()
+        status = self.ui.status_add.currentText()
+        description = self.ui.description_add.toPlainText().strip()
+
+        # Validate input
+        if not price_rate or not capacity:
+            QMessageBox.warning(self, "Invalid Input", "Please fill in all fields")
+            return
+
+        try:
+            price_rate = float(price_rate)
+            capacity = int(capacity)
+        except ValueError:
+            QMessageBox.warning(self, "Invalid Input", "Price must be a number and capacity must be a whole number")
+            return
+
+        # Add to database
+        self.run_write(lambda db: db.add_room(room_type, price_rate, capacity, description, status),
+                       self.ui.addroom_btn)
+
+
+class RoomEditPage(CrudPage):
+    def __init__(self, dialog):
+        super().__init__(dialog)
+        self.ui = Ui_RoomEditPage()
+        self.ui.setupUi(self)
+        self.room_data = None
+        self.ui.cancel_btn.clicked.connect(dialog.close)
+        self.ui.updateroom_btn.clicked.connect(self.update_room)
+
+    def open_form(self, data):
+        # Fill edit form with existing room data
+        self.room_data = data
+        self.ui.roomtype_edit.setCurrentText(self.room_data['type'])
+        self.ui.price_edit.setText(str(self.room_data['price_rate']))
+        self.ui.status_edit.setCurrentText(self.room_data['status'])
+        self.ui.capacity_edit.setText(str(self.room_data['capacity']))
+        self.ui.description_edit.setText(self.room_data['description'])
+
+    def on_database_changed(self, changes):
+        self.close_if_deleted(changes, "room", self.room_data['room_number'])
+
+    def update_room(self):
+        # Get form values
+        room_number = self.room_data['room_number']
+        room_type = self.ui.roomtype_edit.currentText()
+        price_rate = self.ui.price_edit.text().strip()
+        status = self.ui.status_edit.currentText()
+        capacity = self.ui.capacity_edit.text().strip()
+        description = self.ui.description_edit.toPlainText().strip()
+
+        # Validate input
+        if not price_rate or not capacity:
+            QMessageBox.warning(self, "Invalid Input", "Please fill in all fields")
+            return
+
+        try:
+            price_rate = float(price_rate)
+            capacity = int(capacity)
+        except ValueError:
+            QMessageBox.warning(self, "Invalid Input", "Capacity must be a whole number, price must be a number")
+            return
+
+        # Update in database
+        current_room = self.dialog.db.get_room_by_number(room_number)
+        if current_room['status'] == "Occupied" and status != current_room['status']:
+            QMessageBox.warning(self, "Cannot Edit", "Room is occupied. Please cancel the reservation first.")
+            return
+        self.run_write(lambda db: db.update_room(room_number, room_type, price_rate, status, capacity, description),
+                       self.ui.updateroom_btn)
+
+
+# ============== RESERVATION PAGES ==============
+
+def setup_date_edit(date_edit):
+    # Date picker for reservations
+    date_edit.setCalendarPopup(True)
+    date_edit.setDisplayFormat("MMM dd, yyyy")
+
+
+def validate_reservation(page, guest_name, contact, room_number, checkin_qdate, checkout_qdate):
+    # Show what is wrong with a reservation form, True if it can be saved
+    if not guest_name or not contact or not room_number:
+        QMessageBox.warning(page, "Invalid Input", "Please fill in all fields")
+        return False
+
+    if not contact.isdigit():
+        QMessageBox.warning(page, "Invalid Contact", "Contact must only consist of digits")
+        return False
+
+    if checkout_qdate <= checkin_qdate:
+        QMessageBox.warning(page, "Invalid Dates", "Check-out date must be after the check-in date.")
+        return False
+    return True
+
+
+class ReservationAddPage(CrudPage):
+    def __init__(self, dialog):
+        super().__init__(dialog)
+        self.ui = Ui_ReservationAddPage()
+        self.ui.setupUi(self)
+        setup_date_edit(self.ui.checkindate_add)
+        setup_date_edit(self.ui.checkoutdate_add)
+        self.ui.cancel_btn_3.clicked.connect(dialog.close)
+        self.ui.addreserve_btn.clicked.connect(self.add_reservation)
+
+        # Refresh the room list whenever the stay dates change
+        self.ui.checkindate_add.dateChanged.connect(self.on_dates_changed)
+        self.ui.checkoutdate_add.dateChanged.connect(self.on_dates_changed)
+
+    def open_form(self, data):
+        # Empty the form, with today and tomorrow taken again so a dialog
+        # kept overnight is right
+        self.ui.name_add.clear()
+        self.ui.contact_add.clear()
+        self.ui.payment_add.setCurrentIndex(0)
+
+        today = QDate.currentDate()
+        tomorrow = today.addDays(1)
+        self.ui.checkindate_add.setMinimumDate(today)
+        self.ui.checkindate_add.setDate(today)
+        self.ui.checkoutdate_add.setMinimumDate(tomorrow)
+        self.ui.checkoutdate_add.setDate(tomorrow)
+
+        self.ui.roomnum_add.clear()
+        self.load_available_rooms()
+
+    def on_dates_changed(self):
+        # Resetting the dates before the page is shown loads the rooms once
+        # in open_form instead
+        if self.isVisible():
+            self.load_available_rooms()
+
+    def on_database_changed(self, changes):
+        if any(change.entity == "room" for change in changes):
+            self.load_available_rooms()
+
+    def load_available_rooms(self):
+        # Load rooms free for the chosen dates into combobox
+        checkin_date = self.ui.checkindate_add.date().toString("yyyy-MM-dd")
+        checkout_date = self.ui.checkoutdate_add.date().toString("yyyy-MM-dd")
+        available_rooms = self.dialog.db.find_available_rooms(checkin_date, checkout_date)
+
+        # Keep the selected room if it is still free
+        selected_room = self.ui.roomnum_add.currentText()
+        self.ui.roomnum_add.clear()
+        for room in available_rooms:
+            self.ui.roomnum_add.addItem(str(room['room_number']))
+        if selected_room:
+            self.ui.roomnum_add.setCurrentText(selected_room)
+
+    def add_reservation(self):
+        # Get form values
+        guest_name = self.ui.name_add.text().strip()
+        contact = self.ui.contact_add.text().strip()
+        room_number = self.ui.roomnum_add.currentText()
+        payment_status = self.ui.payment_add.currentText()
+        checkin_qdate = self.ui.checkindate_add.date()
+        checkout_qdate = self.ui.checkoutdate_add.date()
+
+        # Validate input
+        if not validate_reservation(self, guest_name, contact, room_number, checkin_qdate, checkout_qdate):
+            return
+
+        checkin_date = checkin_qdate.toString("yyyy-MM-dd")
+        checkout_date = checkout_qdate.toString("yyyy-MM-dd")
+
+        # Add to database
+        self.run_write(lambda db: db.add_reservation(guest_name, contact, room_number, checkin_date, checkout_date,
+                                                     payment_status),
+                       self.ui.addreserve_btn)
+
+
+class ReservationEditPage(CrudPage):
+    def __init__(self, dialog):
+        super().__init__(dialog)
+        self.ui = Ui_ReservationEditPage()
+        self.ui.setupUi(self)
+        self.reservation_data = None
+        setup_date_edit(self.ui.checkindate_edit)
+        setup_date_edit(self.ui.checkoutdate_edit)
+        self.ui.cancel_btn_4.clicked.connect(dialog.close)
+        self.ui.addreserve_btn_2.clicked.connect(self.update_reservation)
+
+        # Refresh the room list whenever the stay dates change
+        self.ui.checkindate_edit.dateChanged.connect(self.on_dates_changed)
+        self.ui.checkoutdate_edit.dateChanged.connect(self.on_dates_changed)
+
+    def open_form(self, data):
+        # Fill edit form with existing reservation data
+        self.reservation_data = data
+        self.ui.name_edit.setText(self.reservation_data['guest_name'])
+        self.ui.contact_edit.setText(self.reservation_data['contact'])
+        self.ui.payment_edit.setCurrentText(self.reservation_data['payment_status'])
+
+        # Set dates
+        checkin = QDate.fromString(self.reservation_data['checkin_date'], "yyyy-MM-dd")
+        checkout = QDate.fromString(self.reservation_data['checkout_date'], "yyyy-MM-dd")
+        self.ui.checkindate_edit.setDate(checkin)
+        self.ui.checkoutdate_edit.setDate(checkout)
+
+        # Load the rooms free for those dates (the current room included)
+        self.ui.roomnum_edit.clear()
+        self.load_rooms_for_edit()
+        self.ui.roomnum_edit.setCurrentText(str(self.reservation_data['room_number']))
+
+    def on_dates_changed(self):
+        # Filling the form before the page is shown loads the rooms once
+        # in open_form instead
+        if self.isVisible():
+            self.load_rooms_for_edit()
+
+    def on_database_changed(self, changes):
+        if self.close_if_deleted(changes, "reservation", self.reservation_data['guest_id']):
+            return
+        if any(change.entity in ("room", "reservation") for change in changes):
+            self.load_rooms_for_edit()
+
+    def load_rooms_for_edit(self):
+        # Load rooms free for the chosen dates, not counting this reservation
+        # itself, so its own room stays in the list unless someone else booked it
+        checkin_date = self.ui.checkindate_edit.date().toString("yyyy-MM-dd")
+        checkout_date = self.ui.checkoutdate_edit.date().toString("yyyy-MM-dd")
+        available_rooms = self.dialog.db.find_available_rooms(checkin_date, checkout_date,
+                                                              exclude_guest_id=self.reservation_data['guest_id'])
+
+        # Keep the selected room if it is still free
+        selected_room = self.ui.roomnum_edit.currentText()
+        self.ui.roomnum_edit.clear()
+        for room in available_rooms:
+            self.ui.roomnum_edit.addItem(str(room['room_number']))
+        if selected_room:
+            self.ui.roomnum_edit.setCurrentText(selected_room)
+
+    def update_reservation(self):
+        # Get form values
+        guest_id = self.reservation_data['guest_id']
+        old_room_number = self.reservation_data['room_number']
+        guest_name = self.ui.name_edit.text().strip()
+        contact = self.ui.contact_edit.text().strip()
+        room_number = self.ui.roomnum_edit.currentText()
+        payment_status = self.ui.payment_edit.currentText()
+        checkin_qdate = self.ui.checkindate_edit.date()
+        checkout_qdate = self.ui.checkoutdate_edit.date()
+
+        # Validate input
+        if not validate_reservation(self, guest_name, contact, room_number, checkin_qdate, checkout_qdate):
+            return
+
+        checkin_date = checkin_qdate.toString("yyyy-MM-dd")
+        checkout_date = checkout_qdate.toString("yyyy-MM-dd")
+
+        # Update in database
+        self.run_write(lambda db: db.update_reservation(guest_id, guest_name, contact, room_number, checkin_date,
+                                                        checkout_date, payment_status, old_room_number),
+                       self.ui.addreserve_btn_2)
+
+
+# ============== BRANCH PAGES ==============
+
+class BranchAddPage(CrudPage):
+    def __init__(self, dialog):
+        super().__init__(dialog)
+        self.ui = Ui_BranchAddPage()
+        self.ui.setupUi(self)
+        self.setup_password_button(self.ui.lineEdit_branchPass_3, self.ui.btn_showpass)
+        self.setup_password_button(self.ui.lineEdit_branchConfPass_3, self.ui.btn_showpass_2)
+        self.ui.cancel_btn_5.clicked.connect(dialog.close)
+        self.ui.btn_addBranch.clicked.connect(self.add_branch)
+
+    def open_form(self, data):
+        # Empty the form and hide the passwords again
+        self.ui.lineEdit_branchName.clear()
+        self.ui.lineEdit_branchPass_3.clear()
+        self.ui.lineEdit_branchConfPass_3.clear()
+        self.ui.lineEdit_branchAddress.clear()
+        self.ui.lineEdit_branchContact.clear()
+        self.hide_password(self.ui.lineEdit_branchPass_3, self.ui.btn_showpass)
+        self.hide_password(self.ui.lineEdit_branchConfPass_3, self.ui.btn_showpass_2)
+
+    def add_branch(self):
+        # Get form values
+        branch_name = self.ui.lineEdit_branchName.text().strip()
+        password = self.ui.lineEdit_branchPass_3.text().strip()
+        confirm_password = self.ui.lineEdit_branchConfPass_3.text().strip()
+        address = self.ui.lineEdit_branchAddress.text().strip()
+        contact = self.ui.lineEdit_branchContact.text().strip()
+
+        # Validate input
+        if not branch_name or not password or not confirm_password or not address or not contact:
+            QMessageBox.warning(self, "Missing Information", "Please fill in all fields")
+            return
+
+        if password != confirm_password:
+            QMessageBox.warning(self, "Password Mismatch", "Passwords do not match")
+            return
+
+        if len(password) < 8:
+            QMessageBox.warning(self, "Weak Password", "Password must be at least 8 characters")
+            return
+
+        if not contact.isdigit():
+            QMessageBox.warning(self, "Invalid Contact", "Contact must only consist of digits")
+            return
+
+        # Add to database
+        self.run_write(lambda db: db.add_branch(branch_name, address, contact, password),
+                       self.ui.btn_addBranch, self.dialog.parent_window.display_branches)
+
+
+class BranchEditPage(CrudPage):
+    def __init__(self, dialog):
+        super().__init__(dialog)
+        self.ui = Ui_BranchEditPage()
+        self.ui.setupUi(self)
+        self.branch_data = None
+        self.setup_password_button(self.ui.lineEdit_branchPass_2, self.ui.btn_showpass_3)
+        self.setup_password_button(self.ui.lineEdit_branchConfPass_2, self.ui.btn_showpass_4)
+        self.ui.cancel_btn_6.clicked.connect(dialog.close)
+        self.ui.btn_updateBranch.clicked.connect(self.update_branch)
+
+    def open_form(self, data):
+        # Fill edit form with existing branch data
+        self.branch_data = data
+        self.ui.lineEdit_branchName_2.setText(self.branch_data['username'])
+        self.ui.lineEdit_branchPass_2.setText(self.branch_data['password'])
+        self.ui.lineEdit_branchAddress_2.setText(self.branch_data['address'])
+        self.ui.lineEdit_branchContact_2.setText(self.branch_data['contact'])
+        self.ui.lineEdit_branchConfPass_2.clear()
+        self.hide_password(self.ui.lineEdit_branchPass_2, self.ui.btn_showpass_3)
+        self.hide_password(self.ui.lineEdit_branchConfPass_2, self.ui.btn_showpass_4)
+
+    def update_branch(self):
+        # Get form values
+        branch_id = self.branch_data['uid']
+        branch_name = self.ui.lineEdit_branchName_2.text().strip()
+        password = self.ui.lineEdit_branchPass_2.text().strip()
+        confirm_password = self.ui.lineEdit_branchConfPass_2.text().strip()
+        address = self.ui.lineEdit_branchAddress_2.text().strip()
+        contact = self.ui.lineEdit_branchContact_2.text().strip()
+
+        # Validate input
+        if not branch_name or not password or not confirm_password or not address or not contact:
+            QMessageBox.warning(self, "Invalid Input", "Please fill in all fields")
+            return
+
+        if password != confirm_password:
+            QMessageBox.warning(self, "Password Mismatch", "Passwords do not match")
+            return
+
+        if len(password) < 6:
+            QMessageBox.warning(self, "Weak Password", "Password must be at least 6 characters")
+            return
+
+        if not contact.isdigit():
+            QMessageBox.warning(self, "Invalid Contact", "Contact must only consist of digits")
+            return
+
+        # Update in database, the branch file is renamed once the update is saved
+        old_username = self.branch_data['username']
+        window = self.dialog.parent_window
+        self.run_write(lambda db: db.update_branch(branch_id, branch_name, address, contact, password),
+                       self.ui.btn_updateBranch, lambda: window.branch_updated(old_username, branch_name))
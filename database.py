@@ -1,55 +1,496 @@
 import sqlite3
 import os
+import re
+import threading
+from collections import namedtuple
+from contextlib import contextmanager
+from search_query import ROOM_FIELDS, RESERVATION_FIELDS, ROOM_TEXT_COLUMNS, RESERVATION_TEXT_COLUMNS, \
+    parse_query, compile_query
+
+# ============== STORAGE PROFILES ==============
+
+# PRAGMA settings applied when a database file is opened. Pick one with the
+# STAYBOOK_DB_PROFILE environment variable or the profile argument.
+STORAGE_PROFILES = {
+    # Safest: every commit is flushed to disk
+    "durable": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "cache_size": -8000,        # 8 MB
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+        "busy_timeout": 5000,
+    },
+    # Default for front desks: WAL only needs to sync on checkpoint
+    "balanced": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -16000,       # 16 MB
+        "mmap_size": 67108864,      # 64 MB
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+    # Nightly imports: no syncing, big cache. Do not use for normal work
+    "bulk-load": {
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -64000,       # 64 MB
+        "mmap_size": 268435456,     # 256 MB
+        "temp_store": "MEMORY",
+        "busy_timeout": 30000,
+    },
+}
+
+DEFAULT_STORAGE_PROFILE = "balanced"
+
+
+def get_storage_profile(name=None):
+    # Return the profile name to use, falling back to the default
+    if name is None:
+        name = os.environ.get("STAYBOOK_DB_PROFILE", DEFAULT_STORAGE_PROFILE)
+    if name not in STORAGE_PROFILES:
+        print(f"Unknown storage profile '{name}', using '{DEFAULT_STORAGE_PROFILE}'")
+        name = DEFAULT_STORAGE_PROFILE
+    return name
+
+
+def apply_storage_profile(conn, name=None):
+    # Set the PRAGMAs of a storage profile on an open connection
+    settings = STORAGE_PROFILES[get_storage_profile(name)]
+    for pragma, value in settings.items():
+        conn.execute(f"PRAGMA {pragma} = {value}")
+
+
+# ============== CONNECTION REGISTRY ==============
+
+class ConnectionRegistry:
+    # This class keep one shared connection per database file and thread.
+    # SQLite connections can only be used by the thread that opened them, so
+    # the database thread gets its own while the windows share theirs.
+
+    def __init__(self):
+        # Each entry is (thread id, path) -> [connection, reference count]
+        self.connections = {}
+        self.lock = threading.Lock()
+
+    def acquire(self, path, profile=None):
+        # Return (connection, is_new) and count one more user of the file.
+        # The storage profile is only applied when the file is first opened.
+        key = (threading.get_ident(), os.path.abspath(path))
+        with self.lock:
+            entry = self.connections.get(key)
+            if entry:
+                entry[1] += 1
+                return entry[0], False
+
+        conn = sqlite3.connect(path)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys = ON")
+        apply_storage_profile(conn, profile)
+        with self.lock:
+            self.connections[key] = [conn, 1]
+        return conn, True
+
+    def release(self, path):
+        # Count one less user of the file and close it when nobody uses it
+        key = (threading.get_ident(), os.path.abspath(path))
+        with self.lock:
+            entry = self.connections.get(key)
+            if not entry:
+                return
+            entry[1] -= 1
+            if entry[1] > 0:
+                return
+            del self.connections[key]
+        entry[0].close()
+
+
+connection_registry = ConnectionRegistry()
+
+
+@contextmanager
+def transaction(conn):
+    # Run a group of writes as one unit: one commit, or rollback on any error
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        raise
+    else:
+        conn.commit()
+
+
+# Default of after_value in the paging methods, so "not given" can be told
+# apart from a last row whose value is NULL
+NO_VALUE = object()
+
+
+def iter_chunks(rows, chunk_size):
+    # Split any iterable into lists of at most chunk_size items
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+# ============== SCHEMA MIGRATIONS ==============
+
+# Each migration is a list of SQL statements, or a function taking the connection
+# for steps that need checks. Migration N brings the database to PRAGMA
+# user_version N. Only add new migrations at the end, never edit old ones.
+
+def fts5_available(conn):
+    # Check if this SQLite build has the FTS5 full-text search extension
+    try:
+        conn.execute("CREATE VIRTUAL TABLE temp.fts5_check USING fts5(x)")
+        conn.execute("DROP TABLE temp.fts5_check")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+def add_full_text_search(conn):
+    # Full-text search tables over reservations and rooms, kept in sync by triggers.
+    # Skipped without FTS5; searches then fall back to LIKE.
+    if not fts5_available(conn):
+        return
+
+    conn.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS reservations_fts USING fts5(
+            guest_name, contact, room_number, checkin_date, checkout_date, payment_status,
+            content='reservations', content_rowid='guest_id', prefix='2 3'
+        )
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS reservations_fts_insert AFTER INSERT ON reservations BEGIN
+            INSERT INTO reservations_fts(rowid, guest_name, contact, room_number, checkin_date, checkout_date, payment_status)
+            VALUES (new.guest_id, new.guest_name, new.contact, new.room_number, new.checkin_date, new.checkout_date, new.payment_status);
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS reservations_fts_delete AFTER DELETE ON reservations BEGIN
+            INSERT INTO reservations_fts(reservations_fts, rowid, guest_name, contact, room_number, checkin_date, checkout_date, payment_status)
+            VALUES ('delete', old.guest_id, old.guest_name, old.contact, old.room_number, old.checkin_date, old.checkout_date, old.payment_status);
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS reservations_fts_update AFTER UPDATE ON reservations BEGIN
+            INSERT INTO reservations_fts(reservations_fts, rowid, guest_name, contact, room_number, checkin_date, checkout_date, payment_status)
+            VALUES ('delete', old.guest_id, old.guest_name, old.contact, old.room_number, old.checkin_date, old.checkout_date, old.payment_status);
+            INSERT INTO reservations_fts(rowid, guest_name, contact, room_number, checkin_date, checkout_date, payment_status)
+            VALUES (new.guest_id, new.guest_name, new.contact, new.room_number, new.checkin_date, new.checkout_date, new.payment_status);
+        END
+    """)
+    conn.execute("INSERT INTO reservations_fts(reservations_fts) VALUES ('rebuild')")
+
+    conn.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS rooms_fts USING fts5(
+            type, description,
+            content='rooms', content_rowid='room_number', prefix='2 3'
+        )
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS rooms_fts_insert AFTER INSERT ON rooms BEGIN
+            INSERT INTO rooms_fts(rowid, type, description) VALUES (new.room_number, new.type, new.description);
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS rooms_fts_delete AFTER DELETE ON rooms BEGIN
+            INSERT INTO rooms_fts(rooms_fts, rowid, type, description) VALUES ('delete', old.room_number, old.type, old.description);
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS rooms_fts_update AFTER UPDATE OF type, description ON rooms BEGIN
+            INSERT INTO rooms_fts(rooms_fts, rowid, type, description) VALUES ('delete', old.room_number, old.type, old.description);
+            INSERT INTO rooms_fts(rowid, type, description) VALUES (new.room_number, new.type, new.description);
+        END
+    """)
+    conn.execute("INSERT INTO rooms_fts(rooms_fts) VALUES ('rebuild')")
+
+
+def fts_query(text):
+    # Turn typed text into an FTS5 query: every word must start a word in the row
+    words = re.findall(r"\w+", text)
+    return " ".join(f'"{word}"*' for word in words)
+
+
+HOTEL_MIGRATIONS = [
+    # 1: rooms and reservations tables
+    [
+        """
+        CREATE TABLE IF NOT EXISTS rooms(
+            room_number INTEGER PRIMARY KEY AUTOINCREMENT,
+            type TEXT,
+            price_rate REAL,
+            status TEXT DEFAULT 'Available',
+            capacity INTEGER,
+            description TEXT
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS reservations(
+            guest_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guest_name TEXT NOT NULL,
+            contact TEXT,
+            room_number INTEGER,
+            checkin_date TEXT,
+            checkout_date TEXT,
+            payment_status TEXT,
+            FOREIGN KEY (room_number) REFERENCES rooms(room_number)
+        )
+        """,
+    ],
+    # 2: indexes for room status filters, room lookups and contact search
+    [
+        "CREATE INDEX IF NOT EXISTS idx_rooms_status ON rooms(status)",
+        # Leading room_number also serves the foreign key check when deleting a room
+        """
+        CREATE INDEX IF NOT EXISTS idx_reservations_room_dates
+            ON reservations(room_number, checkin_date, checkout_date)
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_reservations_contact ON reservations(contact)",
+    ],
+    # 3: availability lookups. Most stays are in the past, so checkout_date > checkin
+    # is the selective side of the date overlap test
+    [
+        """
+        CREATE INDEX IF NOT EXISTS idx_reservations_room_checkout
+            ON reservations(room_number, checkout_date)
+        """,
+    ],
+    # 4: paging reservations by check-in date
+    [
+        "CREATE INDEX IF NOT EXISTS idx_reservations_checkin ON reservations(checkin_date)",
+    ],
+    # 5: full-text search
+    add_full_text_search,
+    # 6: change log, so other processes can pick up only the rows written since
+    # they last looked (a sequence number per write, deletes included)
+    [
+        """
+        CREATE TABLE IF NOT EXISTS change_log(
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            entity TEXT NOT NULL,
+            row_key INTEGER NOT NULL,
+            op TEXT NOT NULL
+        )
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS rooms_log_insert AFTER INSERT ON rooms BEGIN
+            INSERT INTO change_log(entity, row_key, op) VALUES ('room', new.room_number, 'insert');
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS rooms_log_update AFTER UPDATE ON rooms BEGIN
+            INSERT INTO change_log(entity, row_key, op) VALUES ('room', new.room_number, 'update');
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS rooms_log_delete AFTER DELETE ON rooms BEGIN
+            INSERT INTO change_log(entity, row_key, op) VALUES ('room', old.room_number, 'delete');
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS reservations_log_insert AFTER INSERT ON reservations BEGIN
+            INSERT INTO change_log(entity, row_key, op) VALUES ('reservation', new.guest_id, 'insert');
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS reservations_log_update AFTER UPDATE ON reservations BEGIN
+            INSERT INTO change_log(entity, row_key, op) VALUES ('reservation', new.guest_id, 'update');
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS reservations_log_delete AFTER DELETE ON reservations BEGIN
+            INSERT INTO change_log(entity, row_key, op) VALUES ('reservation', old.guest_id, 'delete');
+        END
+        """,
+    ],
+]
+
+ACCOUNT_MIGRATIONS = [
+    # 1: admin and branches tables
+    [
+        """
+        CREATE TABLE IF NOT EXISTS admin_table (
+            admin_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            password TEXT NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS branches_table (
+            uid INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT UNIQUE NOT NULL,
+            address TEXT NOT NULL,
+            contact TEXT NOT NULL,
+            password TEXT NOT NULL
+        )
+        """,
+    ],
+]
+
+
+def get_schema_version(conn):
+    # Read the schema version stored in the database file
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def run_migrations(conn, migrations):
+    # Run only the migrations the database has not seen yet
+    version = get_schema_version(conn)
+    if version >= len(migrations):
+        return version
+
+    for number in range(version + 1, len(migrations) + 1):
+        migration = migrations[number - 1]
+        with transaction(conn):
+            if callable(migration):
+                migration(conn)
+            else:
+                for sql in migration:
+                    conn.execute(sql)
+            conn.execute(f"PRAGMA user_version = {number}")
+    return len(migrations)
+
+# ============== CHANGES ==============
+
+# One row changed by a write: entity is "room" or "reservation", op is "insert",
+# "update" or "delete", key is the primary key and row the new row (None if deleted)
+# ("reload" with no key or row means many rows changed, read the table again)
+Change = namedtuple("Change", ["entity", "op", "key", "row"])
+
+
+def merge_changes(changes):
+    # Fold a burst of changes into one per row: insert then update is still an
+    # insert, insert then delete is nothing, and a reload replaces every other
+    # change of its entity
+    reloads = [change.entity for change in changes if change.op == "reload"]
+    merged = {}
+    for change in changes:
+        if change.entity in reloads:
+            continue
+        row_id = (change.entity, change.key)
+        earlier = merged.get(row_id)
+        if earlier is None:
+            merged[row_id] = change
+        elif earlier.op == "insert":
+            if change.op == "delete":
+                del merged[row_id]
+            else:
+                merged[row_id] = change._replace(op="insert")
+        elif change.op == "insert":
+            merged[row_id] = change._replace(op="update")
+        else:
+            merged[row_id] = change
+    reload_changes = [Change(entity, "reload", None, None) for entity in dict.fromkeys(reloads)]
+    return reload_changes + list(merged.values())
+
+
+class ChangeBus:
+    # This class tell every interested window when a database file is written.
+    # Subscribers are called as callback(changes, seqs) right after the commit,
+    # on the thread that wrote. seqs is (first, last) for a write made here:
+    # its change log entries are those after first up to last. It is None for
+    # changes relayed from other processes.
+
+    def __init__(self):
+        # Each entry is path -> list of callbacks
+        self.subscribers = {}
+
+    def subscribe(self, path, callback):
+        key = os.path.abspath(path)
+        self.subscribers.setdefault(key, []).append(callback)
+
+    def unsubscribe(self, path, callback):
+        key = os.path.abspath(path)
+        callbacks = self.subscribers.get(key, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+        if not callbacks:
+            self.subscribers.pop(key, None)
+
+    def publish(self, path, changes, seqs=None):
+        # Copy the list so a callback can unsubscribe while being called
+        if not changes:
+            return
+        for callback in list(self.subscribers.get(os.path.abspath(path), [])):
+            callback(changes, seqs)
+
+
+change_bus = ChangeBus()
 
 # ============== HOTEL DATABASE ==============
 
 class HotelDatabase:
     # This class handle all room and reservation operations
+
+    # Change log entries kept for other processes to catch up with
+    CHANGE_LOG_KEEP = 10000
+    # More logged changes than this at once: reload the tables instead
+    CHANGE_LOG_BATCH = 500
+    # Prune only once this many entries past the limit piled up
+    CHANGE_LOG_PRUNE_EVERY = 1000
     
-    def __init__(self, username):
+    def __init__(self, username, profile=None):
         # Initialize the database
         self.conn = None
         self.cursor = None
         self.branch_db = f"{username}.db"
+        self.db_path = f"branch_database/{self.branch_db}"
+        self.profile = profile
+        self.has_fts = False
+        # Change log range of the last write_transaction, see ChangeBus
+        self.write_seqs = None
         self.connect_db()
 
+    def publish(self, changes, seqs=None):
+        # Tell every subscriber of this branch file what was written
+        change_bus.publish(self.db_path, changes, seqs)
+
+    @contextmanager
+    def write_transaction(self):
+        # transaction() that also notes which change log entries the write
+        # added. The write lock is held throughout, so nobody else adds any.
+        with transaction(self.conn):
+            first_seq = self.last_change_seq()
+            yield self.conn
+            self.write_seqs = (first_seq, self.last_change_seq())
+
+    def after_write(self, changes):
+        # Called after each write made through this object is committed
+        seqs = self.write_seqs
+        self.write_seqs = None
+        self.prune_change_log()
+        self.publish(changes, seqs)
+
+    def close(self):
+        # Give back the shared connection
+        if self.conn:
+            self.cursor.close()
+            connection_registry.release(self.db_path)
+            self.conn = None
+            self.cursor = None
+
     def connect_db(self):
         # Connect to the database
         try:
             if not os.path.exists("branch_database"):
                 os.makedirs("branch_database")
 
-            self.conn = sqlite3.connect(f"branch_database/{self.branch_db}")
-            self.conn.row_factory = sqlite3.Row
+            # Reuse the branch connection if another window already opened it
+            self.conn, is_new = connection_registry.acquire(self.db_path, self.profile)
             self.cursor = self.conn.cursor()
-            self.cursor.execute("PRAGMA foreign_keys = ON")
-
-            # Create rooms table
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS rooms(
-                    room_number INTEGER PRIMARY KEY AUTOINCREMENT,
-                    type TEXT,
-                    price_rate REAL,  
-                    status TEXT DEFAULT 'Available',
-                    capacity INTEGER,
-                    description TEXT
-                )
-            """)
-
-            # Create reservations table
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS reservations(
-                    guest_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guest_name TEXT NOT NULL,
-                    contact TEXT,   
-                    room_number INTEGER,
-                    checkin_date TEXT,
-                    checkout_date TEXT,
-                    payment_status TEXT,
-                    FOREIGN KEY (room_number) REFERENCES rooms(room_number)
-                )
-            """)
-            self.conn.commit()
+            if is_new:
+                # Bring the schema up to date (does nothing if already current)
+                run_migrations(self.conn, HOTEL_MIGRATIONS)
+
+            # Full-text search is missing if SQLite was built without FTS5
+            sql = "SELECT 1 FROM sqlite_master WHERE name = 'reservations_fts'"
+            self.has_fts = self.cursor.execute(sql).fetchone() is not None
         except sqlite3.Error as e:
             print(f"Database connection error: {e}")
 
@@ -75,6 +516,37 @@ class HotelDatabase:
             print(f"Error fetching available rooms: {e}")
             return []
 
+    def find_available_rooms(self, checkin, checkout, min_capacity=None, room_type=None, exclude_guest_id=None):
+        # Get rooms with no reservation overlapping [checkin, checkout).
+        # Dates are "yyyy-MM-dd" strings; cancelled reservations and rooms in maintenance are ignored.
+        # exclude_guest_id leaves out the reservation being edited.
+        try:
+            sql = """
+                SELECT * FROM rooms
+                WHERE status != 'Maintenance'
+                  AND NOT EXISTS (
+                      SELECT 1 FROM reservations
+                      WHERE reservations.room_number = rooms.room_number
+                        AND reservations.checkin_date < ?
+                        AND reservations.checkout_date > ?
+                        AND IFNULL(reservations.payment_status, '') != 'Cancelled'
+                        AND reservations.guest_id != ?
+                  )
+            """
+            params = [checkout, checkin, -1 if exclude_guest_id is None else exclude_guest_id]
+            if min_capacity is not None:
+                sql += " AND capacity >= ?"
+                params.append(min_capacity)
+            if room_type is not None:
+                sql += " AND type = ?"
+                params.append(room_type)
+            sql += " ORDER BY room_number"
+            self.cursor.execute(sql, params)
+            return self.cursor.fetchall()
+        except sqlite3.Error as e:
+            print(f"Error finding available rooms: {e}")
+            return []
+
     def get_room_by_number(self, room_number):
         # Get a specific room by room number
         try:
@@ -85,52 +557,452 @@ class HotelDatabase:
             print(f"Error fetching room: {e}")
             return None
 
+    def room_change(self, op, room_number):
+        # Describe a changed room, reading its new values
+        if op == "delete":
+            return Change("room", op, room_number, None)
+        room = self.get_room_by_number(room_number)
+        if room is None:
+            # Nothing left to show (it was never there or is gone)
+            return Change("room", "delete", room_number, None)
+        return Change("room", op, room['room_number'], room)
+
     def add_room(self, room_type, price_rate, capacity, description, status):
         # Add a new room to database
+        # Returns (success, message, list of changed rows)
         try:
-            sql = "INSERT INTO rooms (type, price_rate, capacity, description, status) VALUES (?, ?, ?, ?, ?)"
-            self.cursor.execute(sql, (room_type, price_rate, capacity, description, status))
-            self.conn.commit()
-            return True, "Room added successfully"
+            with self.write_transaction():
+                sql = "INSERT INTO rooms (type, price_rate, capacity, description, status) VALUES (?, ?, ?, ?, ?)"
+                self.cursor.execute(sql, (room_type, price_rate, capacity, description, status))
+                room_number = self.cursor.lastrowid
+            changes = [self.room_change("insert", room_number)]
+            self.after_write(changes)
+            return True, "Room added successfully", changes
         except sqlite3.Error as e:
-            self.conn.rollback()
-            return False, f"Error adding room: {e}"
+            return False, f"Error adding room: {e}", []
 
     def update_room(self, room_number, room_type, price_rate, status, capacity, description):
         # Update an existing room
+        # Returns (success, message, list of changed rows)
         try:
-            sql = "UPDATE rooms SET type = ?, price_rate = ?, status = ?, capacity = ?, description = ? WHERE room_number = ?"
-            self.cursor.execute(sql, (room_type, price_rate, status, capacity, description, room_number))
-            self.conn.commit()
-            return True, "Room updated successfully"
+            with self.write_transaction():
+                sql = "UPDATE rooms SET type = ?, price_rate = ?, status = ?, capacity = ?, description = ? WHERE room_number = ?"
+                self.cursor.execute(sql, (room_type, price_rate, status, capacity, description, room_number))
+            changes = [self.room_change("update", room_number)]
+            self.after_write(changes)
+            return True, "Room updated successfully", changes
         except sqlite3.Error as e:
-            self.conn.rollback()
-            return False, f"Error updating room: {e}"
+            return False, f"Error updating room: {e}", []
 
     def update_room_status(self, room_number, status):
         # Update only the status of a room
         try:
-            sql = "UPDATE rooms SET status = ? WHERE room_number = ?"
-            self.cursor.execute(sql, (status, room_number))
-            self.conn.commit()
+            with self.write_transaction():
+                sql = "UPDATE rooms SET status = ? WHERE room_number = ?"
+                self.cursor.execute(sql, (status, room_number))
+            self.after_write([self.room_change("update", room_number)])
             return True
         except sqlite3.Error as e:
-            self.conn.rollback()
             return False
 
+    # Occupied if a reservation that is not cancelled covers today, else
+    # Available. Rooms in maintenance keep their status.
+    # What a room's status should be today, from the reservations covering it
+    ROOM_STATUS_TODAY = """
+        CASE WHEN EXISTS (
+            SELECT 1 FROM reservations
+            WHERE reservations.room_number = rooms.room_number
+              AND reservations.checkout_date > date('now', 'localtime')
+              AND reservations.checkin_date <= date('now', 'localtime')
+              AND IFNULL(reservations.payment_status, '') != 'Cancelled'
+        ) THEN 'Occupied' ELSE 'Available' END
+    """
+    REFRESH_ROOM_STATUS_SQL = f"""
+        UPDATE rooms SET status = {ROOM_STATUS_TODAY}
+        WHERE room_number = ? AND status != 'Maintenance'
+    """
+
+    def refresh_room_status(self, room_number):
+        # Set the room status from its reservations, inside the caller's
+        # transaction (no commit). A room can hold several bookings on
+        # different dates, so removing one does not always free it.
+        self.cursor.execute(self.REFRESH_ROOM_STATUS_SQL, (room_number,))
+
+    def refresh_all_room_status(self):
+        # Bring every room's status up to today: guests arriving today make
+        # their room Occupied, checkouts free it. Call when a session starts
+        # and when the day changes. Rooms in maintenance are left alone.
+        # Returns the list of changed rows
+        sql = f"SELECT room_number FROM rooms WHERE status != 'Maintenance' AND status != {self.ROOM_STATUS_TODAY}"
+        try:
+            # Read first, the write lock is only taken when something is out of date
+            if not self.cursor.execute(sql).fetchall():
+                return []
+            with self.write_transaction():
+                stale = [row[0] for row in self.cursor.execute(sql).fetchall()]
+                self.cursor.executemany(self.REFRESH_ROOM_STATUS_SQL, [(room_number,) for room_number in stale])
+            changes = [self.room_change("update", room_number) for room_number in stale]
+            self.after_write(changes)
+            return changes
+        except sqlite3.Error as e:
+            print(f"Error refreshing room status: {e}")
+            return []
+
     def delete_room(self, room_number):
         # Delete a room from database
+        # Returns (success, message, list of changed rows)
         try:
-            sql = "DELETE FROM rooms WHERE room_number = ?"
-            self.cursor.execute(sql, (room_number,))
-            self.conn.commit()
-            return True, "Room deleted successfully"
+            with self.write_transaction():
+                sql = "DELETE FROM rooms WHERE room_number = ?"
+                self.cursor.execute(sql, (room_number,))
+            changes = [self.room_change("delete", int(room_number))]
+            self.after_write(changes)
+            return True, "Room deleted successfully", changes
         except sqlite3.IntegrityError as e:
-            self.conn.rollback()
-            return False, "Room is occupied. Please cancel the reservation first."
+            return False, "Room is occupied. Please cancel the reservation first.", []
         except sqlite3.Error as e:
-            self.conn.rollback()
-            return False, f"Error deleting room: {e}"
+            return False, f"Error deleting room: {e}", []
+
+    # ========== SEARCH OPERATIONS ==========
+
+    def search_reservations(self, query, limit=200):
+        # Find reservations whose words start with the typed words, best matches first
+        try:
+            if self.has_fts:
+                match = fts_query(query)
+                if not match:
+                    return []
+                sql = """
+                    SELECT reservations.* FROM reservations_fts
+                    JOIN reservations ON reservations.guest_id = reservations_fts.rowid
+                    WHERE reservations_fts MATCH ?
+                    ORDER BY reservations_fts.rank
+                    LIMIT ?
+                """
+                self.cursor.execute(sql, (match, limit))
+            else:
+                pattern = f"%{query.strip()}%"
+                sql = """
+                    SELECT * FROM reservations
+                    WHERE guest_name LIKE ? OR contact LIKE ? OR room_number LIKE ?
+                       OR checkin_date LIKE ? OR checkout_date LIKE ? OR payment_status LIKE ?
+                    ORDER BY guest_id
+                    LIMIT ?
+                """
+                self.cursor.execute(sql, (pattern,) * 6 + (limit,))
+            return self.cursor.fetchall()
+        except sqlite3.Error as e:
+            print(f"Error searching reservations: {e}")
+            return []
+
+    def search_rooms(self, query, limit=200):
+        # Find rooms whose type or description words start with the typed words
+        try:
+            if self.has_fts:
+                match = fts_query(query)
+                if not match:
+                    return []
+                sql = """
+                    SELECT rooms.* FROM rooms_fts
+                    JOIN rooms ON rooms.room_number = rooms_fts.rowid
+                    WHERE rooms_fts MATCH ?
+                    ORDER BY rooms_fts.rank
+                    LIMIT ?
+                """
+                self.cursor.execute(sql, (match, limit))
+            else:
+                pattern = f"%{query.strip()}%"
+                sql = "SELECT * FROM rooms WHERE type LIKE ? OR description LIKE ? ORDER BY room_number LIMIT ?"
+                self.cursor.execute(sql, (pattern, pattern, limit))
+            return self.cursor.fetchall()
+        except sqlite3.Error as e:
+            print(f"Error searching rooms: {e}")
+            return []
+
+    def query_rooms(self, text, limit=500):
+        # Run a search box query like "status:available type:suite price<2000" in SQL
+        filters, words = parse_query(text, ROOM_FIELDS)
+        where, params = compile_query(filters, words, ROOM_TEXT_COLUMNS)
+        try:
+            sql = f"SELECT * FROM rooms WHERE {where} ORDER BY room_number LIMIT ?"
+            self.cursor.execute(sql, params + [limit])
+            return self.cursor.fetchall()
+        except sqlite3.Error as e:
+            print(f"Error searching rooms: {e}")
+            return []
+
+    def query_reservations(self, text, limit=500):
+        # Run a search box query like "checkin:2026-10-01..2026-10-07 paid" in SQL.
+        # Plain words use the full-text index when there is one.
+        filters, words = parse_query(text, RESERVATION_FIELDS)
+        full_text = None
+        if self.has_fts:
+            full_text = ("guest_id IN (SELECT rowid FROM reservations_fts WHERE reservations_fts MATCH ?)", fts_query)
+        where, params = compile_query(filters, words, RESERVATION_TEXT_COLUMNS, full_text)
+        try:
+            sql = f"SELECT * FROM reservations WHERE {where} ORDER BY guest_id LIMIT ?"
+            self.cursor.execute(sql, params + [limit])
+            return self.cursor.fetchall()
+        except sqlite3.Error as e:
+            print(f"Error searching reservations: {e}")
+            return []
+
+    # ========== PAGED OPERATIONS ==========
+
+    # Columns each table can be paged by. Every one is backed by an index that
+    # ends with the primary key, so paging never sorts the whole table.
+    ROOM_PAGE_ORDERS = ("room_number", "status")
+    RESERVATION_PAGE_ORDERS = ("guest_id", "checkin_date")
+
+    def fetch_page(self, table, key, after_key, limit, order_by, after_value=NO_VALUE):
+        # Get up to limit rows that come after the row with primary key after_key.
+        # Uses keyset paging: (order_by, key) of the last row is the next start point,
+        # so with another order_by its value must be given as after_value. Taken
+        # from the last row read, it stays right even if that row is changed or
+        # deleted before the next page. NULL values sort first.
+        if order_by != key and after_key is not None and after_value is None:
+            # The last row had no value: finish the rows without one, then go
+            # on with the rest (a row value compared with NULL matches nothing)
+            sql = f"SELECT * FROM {table} WHERE {order_by} IS NULL AND {key} > ? ORDER BY {order_by}, {key} LIMIT ?"
+            rows = self.cursor.execute(sql, (after_key, limit)).fetchall()
+            if len(rows) < limit:
+                sql = f"SELECT * FROM {table} WHERE {order_by} IS NOT NULL ORDER BY {order_by}, {key} LIMIT ?"
+                rows += self.cursor.execute(sql, (limit - len(rows),)).fetchall()
+            return rows
+        if order_by == key:
+            sql = f"SELECT * FROM {table}"
+            params = []
+            if after_key is not None:
+                sql += f" WHERE {key} > ?"
+                params.append(after_key)
+            sql += f" ORDER BY {key} LIMIT ?"
+        else:
+            sql = f"SELECT * FROM {table}"
+            params = []
+            if after_key is not None:
+                if after_value is NO_VALUE:
+                    raise ValueError(f"Paging by '{order_by}' needs the {order_by} of the last row")
+                sql += f" WHERE ({order_by}, {key}) > (?, ?)"
+                params.extend([after_value, after_key])
+            sql += f" ORDER BY {order_by}, {key} LIMIT ?"
+        params.append(limit)
+        self.cursor.execute(sql, params)
+        return self.cursor.fetchall()
+
+    def iter_rooms(self, after_number=None, limit=200, order_by="room_number", after_value=NO_VALUE):
+        # Get one page of rooms after the given room number (and its order_by
+        # value, when not paging by room number)
+        if order_by not in self.ROOM_PAGE_ORDERS:
+            raise ValueError(f"Rooms cannot be paged by '{order_by}'")
+        try:
+            return self.fetch_page("rooms", "room_number", after_number, limit, order_by, after_value)
+        except sqlite3.Error as e:
+            print(f"Error fetching rooms: {e}")
+            return []
+
+    def iter_reservations(self, after_id=None, limit=200, order_by="guest_id", after_value=NO_VALUE):
+        # Get one page of reservations after the given guest ID (and its
+        # order_by value, when not paging by guest ID)
+        if order_by not in self.RESERVATION_PAGE_ORDERS:
+            raise ValueError(f"Reservations cannot be paged by '{order_by}'")
+        try:
+            return self.fetch_page("reservations", "guest_id", after_id, limit, order_by, after_value)
+        except sqlite3.Error as e:
+            print(f"Error fetching reservations: {e}")
+            return []
+
+    def iter_room_chunks(self, chunk_size=200, order_by="room_number"):
+        # Yield all rooms as lists of chunk_size rows, one query per chunk
+        after_number = None
+        after_value = NO_VALUE
+        while True:
+            rooms = self.iter_rooms(after_number, chunk_size, order_by, after_value)
+            if not rooms:
+                return
+            yield rooms
+            if len(rooms) < chunk_size:
+                return
+            after_number = rooms[-1]['room_number']
+            after_value = rooms[-1][order_by]
+
+    def iter_reservation_chunks(self, chunk_size=200, order_by="guest_id"):
+        # Yield all reservations as lists of chunk_size rows, one query per chunk
+        after_id = None
+        after_value = NO_VALUE
+        while True:
+            reservations = self.iter_reservations(after_id, chunk_size, order_by, after_value)
+            if not reservations:
+                return
+            yield reservations
+            if len(reservations) < chunk_size:
+                return
+            after_id = reservations[-1]['guest_id']
+            after_value = reservations[-1][order_by]
+
+    # ========== BULK OPERATIONS ==========
+
+    def column_defaults(self, table):
+        # Get {column: default value} for the columns of a table that have one
+        defaults = {}
+        for column in self.conn.execute(f"PRAGMA table_info({table})").fetchall():
+            if column['dflt_value'] is not None:
+                defaults[column['name']] = self.conn.execute(f"SELECT {column['dflt_value']}").fetchone()[0]
+        return defaults
+
+    def execute_bulk(self, sql, rows, columns, chunk_size, defaults=None):
+        # Run one statement for many rows with executemany, inside the caller's transaction.
+        # Rows can be tuples in column order or dicts keyed by column name; a key
+        # left out of a dict gets its value from defaults (else NULL), like a
+        # column left out of a single INSERT.
+        # A chunk that fails is retried row by row so only bad rows are skipped.
+        # Returns (list of rows written, list of (row index, error message)).
+        defaults = defaults or {}
+        written = []
+        errors = []
+        index = 0
+        for chunk in iter_chunks(rows, chunk_size):
+            params = []
+            for row in chunk:
+                if isinstance(row, dict):
+                    params.append(tuple(row.get(column, defaults.get(column)) for column in columns))
+                else:
+                    params.append(tuple(row))
+
+            self.cursor.execute("SAVEPOINT bulk_chunk")
+            try:
+                self.cursor.executemany(sql, params)
+                written.extend(params)
+            except sqlite3.Error:
+                # Throw away the partial chunk and find the bad rows
+                self.cursor.execute("ROLLBACK TO bulk_chunk")
+                for offset, param in enumerate(params):
+                    try:
+                        self.cursor.execute(sql, param)
+                        written.append(param)
+                    except sqlite3.Error as e:
+                        errors.append((index + offset, str(e)))
+            self.cursor.execute("RELEASE bulk_chunk")
+            index += len(params)
+        return written, errors
+
+    def add_rooms_bulk(self, rooms, chunk_size=500):
+        # Add many rooms in one transaction. Each room is (type, price_rate, capacity, description, status)
+        # Returns (number of rooms added, list of (row index, error message))
+        columns = ("type", "price_rate", "capacity", "description", "status")
+        sql = "INSERT INTO rooms (type, price_rate, capacity, description, status) VALUES (?, ?, ?, ?, ?)"
+        try:
+            with self.write_transaction():
+                written, errors = self.execute_bulk(sql, rooms, columns, chunk_size, self.column_defaults("rooms"))
+            self.after_write([Change("room", "reload", None, None)] if written else [])
+            return len(written), errors
+        except sqlite3.Error as e:
+            return 0, [(None, f"Error adding rooms: {e}")]
+
+    def add_reservations_bulk(self, reservations, chunk_size=500):
+        # Add many reservations in one transaction and mark their rooms Occupied.
+        # Each reservation is (guest_name, contact, room_number, checkin_date, checkout_date, payment_status)
+        # Returns (number of reservations added, list of (row index, error message))
+        columns = ("guest_name", "contact", "room_number", "checkin_date", "checkout_date", "payment_status")
+        sql = "INSERT INTO reservations (guest_name, contact, room_number, checkin_date, checkout_date, payment_status) VALUES (?, ?, ?, ?, ?, ?)"
+        try:
+            with self.write_transaction():
+                written, errors = self.execute_bulk(sql, reservations, columns, chunk_size,
+                                                    self.column_defaults("reservations"))
+
+                # Update the status of every room that got a reservation
+                room_numbers = {(row[2],) for row in written}
+                self.cursor.executemany(self.REFRESH_ROOM_STATUS_SQL, room_numbers)
+            if written:
+                self.after_write([Change("reservation", "reload", None, None), Change("room", "reload", None, None)])
+            return len(written), errors
+        except sqlite3.Error as e:
+            return 0, [(None, f"Error adding reservations: {e}")]
+
+    def update_room_status_bulk(self, updates, chunk_size=500):
+        # Change the status of many rooms in one transaction. Each update is (room_number, status)
+        # Returns (number of updates applied, list of (row index, error message))
+        columns = ("status", "room_number")
+        sql = "UPDATE rooms SET status = ? WHERE room_number = ?"
+        # Reorder to match the placeholders of the UPDATE statement
+        params = ((row["status"], row["room_number"]) if isinstance(row, dict) else (row[1], row[0])
+                  for row in updates)
+        try:
+            with self.write_transaction():
+                written, errors = self.execute_bulk(sql, params, columns, chunk_size)
+            self.after_write([Change("room", "reload", None, None)] if written else [])
+            return len(written), errors
+        except sqlite3.Error as e:
+            return 0, [(None, f"Error updating room status: {e}")]
+
+    # ========== CHANGE TRACKING ==========
+
+    def data_version(self):
+        # Value that changes whenever another connection commits to the file.
+        # Falls back to the file times if the pragma cannot be read.
+        try:
+            return self.conn.execute("PRAGMA data_version").fetchone()[0]
+        except sqlite3.Error:
+            times = []
+            for path in (self.db_path, self.db_path + "-wal"):
+                times.append(os.path.getmtime(path) if os.path.exists(path) else None)
+            return tuple(times)
+
+    def last_change_seq(self):
+        # Sequence number of the newest logged write (0 if none)
+        try:
+            row = self.conn.execute("SELECT COALESCE(MAX(seq), 0) FROM change_log").fetchone()
+            return row[0]
+        except sqlite3.Error as e:
+            print(f"Error reading change log: {e}")
+            return 0
+
+    def changes_since(self, after_seq):
+        # Get (newest sequence number, list of Change) for the writes logged after
+        # after_seq, with the current values of every changed row. Too many
+        # changes, or changes already pruned from the log, give a reload instead.
+        # On error nothing is returned and after_seq is kept, to retry later.
+        try:
+            sql = "SELECT MIN(seq), MAX(seq), COUNT(*) FROM change_log WHERE seq > ?"
+            first_seq, last_seq, count = self.conn.execute(sql, (after_seq,)).fetchone()
+            if not count:
+                return after_seq, []
+
+            # Sequence numbers have no holes, so a jump means entries were pruned
+            missed = first_seq > after_seq + 1
+            if missed or count > self.CHANGE_LOG_BATCH:
+                return last_seq, [Change("room", "reload", None, None), Change("reservation", "reload", None, None)]
+
+            sql = "SELECT entity, row_key, op FROM change_log WHERE seq > ? AND seq <= ? ORDER BY seq"
+            logged = [Change(row['entity'], row['op'], row['row_key'], None)
+                      for row in self.conn.execute(sql, (after_seq, last_seq))]
+
+            # Read each changed row once, as it is now
+            changes = []
+            for change in merge_changes(logged):
+                if change.op == "delete":
+                    changes.append(change)
+                elif change.entity == "room":
+                    changes.append(self.room_change(change.op, change.key))
+                else:
+                    changes.append(self.reservation_change(change.op, change.key))
+            return last_seq, changes
+        except sqlite3.Error as e:
+            print(f"Error reading change log: {e}")
+            return after_seq, []
+
+    def prune_change_log(self):
+        # Forget all but the newest log entries. Checked with a read first, so
+        # the write lock is only taken when there is something to delete.
+        try:
+            sql = "SELECT MAX(seq) - MIN(seq) FROM change_log"
+            span = self.conn.execute(sql).fetchone()[0]
+            if span is None or span < self.CHANGE_LOG_KEEP + self.CHANGE_LOG_PRUNE_EVERY:
+                return
+            with transaction(self.conn):
+                sql = "DELETE FROM change_log WHERE seq <= (SELECT MAX(seq) FROM change_log) - ?"
+                self.conn.execute(sql, (self.CHANGE_LOG_KEEP,))
+        except sqlite3.Error as e:
+            print(f"Error pruning change log: {e}")
 
     # ========== RESERVATION OPERATIONS ==========
 
@@ -154,59 +1026,77 @@ class HotelDatabase:
             print(f"Error fetching reservation: {e}")
             return None
 
+    def reservation_change(self, op, guest_id):
+        # Describe a changed reservation, reading its new values
+        if op == "delete":
+            return Change("reservation", op, guest_id, None)
+        reservation = self.get_reservation_by_id(guest_id)
+        if reservation is None:
+            return Change("reservation", "delete", guest_id, None)
+        return Change("reservation", op, reservation['guest_id'], reservation)
+
     def add_reservation(self, guest_name, contact, room_number, checkin_date, checkout_date, payment_status):
-        # Add a new reservation to database
+        # Add a new reservation and update the room status in one transaction
+        # Returns (success, message, list of changed rows)
         try:
-            sql = "INSERT INTO reservations (guest_name, contact, room_number, checkin_date, checkout_date, payment_status) VALUES (?, ?, ?, ?, ?, ?)"
-            self.cursor.execute(sql, (guest_name, contact, room_number, checkin_date, checkout_date, payment_status))
-            self.conn.commit()
+            with self.write_transaction():
+                sql = "INSERT INTO reservations (guest_name, contact, room_number, checkin_date, checkout_date, payment_status) VALUES (?, ?, ?, ?, ?, ?)"
+                self.cursor.execute(sql, (guest_name, contact, room_number, checkin_date, checkout_date, payment_status))
+                guest_id = self.cursor.lastrowid
+                self.refresh_room_status(room_number)
 
-            # Update room status to Occupied
-            self.update_room_status(room_number, "Occupied")
+                changes = [self.reservation_change("insert", guest_id), self.room_change("update", room_number)]
 
-            return True, "Reservation added successfully"
+            self.after_write(changes)
+            return True, "Reservation added successfully", changes
         except sqlite3.Error as e:
-            self.conn.rollback()
-            return False, f"Error adding reservation: {e}"
+            return False, f"Error adding reservation: {e}", []
 
     def update_reservation(self, guest_id, guest_name, contact, room_number, checkin_date, checkout_date, payment_status, old_room_number):
-        # Update an existing reservation
+        # Update an existing reservation and its room statuses in one transaction
+        # Returns (success, message, list of changed rows)
         try:
-            sql = "UPDATE reservations SET guest_name = ?, contact = ?, room_number = ?, checkin_date = ?, checkout_date = ?, payment_status = ? WHERE guest_id = ?"
-            self.cursor.execute(sql, (guest_name, contact, room_number, checkin_date, checkout_date, payment_status, guest_id))
-            self.conn.commit()
+            with self.write_transaction():
+                sql = "UPDATE reservations SET guest_name = ?, contact = ?, room_number = ?, checkin_date = ?, checkout_date = ?, payment_status = ? WHERE guest_id = ?"
+                self.cursor.execute(sql, (guest_name, contact, room_number, checkin_date, checkout_date, payment_status, guest_id))
+                changes = [self.reservation_change("update", guest_id)]
 
-            # If room number changed, update room status
-            if old_room_number != room_number:
-                self.update_room_status(old_room_number, "Available")
-                self.update_room_status(room_number, "Occupied")
+                # Dates, payment or room may have changed, so check both rooms again
+                self.refresh_room_status(room_number)
+                changes.append(self.room_change("update", room_number))
+                if str(old_room_number) != str(room_number):
+                    self.refresh_room_status(old_room_number)
+                    changes.append(self.room_change("update", old_room_number))
 
-            return True, "Reservation updated successfully"
+            self.after_write(changes)
+            return True, "Reservation updated successfully", changes
         except sqlite3.Error as e:
-            self.conn.rollback()
-            return False, f"Error updating reservation: {e}"
+            return False, f"Error updating reservation: {e}", []
 
     def delete_reservation(self, guest_id):
-        # Delete a reservation from database
+        # Delete a reservation and free its room in one transaction
+        # Returns (success, message, list of changed rows)
         try:
-            # Get the room number first
-            reservation = self.get_reservation_by_id(guest_id)
-            if reservation:
+            with self.write_transaction():
+                # Get the room number first
+                reservation = self.get_reservation_by_id(guest_id)
+                if not reservation:
+                    return False, "Reservation not found", []
                 room_number = reservation['room_number']
 
                 sql = "DELETE FROM reservations WHERE guest_id = ?"
                 self.cursor.execute(sql, (guest_id,))
-                self.conn.commit()
 
-                # Update room status back to Available
-                self.update_room_status(room_number, "Available")
+                # Free the room unless another reservation covers today
+                self.refresh_room_status(room_number)
 
-                return True, "Reservation deleted successfully"
-            else:
-                return False, "Reservation not found"
+                changes = [self.reservation_change("delete", reservation['guest_id']),
+                           self.room_change("update", room_number)]
+
+            self.after_write(changes)
+            return True, "Reservation deleted successfully", changes
         except sqlite3.Error as e:
-            self.conn.rollback()
-            return False, f"Error deleting reservation: {e}"
+            return False, f"Error deleting reservation: {e}", []
 
 
 # ============== ACCOUNT DATABASE ==============
@@ -214,10 +1104,11 @@ class HotelDatabase:
 class AccountDatabase:
     # This class handle all admin and branch operations
     
-    def __init__(self):
+    def __init__(self, profile=None):
         # Initialize the database
         self.conn = None
         self.cursor = None
+        self.profile = profile
         self.connect_db()
 
     def connect_db(self):
@@ -226,27 +1117,20 @@ class AccountDatabase:
             self.conn = sqlite3.connect("accounts.db")
             self.conn.row_factory = sqlite3.Row #View rows by name instead of index
             self.cursor = self.conn.cursor()
+            apply_storage_profile(self.conn, self.profile)
 
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS admin_table (
-                    admin_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    password TEXT NOT NULL
-                )
-            """)
-
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS branches_table (
-                    uid INTEGER PRIMARY KEY AUTOINCREMENT,
-                    username TEXT UNIQUE NOT NULL,
-                    address TEXT NOT NULL,
-                    contact TEXT NOT NULL,
-                    password TEXT NOT NULL
-                )
-            """)
-            self.conn.commit()
+            # Bring the schema up to date (does nothing if already current)
+            run_migrations(self.conn, ACCOUNT_MIGRATIONS)
         except sqlite3.Error as e:
             print(f"Database connection error: {e}")
 
+    def close(self):
+        # Close the accounts connection
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+            self.cursor = None
+
     # ========== ADMIN OPERATIONS ==========
 
     def check_existing_admin(self):
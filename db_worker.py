@@ -0,0 +1,104 @@
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
+
+
+# ============== TASK ==============
+
+class DatabaseTask(QObject):
+    # This class is the pending result of one call sent to the database thread.
+    # finished gets the return value and failed the error message, both on the
+    # GUI thread.
+
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, call, parent=None):
+        super().__init__(parent)
+        self.call = call
+
+
+# ============== WORKER ==============
+
+class DatabaseWorker(QObject):
+    # This class live on the database thread and run the calls one by one.
+    # The database is opened on first use so its connection belongs to this
+    # thread (SQLite connections cannot be shared between threads).
+
+    def __init__(self, open_database):
+        super().__init__()
+        self.open_database = open_database
+        self.db = None
+
+    def run_task(self, task):
+        if self.db is None:
+            self.db = self.open_database()
+        try:
+            result = task.call(self.db)
+        except Exception as e:
+            print(f"Database task error: {e}")
+            task.failed.emit(str(e))
+            return
+        task.finished.emit(result)
+
+    def stop(self):
+        # Close the connection on the thread that opened it, then end the thread
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+        QThread.currentThread().quit()
+
+
+# ============== EXECUTOR ==============
+
+class DatabaseExecutor(QObject):
+    # This class run database calls on one background thread so a slow disk or
+    # a locked file never freezes the window. Calls run in the order they were
+    # submitted, so a reload asked for after a write sees that write.
+    #
+    #     executor.submit(lambda db: db.add_room(...), self.room_added)
+
+    # True while at least one call is waiting or running (for a busy indicator)
+    busy_changed = pyqtSignal(bool)
+    # Internal: hands tasks and the stop request to the worker thread
+    task_submitted = pyqtSignal(object)
+    stop_requested = pyqtSignal()
+
+    def __init__(self, open_database, parent=None):
+        super().__init__(parent)
+        self.tasks = set()
+
+        self.worker_thread = QThread()
+        self.worker = DatabaseWorker(open_database)
+        self.worker.moveToThread(self.worker_thread)
+        self.task_submitted.connect(self.worker.run_task)
+        self.stop_requested.connect(self.worker.stop)
+        self.worker_thread.start()
+
+    def submit(self, call, finished=None, failed=None):
+        # Run call(db) on the database thread. The callbacks are connected
+        # before the call is sent, so a fast result cannot be missed.
+        task = DatabaseTask(call, self)
+        if finished:
+            task.finished.connect(finished)
+        if failed:
+            task.failed.connect(failed)
+        task.finished.connect(lambda result: self.task_done(task))
+        task.failed.connect(lambda error: self.task_done(task))
+        self.tasks.add(task)
+        if len(self.tasks) == 1:
+            self.busy_changed.emit(True)
+        self.task_submitted.emit(task)
+        return task
+
+    def task_done(self, task):
+        self.tasks.discard(task)
+        task.deleteLater()
+        if not self.tasks:
+            self.busy_changed.emit(False)
+
+    def shutdown(self):
+        # Finish the calls already submitted, close the connection and wait
+        # for the thread to end
+        if not self.worker_thread.isRunning():
+            return
+        self.stop_requested.emit()
+        self.worker_thread.wait()
@@ -0,0 +1,281 @@
+# Generated by build_resources.py from the icons folder.
+# Do not edit, run python build_resources.py again instead.
+
+ICONS = {
+    'add32.png': (
+        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\x00\x00\x02!IDATx\x01\xa4V\x01\x92\xc3'
+        b' \x08\x84\xfc\xef\xfa\x93\xf61\xd7\x9f\xb4\xff;o\x170\xd14\x99(\xcd\x08\x02"\xbb\x92^\xbcE\x92O)\xe5\x05\xa9\xe3\x95,#)\x02@\xfd\x05\xe0\x0f\xa4'
+        b'\x8e\x9f\x88U\x7fxN\x11\x10)\xf7\x16\xa1\xb8\xd3\xc5<t\xad\x93\x04T\x1c\xd4u\xf5\xae\xe1>3\x92\x04DT\xf8\xb8\xa6\x15\x8c\xcc\x9cQI\x02~r\x03\n'
+        b'\xb3h\x18\x16\x1cWI\x02M\xd3\xd1\x04Bk\xf4d\x1c\xda3\x93\x04\xc4\xe1\x88,\x02\xbb!$sO\x9a\x00a\x8aB\xaf$\xc2@hf|A\xa0\xe0\xe43'
+        b'P\xc7\xb9I\x02\x05\xd5\xa2\xed\xec\x02<I\xd2I\x12pT\xd7\xf2\xd5\x93#\xc0\x06\x006&X\x1c\xbd\xc7\xc8\x88\x18\x01|\xc7\xfdb\xf9\x83u0>\xc2q\xf4'
+        b'x\t\x81\x03\xef`\xefq\xc8*\xda\x05\xb6 a\xbbX\xa2pT\\\xa7-\xec\xa7\x04\x94\x143c\x056\xc6\x9a\x7fmp_\xb1\x0b\x8c\x1d\xd8]"}\xa9\xde'
+        b'#4\xae"\xfc\xe0\x945\x80d\xeb\xb01\xe0\xd5a\xd1\xea\xf8\xfc\x11\xb2\x1dw\x12\xf0\x84\xd0\x05\xc5\xc3\xb4\xc9\xd2\xccrE\x9fR\xdc\x95\xfe\x0b\xcch\xc1\xb5\xc0'
+        b'\x8cH\xa8\xd3A\x08\x89\xf6\xff\xc0\x9b\xdbx.\x97\xba\xe3dF2\xc6J\xd3>FLe\xd0\xa2\xda\x90\xb2 W\x1bib*\xefEUo*\xf2\x14\xab\xa4V'
+        b'\xa2I\xd96\xf2\xa5sA\xc5r$\x1e\x7f)\xe1\xb4\x13s\xbbL_,[\xecIl{\x050\x1eJ*08\x1a\x93\xae\xcb\x82(\x06\x1d)^\xcc5\x18\xd1'
+        b'\xc0\xc45\x13\xe6Q\xcc\xe9U\x13~p\x9b\x11\xa01#\xd6\xac\x8eE\xc7h\xa6\x94\xfd\x06\xa660\x19\x87\xc5\xe4\x1a\x06\xa8l6\xfd\x19Iu\x80\x00\xfcIp'
+        b'\xa6\xe4\xe1%\xd7\x01\x03U\xea\xa1\xbf\x1bO<\xd1\xb9\x0e4\xaf\xdcx4\xfe\t\xcei8G\xc0POkN-\xe4\x08\xec \xfc\xafb\x17\x1ct\xf3\x04\x9a\xb6'
+        b'\x7f\xd3\x90\x1c\x01\x82\xefP\x19\x1a<t\x97\x96#\xd0\xdf@Vp\xc7\xc7b#*G@\xf4}P\xfc(v\x90\xd6\x87R\x04\xf0u\xbf\xa1\xcc\x13R\x87],'
+        b'\xd5i\xe7+\xfb\x1f\x00\x00\xff\xff\x81\xa2R\x86\x00\x00\x00\x06IDAT\x03\x00\xbc\xfa\xd6W{\xf8\xca\x84\x00\x00\x00\x00IEND\xaeB`\x82'
+    ),
+    'adminblack24.png': (
+        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d'
+        b'\x88\x00\x00\x00\tpHYs\x00\x00\x00\xb1\x00\x00\x00\xb1\x01\xc6-I\x8d\x00\x00\x00\x19tEXtSoftware\x00www.inksc'
+        b'ape.org\x9b\xee<\x1a\x00\x00\x01\x97IDATH\x89\xbd\xd5?HUa\x1c\xc6\xf1\x8fvo\x17\xca\xcaAh\xa9\xc8A\xa4\xc9\x06\x89h\x8b\xa4'
+        b'%\x88\xc0A\x02\x07i\x0c\x97\xb6\xc6\xb6\xa01\xaa\xadphiit\x11\xa1\xc9@Q\xbcD\xdc\x12\xc2\x88 \x07\x11#\x10\xff\xe5m\xf8\x1d\xe9\xc0=\xf7z\xf4'
+        b'\\|\xe0\xc0\xcb\xe1\xf7>\xdf\xf79\xbf\xf7\xbc/\xf9u\x0f5\xcc`\xe8\x10\xf3Z\xea2\x1e\xe1\x13\xea\xf8\x8a\x1f\xc9x\x06\x0fp&\xaf\xd9Y\xdc\xc5c\xbc\xc5'
+        b'rbT\xc7G\x8c\xa1\x84\n\x1e\x8a4ul\xe2\x03\x9e`\x04\x83(g\x01\xde\xa5\x0c\xbf\xe3=\xc6\xd1\xd7bQ7\xf0\x0c\xf3\xd8M\xcd\x7f\x9dU<\x85\x05t'
+        b'\x1f\x14\xb5\x89*\x18\xc0\x17L\xee\xbf\xecL\x15\x94\xf1\x1b\xebG\x04l\xa1\x8aU\xa9O\x94\x06\x94D\xcc\xa2\xda\xc6\xc9f\x80\x9d6\x00v\x13\xaf\x06\xc0\t\xedI'
+        b"\xb0s\x1c\x80\xcc\x1e\xb4\x0b\xb0\xdd\x0cP\x12{\xb8\xa8:\x92\xa7\x01\xb0'R\x14UI\xa4h\x00lJm\xaf\x02\xea\xc2F\x16`\r\xe7\xdb\x00\xb8\x88_Y\x80"
+        b'E\\EO\x01\xf3^\xf4\x8b\xc3\xb1AW\xf0\x17O\x0b\x00^\x89#\xe3B\xb3\x827I\xc1\xf5#\x98\xdf\x14\x0b|\xde\xaa\xa8\x1b\xdf\xb0"\xa2\xe6\xd5\x80\xe8a'
+        b'\r\xa7\x0f*\xee\x17MZ\xc5\x9d\x1c\xe6\xf7\xf1\x07?\xc5\r\x98K}\xe2\\\xdf\x13=\xa9d\xd4t\xe1\x85\xf89\xab\xb8\x94\xd7|_\xe70\xe1\xff\r7*v'
+        b']Y\\\x99+\xc9\x02^\xe2\xd4a\xcd\xd3\xba\x85\xd9\x04\xb4\x88\xa5d<\x8dkE\x8c\xd3\xea\xc00>c\x0e\xb7\xf3N\xfc\x07\xc2SZ\x9f\xa2\xc6\x94\xa8\x00\x00'
+        b'\x00\x00IEND\xaeB`\x82'
+    ),
+    'adminwhite24.png': (
+        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\x00\x00\x02BIDATx\x01\xac\x951h\x14'
+        b'Q\x10\x86\xff9\x15\x0b\xc5B\x90\xd8\xda\x06\xd4B\x9bD\x10m\xb4\x15\xc5 B4\x95\x85\x18D\x88\xa2\x95vQ"bck\xe0P\x02\x11\x94@\x1a\xadR\x88'
+        b'\xa2\xa8\x10Q\xd2\x88\xb6\x16\xa64\x90\x90\xbb\xc97\xb7ay\x9b\xbb\r\xb9\xec-\xf3\xef\xcc\xce\x9b\xf9\xff\xf7\xde\xde\xbd\xadi\x8b\x97\xbb_\x06\xb3M\xf7?\xee>'
+        b'\xb2\xc56m*\x00\xd1\x11p\x17|\x87\xf0%8i\xd2\x01\xfc\xa4{3\x84\xc6\xdc\xbd\x8f\xe7R+\x08P<\x0c&\xdc\x9bo\xdd\xfd/]\xf3\x92\x8f\xe3\x17\xc1'
+        b'\xb0\x99\xed\x03{\x89\xafJ\x16\xe3\x13\x92~S\xfb\rL\x81\x07\xe0\x12\xb9\xdcr\x01\x06\xa6\xc9\xd6\xc1\x98d\x07%\xbd\x03\xb7%;\x0b\xe9i\xf0B\xeb\x17q\x1d'
+        b'\x0c4\xa4s\x92\x9e\x83\x7f\xe0\x04\xb8\x0fB(\xb8\x08\x95n\x91\xc7\xd2\xe7\xc8\xf6\xd3|\x14\\\x01\x8fA\x08\x91n\xb7\x9df3f6\n\xce0z\x08\x1c\x06s'
+        b'\x9em#aA\xc0Z\t\x8a\x17ZA\x977\xfa\x1a\xe0G\xb4eL\x11\xa9\xb0\x82,\xd3\xe3{\xfe\x0e\x82\x97\xa5\x85\xeb)\x12\x01\x93\xf5\x88:\x9dh"\x90\xa6'
+        b"\xab(ya\xa2\x89@\xaf\xe6_\xe4I\x04\\^e\xe2yo\x91'\x11\xb0\xa5\xa2v\xdeQ)H\x04\x14\xc7A%\xb2\xac\xd9\xca\xde\x81\xe2\xef\x9e\xd5T\xbc\xa7"
+        b"[\x9d\xae\xe0'\xbc\x03\x9cI\xbb\xf1\xdb2z\x8f\xd1x\n\x81Y|\xcbR\x81)2\xcb\xe0\x16\xd8\xae]\x8bFHg\xc2\x07\x88\xc3I\x9c#K\x92\xea\xfc\x94"
+        b'\xc6\xddW/\x12we\xcc\xfe&\r!\xf0\x1a\xae_\xc4-\xcb\x05\xe2\x89\x81Q\x99\xbeJ;\xa6i\xd8\x1f\xb9.\xf0\x94\xda\x058.\xe0s+\x08D\x96\x82\xe3'
+        b'\x92\xc7j\x16\x11\x893>\xd2\xa5\xa0&\xde\x1b\xdb.\xd1\xdb\xaf\rW\x9b@\x8c\x9b\xd5\xf6\xe0_\x81\xf7\xee\x8dG\x90t\xfc,\x92\x8f\xf7\xf5\x81\xba7\x90\x1b\xbe'
+        b'\xcd:\nD\x15\rC\xf8\x1bR\xed\x0e\xfe\x13d|\xe9\x880\xe2\x11\xf0\x85i?\xe1\xf1!\xb5\xe7\xf1\x1d\xadT \xaai|&\xad\x0e\x12\x7f\x06|\xab}\x1e'
+        b"\xe2\x88'y^1i\x88\x9a{\xc4\xa5\xb6\xa9@t\x99\xed\xfa\x08I\xac&\xf0\x9f\\\x9f\x9a\xbaNn\x10\xc46\x92*\xb75\x00\x00\x00\xff\xff%\x00R\xcf\x00"
+        b'\x00\x00\x06IDAT\x03\x00Wn\xc9\x88[\xaa\xddJ\x00\x00\x00\x00IEND\xaeB`\x82'
+    ),
+    'branchblack24.png': (
+        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\x00\x00\x02\xf5IDATx\x01\x8c\x93=\x88S'
+        b'A\x14\x85\xbf\x99\xac`i\xb3\x08\xa2\xb0\x08\x166\x82\x85\xb6&\xddn%\x82\xf6\xfe\x80\xd8\xda)"\xd9m-\xc4JQ\x10\x15\xb4\x17]AV1\x0f\xc1FA'
+        b'VA\xb0\xd3\xd6F\xacu\x93\xf1\xdc\xb9\xf3\xf2^\xd6l\xccd\xce\xdc;\xe7\xfe\xcd\xdc7\x89\xcc?\x92\\w@H\x01\xda6\xb9\xfa\x9c] \xb2\n\xd4\x00\x94'
+        b'\x06\x8d"\xa4\x95i\xb9\x8b\xea\xa2\x8eY\x9d]`D\x1f\x82`\x12\x8d\xe4%\x92T\xcdv\x9dL5D\x1dsbv\x01%\xb1\xd9\xc4AN\x14Y\x13o\x90\x98'
+        b"\xd0m\xef(As\x15\xc8I=\xcc\xd7\x11\x15`\x80\x05\x93\x0bU\xc9\xc7x\xe4\xa0@d\xd6\xf8'j\xd2Y9z\xcel\xf9\xcdD@\xd0\x8f\xf1\x98] \x07"
+        b'\xe4\xa5\x04\x94\xe0\x85\xb25\xb1eK\x9bh\xfb\xf3\x9f\x1bX\xac\x10\x84\x89\x99\x93ff\x90W\x1a\xc2\xf6\xed\x12\xb3o\xd0\xce\x9c\xf5\xe4\xad\x80.\x0etD\xe9Q'
+        b'\x10\x13\x84\x89\x06%\x99\x8d\xdb\t\xed\xa3\x14=\xe7\x80\xbeB\x0c\x90\xe8\xc3\xa8\xaf=\x14\x9f\xac\x97%\x16\xb9\x93\xf8\xbc\xcdP)\x87}\xd8\n\x82@OI%\x8b'
+        b'\x9e_\x96<\xa8Gh\xdf\xa0s\x1e\xb8+\xbc\x10n\nv\xede\xc97\xc2\x94Y\x12\x85)\xa6\x16U\xdf`\x15\x86\xf7\xc5_\x14\x0e@\xb8\x0c\x0c\xd8\xc5^\xc9'
+        b'e\xa5\xda\x90\xb4iE\xed\xc3\x9a4\x0cHH&\x81\xc2\xb7+\xfa78C\xa0\x0f\xd1\xfe\x99\xfb\x80#\xd0\xb16<\xd3\xe3\xb0\xa0C\xe2>\xc8G"Tz\x90'
+        b'f\xab\xb41\xf4\xc4\x9bl\xf1I\x94\xaceF]a\x99d\xbb\x91n\xc1Ii\xef!\xfe\x10\xff\x8e\xc4\x1e\xe0\xb8\x92\xbe\x95.5;J\xfa\x14\x8f\xf3\xbe\x9f\xb6'
+        b'F\x85\x1c\x94\xc1No\x95\xafK?\x06\xbf/\x8d\xe0\x86t\xcd\xb8\xa4W\xbeaFm\xba\xd2\x07\xd2\xad%\xdd\xa1\xb51\xd0\xe8\xf5\xd3\xa5\x1e\x81\x18\xe0\x13\xfe\xec'
+        b'\xe8\xc0\x05"\x8f`\xf1\x9a8\xfb\x1e\x12\x9d\xa7ZV\xcaI\xbd\x15\x89\xdc\x96\x0e\xf4\xc8/\x87\xaa\xd1Cq\x95E\x9a\x15xm\xaa\xf0Q\xa7\xfb\xca\x88\xb3\xf0\xf3'
+        b'4pUx\x05\x7f6\xd5\xae\x15\x82vZ\xe4c\x8a\x10\xf4\x89$\xcal\xf8Bd\x11\x88\xba\xe6\xba\xe2\x9e\x03G\x85o\x8e\xe1\x03\xc9%\xe1\x89\xb0\xa8v\x9d\xd2'
+        b'a\xa4&k\xc7@\x8ad\xea\xaa\xe6@\xbct\x0c5\x8fx|A\rA#r\x8f\x9a\x01K\x8c\xc6\x17\xe1\xb1\\t#\xf6\xbb9\xb8\x90A\xd3\xfft\x81\x8am'
+        b'#\xd9>/\x94\x02C\xd6!\xd9-\xa83\xa8-vz=\x94t\x8e\xf1H:\xb06A\xf09N\xdePn\xf05\x95\x02\xbe\xbb\x9d\x9d\xbc\xf2\xe6\x08\xee\x88\xd6'
+        b'\xe9\xd3aI\xd5\xb75x}\xf71b\xcc\xb7)7\xf8\xaa\x83\xba\xa2\xf5\xa5\x9c\x1ez\x06\xec\xd9\xfe"pE\xfc\x1c3\xc9u\x9a[\x98\xb8\x01\xbbaM=\xb8'
+        b'\x05\xd8\xd3\xb4\xd3}\x07\xac\r\x05\xa9\xc8\xcc\xd1\x1a\xf6=\xc6\xb6`1\x01\xed\x13\x7f\x01\x00\x00\xff\xff\xda"\x12\xbd\x00\x00\x00\x06IDAT\x03\x00\x90\xae\xce\xdb'
+        b'\x9c\xbc\x0b<\x00\x00\x00\x00IEND\xaeB`\x82'
+    ),
+    'branchwhite24.png': (
+        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\x00\x00\x02\xe6IDATx\x01\x94\x95=\xa8\x94'
+        b'G\x14\x86\x9fYRY\xa5\t\x81\x90\x80\x84\xa4H\x13H\x91\xb4\xb9\xdb%U\x08$\xbd\x89 \xb6v\x8a\xc8\xdem-\xc4JQ\x10\x15\xb4\x17\x7f@T\xdcE\xb0'
+        b'Q\x10\x15\x04\x0bA[;+\xad\xbc\xe3sf\xe6\xfb\xd9\xab,\xeba\xdey\xdfs\xce\xcc93\xf3\xad\xde\t\x1bZ^k;\xa3\xecN\x1e\x97\\\xdb\xc0]\xdb'
+        b'\x1d\xc6\x9bh%\x1a\xad\xa4\xc2\xe9\xf6\x04\xafm`\xa1\x99\x1bf\x16\nVb\xa8\xd0\xae)U\xdf\x85U0#3\x03~_\xdf\xa0\xed+T6\x97\t\x12s`'
+        b'^\xe2rh\x01-@X\xd3\xeb\x1b\xc4\xc2\x15\xa4\xae\xc6\xd2p@"x\xd9ZC\xb7\xa2\x056h\xd0V&\x8a5\xafh\xa7\xa9(\xa3\xa5\x8b\x1eO\x1b4X'
+        b'\xdd\xba\xea\r\xa5v5\xa6\xbb\xc8\x06\r\xc6[\xc7\x9a\xb0EL\x81\xa1qfX\x95\xd9\xa0Al\xef\xd0\x97\xd92\x12\x90\x08\xde\x1a\x8a\xa6\xee\xf0\xa0\xfa\xcc\x06t'
+        b'\xe6O0\x0b\xddLp\x00J\x972\x99\xa8c}\x83\xccS<\x05au\xdfR9\xb5\x90\x9c\x04S\x12r^&h:\x99\xa6\xb7\xbe\x81\xff\xea\xfe\x7f\x9f\xf3\x19'
+        b'\xf9\x868!\xb6x\xc7\x1f\xae\xbc+\xc0\nt6\xd69\x82\x1f\x05"XP\x1aXl[\xef\x9c\xce\x01\xf9;\xefz\xc8}\x0b\xf6\xf0\xb5~4\xb9%\xc7\x88\xf7'
+        b'\x8e\x0f+\xe7x\xf7\x85\x8d\xd5\x04\x16\x80\x9c\x0ca\t\xe1\x98X\xfc_y&\xe6o\xe1\x9b\x94\xd2\xcf\x90\xa6\xc0U\xef\x1a\x9b~T?\x14\x8e\xecs\x1099\xd5'
+        b'g\x01uA\x8bg\x8a\xa523\xd9\xa1<\x03)\xa5\xed=\xf0\x97\r\x1f\x98zm\xfe\xbe\xfc\xa5\xf8M\xdc\x13\x0e\xa3\xceu\xb4B\x8dj\xac\xceC(3\xf1Y'
+        b'\xbe7\x1c\xff\xb7x`\x8e\xa9\x7f\x85\x9d\x836<\xae\x8e\xb1W}+\x92:\xf5Y2>\x05U\x97g)\xfe\xc25\xc6\x13\x89\xce\x12\xd6\xe7\t0\x13\x98\xd8/'
+        b'_\x84\xc9Qor \x02\xfaW\xd4\x7f\xca1V\x9e%\xc1\x94\xf2+bI\xe8\xfa\\\xcaaD\x83;\xe1Z\xe4\x91\xfc\xdc\xd3\xee\x93\xff\xf1\x9aG\xe4\xdb\xfa\x8f'
+        b'\xe5\xae\x81\xd2ae\xac\xccn+\xf1\x8c{\xfb\xcc\xc4\x02\xd7\xf5\xae\x89_L\xbc\xb4\xd1K\xf5y\xb1W\\\xd6\xff\xca\xf8\xdf\xb5^\xf6\t\x88\x0f\x1f\x1cX\x90\t'
+        b'\x0e\xb4x\xaaK\xa9\x167\x08u6\xa6\x86(\x1c\x8b\x9e\xe9_\x12\xfb\x12|k!\xa5\xca\xb9\xea\xbcT\xb6\'\xcaJG#\x15u\r\xe5\x1b\xd0\xdd"\x95L?'
+        b"]\xe6\x05_\xe8\xfd'`\x9c,:\xe1\xbee-\x94\xf8\xc8Z\xa8\xbbA\xe4O\r\x07\xc8\xf1\xee\xa7\xf9\x81\xf8\x1e?\x11\x96\xfb)\xc4\x80Vh\x08\xac\xaa\xbe\x81"
+        b'\xa7\xb9\xe9\xda\x0b\xedDs\xfd7.=\xdc\xdf\xd5\xa4~M\x97f\xe1uh\x81\xf1\x9a\x96\xea\x1b4\x7fN\xe2\xa4\xc5\xaf\x10\x96y\x05\xc4\x9f\xc3xo\x91\xe2g'
+        b'*\x13\xa0X\xa9\x9d\xc2\xff\x14\xf8\x00\x00\x00\xff\xff\xbd\x8c[Y\x00\x00\x00\x06IDAT\x03\x00\xef\x13\x1b\xa3\xc0\xf7\x1e\xe1\x00\x00\x00\x00IEND\xaeB`'
+        b'\x82'
+    ),
+    'delete16.png': (
+        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d'
+        b'\x88\x00\x00\x00\tpHYs\x00\x00\x00v\x00\x00\x00v\x01N{&\x08\x00\x00\x00\x19tEXtSoftware\x00www.inksc'
+        b'ape.org\x9b\xee<\x1a\x00\x00\x01~IDAT8\x8d\x95\x90\xb1K[Q\x14\xc6\x7f\xf7\xbc\xf7\xee3\x93C\xa1C\xe7\xe2\x14tqq\xafX\xa1'
+        b'\x15!\x08\x19E\xccPRGE\n\xc6\xc9\xa1\xffA\x17\x11\x1a\xda\x82\x94B\x87.\x82\x08\n\xba\x08\x0e\x82\x88\xa5S;$\x1aC\x10L\xd4$\xf7t\xa8\xd1\xd0'
+        b'\x1b\xea\xeb7].\xdf\xf9\x9d\xef;\x86[U\x9fM\xf5K\\\x17\xdb\xb4\xb3\xa0o\x01\x03@\xa5\xda\xb1`b\xfb\xed:\x92\xb96\xa9\xd6\xa3\xed\xaf?\xe9\x98\x1a'
+        b'\xa3\x93\xd3jX\xa3\x97\xba\x00\xdd\x92\xb8o\xb5oocV\x00\x14\x1e\xf7t\xfdC\xaa\xfa\x04 \x04P\xc3\xa6Q\xd6\x91\xdb\xd8\xdd\x8a\xc2\x11\x7f\xdch[\xf8x'
+        b'W\x01\xe0r\xe6\xf5\xb0A\x17\xfc\ng\x1e\xc0\x84\xf1\x9b\xd4\x97b\xf1.\x01\x80q\xed\x11\x8c\x99\xf2\x00W7~\xfcT0\x01\x14\x01\xc4\x8f\xf7\x7f\xf2\x01"\xc4'
+        b'\xcb\x8b\x04C\xe9\xfb\x8d\xd9\x0c\xd7\xef\xdf\x81\xb5\t\x00\xce\xe1\xbe\xff\xc0\xe6s\x04Ci4\x9b\xa1\xfe\xf29rZ\x81\x1b\xbfN\xe8\xfd\x00\xcdO\x9fA\x0c6\x9f'
+        b'\xe3\xa2V\xc3\x96N\x89\x16\n\t+\x00\xa8\xe2\x0e\x8f \x08\xfel\xd9?\x00\xe7\x92\x03\x82\xc146\x9f\xa3\xb5\xb5\x83-\x95\xa9\xbf\x18C\xb3\x99\x84\x00\x11\xec\xab'
+        b"\x19Z\xdb\xbb4?\xac\x13\xcd\x17\xb0\xa52\x8d\x89\xf1\x9eG\xf4o\xe0\x1cWK+\xe8y\x15T\xc19\xa2\xf9\x02\xe1\xc0\xd3\xe4G\xd4\xca\xb9\x075\xc7'\x0fT"
+        b'\x10)\x03\xda\xd3\xf5\xb7\x02\xf9\xd5y\xfe\x06d\xab|\x86p\xa0\xc1\x84\x00\x00\x00\x00IEND\xaeB`\x82'
+    ),
+    'edit16.png': (
+        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\x00\x00\x00\tpHYs\x00\x00\x00v\x00\x00\x00'
+        b'v\x01N{&\x08\x00\x00\x00\x19tEXtSoftware\x00www.inkscape.org\x9b\xee<\x1a\x00\x00\x00\xfbI'
+        b'DAT8\x8d\x95\xd1\xc1+\x84A\x18\xc7\xf1\x0f\xbd\xb5\x89l\xca\xd1\xd9\x96\x94r\x91\xc8\xc9q\xef(\xed\xfe\x1dR\xcaA\x0e\xfe\x00wEN\xae\xaeJ\xd9\xf6'
+        b'\xc0\x8d\xc8\t\xb9\xc8\xc1AI{X\x87\x9d\xb7\xb6i^\xfb\xeeS\xd3\xd4o\xe6\xfb}\x9ef\x18\xae\xea\xb8\xc7\x17N15\x0c\xdc\xc0\x1bV1\x89c\x9c\x8d`'
+        b'\x02\xdb\xa8&\xa0k\xdc\x04\xf8\x00\xebx\ngU\xbcd\xb8\xc0o\x18-\xae\xac\x00\x86\x05\xbcC\x07\x95\x01c\xd7\xa2\xbc\x16\xf2:t\x0b\xe0\xcd\xd0a.\xcag'
+        b'\xf1\x8af\x1e\xa4\x04\xa5\xe1\x94`k\xc0\xd8\x8d\xb8[,\xb8\xc53f\n\xe05\xac\x14\t\xc6\xf0\x8d\x9d>I\xdcy\x1f{9\x90E\xdd\x17\xf1\x80\xc3 \xbe\xd2'
+        b'\xfb\xa1]\x9c\xc4\xa3\xa7\x04K\x98F\x1b\xf3x\xc4\x11\xceSpJ\xd0\n{\x1bw\xf8)\x02\xff\x13\xb4R\x17\x8bj\x14\x9fX.y\xbf\xa2\xf7N\x1f\xfd\xe1F'
+        b'\x08\xba%V\x07\x97\x18\xcf\xe1?\x1f_D\xa3(\xbeK\xf4\x00\x00\x00\x00IEND\xaeB`\x82'
+    ),
+    'hidepassword16.png': (
+        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d'
+        b'\x88\x00\x00\x00\tpHYs\x00\x00\x00v\x00\x00\x00v\x01N{&\x08\x00\x00\x00\x19tEXtSoftware\x00www.inksc'
+        b'ape.org\x9b\xee<\x1a\x00\x00\x01\x11IDAT8\x8d\xa5\xd2\xbf+\x04`\x1c\xc7\xf1\xd7\xa1\xce\xa5\xfc\xd8\x90\xc5\x8d\x8c\x06\x19\xecFe\x13\x19L'
+        b'\x92d0\xc9n\xb0\xe0\x1f\xc0dPRWF:\x832(\xff\xc0Y\xe82\x93\xa4\xcb\x19\xee\xab{\\\x8e\xba\xfb\xd6\xb3|\x9f\xcf\xfb\xf3|\x9e\xef\xf3\xd0fu'
+        b'\xb6\xc0d\xb0\x85<\xee[\x81\xf7Q\r\x13\x99&\xc2<\xa60\x82\n\xca\xb8\xc6&\xd6p\x80\xf50\xfaQ\x13\xb8\x8c\x8df\xeb\xa4\xd9\xc1Kx\xc73\xb61\x86'
+        b'\x1c\xfaP\x08\xf8-\xd6|#<\x8bO\\\xa0?z\xc38\x8e\xe8\xd5\xb8\xfb`$\xac`&5x\xc4-\xb2I\xef(\x89]Lb\xf7\xe0\x0e%\xe8\x88f\x16'
+        b'\xaf\x91B\x88G\x13\xb3\x92\xfa\xc0>B\xdb\x9d&X\x0c\xf8\x0c\x03\xeaOU\xc4aD\x87^\x9c\x87v\xa1q\x0e\xab\xe1\xfe\x12pAm\x809\x8c\xab\r\xb6\x1c'
+        b'\x9a\x95F\xf8;\xf6\xa9\xbf\x9f\xf0\n\x93)\xd4\x95\xc0{\x98\xc3\xae\xdaG\x99\xc6P\xec=\xe1\x06\x0f\xbf\x9d,\xe2U\xb1\xd3L\xf0_-c\xa3U\xb8\xad\xfa\x02'
+        b']\x8cK\xbe\xa4|p\x07\x00\x00\x00\x00IEND\xaeB`\x82'
+    ),
+    'hotel64.png': (
+        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\x00\x00\x06\xfdIDATx\x01\xec[=\x8e\x1c'
+        b'E\x14~\xb5\xe6\x0e\x9c\x80\x84\xe5\x06$\x8e,\x91\xc2\xce\xf0w\x06|\x05\xec#@\xb2\x17@X\xdeYC\x86d\x925\x01\xce\x9c \xe1hC$\xaf\x8c\x10\xa1'
+        b'\t\xac)\xdeW]\xd5\xf5\xf7^uuo\xef\xc2\xcanUM\xbd\xffz\xef\xab\x9a\xe9\xee\xe9\x99\x03z\xc3\x8f\xb7\x00\xbc\xe1\x1b\x80\xde\xee\x00m\x07\x1c=\xb4\xf7'
+        b"6;{\xb69\xb1\xb6\xecG'\xb6\x92\x956\xab\xf1\x9c\x03rQ\xf3\xdc\xd9\x8f\xb6\x0f\xed\xb7\x9c\xebc\x9e\xf3\xc2\xf5\x9d}\x0c\xd9\x11\xeb4\xbf Ww\x809"
+        b'\xa0#\xb2t\x9b\x84\xc3d2K\x94\x08\x98\xa3U\x0f\xce\xc1\xe5"\x04\xe5"\xbf3\x96~\xb2\x86\xbe\xe2\\\xef\xb0\xc9\xbb\xae[\xba\x03\x19t\xb0a\x99\xdaT\x00'
+        b'8\xe0\xa1\xea\x95)\xb8\xfa\xa4j\xe62\xed*\x8c\xa5*\x17^i\xcbE~9\x15\x1f6\xb0\xd5\xect\x00\x82\xc7\x95T\x14\x82\x13\xe3\x1c\xe9^j{j\xef\xf6'
+        b'\xda\x06;\xcd\xa7\r\x00\x8aOV7\x04\xeb\x1a\xe1\x9b\x19\xca\x81*\xb3\xcc\xa7f\xb6\x8f\xec\x87vO\xdf\xd4\x9a\xb6\x04>\xf0-\xad\xda\x00\xc89\x971d\x1e\xbe'
+        b'Yu\x19S\xaf|\xae\x96cB\xfa\x9a\xbe\xc0\xb0\xa8\x0b\xbem\x00f\xccb-\xddgs\xbcW\x0f=\x9d\xedo/\x1b\xf5\xbd\xf5rL\xa2\xc4\xd8\x1e\xd0\xfb$'
+        b"\x1ce\xfc\xca\x84cH\xbe\xab\x01@{z\xb2\xdb\x9a\xe7\xe8\xa0\xab\x04\xa6\xf4\xd81\x95\x93\x17\xa4:\xe1\x03\xd1YU\xf1S'\xb6\x00+\xf8^\x12\x00D\xe5\xe0"
+        b'\xbc\xa1O?7O@\xa1\xa74x\xf4T\x96\xd2\xd0\xcd\xe9{K\xffH\xf6\xe6\x16\xbd\x0c\xf2\x816\x81M\xc7\xcaw\x02\x80P`\x1a#\xa5\xc3$aLu\x0b'
+        b'\xe9"T\x99\xc1-\xa2_\xa5\xc8\xfc\x16\xd8\x1e=\xb0\xb7\xd1AK6|]P\xf9N\x00Pd#EUd\xfcV0iW\xccjqQ\xb1\x90\xc1\xb3\xda\x89'
+        b"\xc8\x18\xfa\x9aW\xfe\xccu\xa6I>*\xdf\t\x00\xe4(W+-\x10(&\xe3\xb7\xc0o\x85\xa8\x9b\x85oi|)\x00\xda\xa9\x96S\xf5\xf2\xc2\x9a'\xae\xa7\x9f"
+        b'\x99\x9f\x99}\xca=o\xa9[JG\xab\xa7\xde7J\x98\xba\x14\x00\xf2<\x1cu\xc5\xa6\x80\xfc\xa0\x9a"5L\xe9hX\xfb\xb0\xeeR\x00\xb0\xbf\xdap\xfd\xbd\xd9'
+        b'\xc5\xbbF\xd5pB!\x81\xfc\xfa\x1dB1/&\\S\xf5\x0b\xef\x93\xca\x1c}e\x00\xb8\xe8\xf2J8\x95\xf8"U+\x18\xfe\xf8\xb1\xf9\x8b\xc5\x00\x81\x87\xae\xf6'
+        b'\xc0\xfbT\xc6\xb3\x01\xd0j\xe2\x15\x1f\xaf\xd0R:\xcc\x98\xcaR:\x8b\x971\xc1S\x1d\xbfg\xcd\x9e{\xd2\xf2\x00\x03\xc7w\x01D\xb0M\xec"9\x1b\x00m\x91'
+        b'p\xee\xc59\x18\x1dt\x9cb\xa0 \x83\x0e\x1d\xf4 %\xd2\xe2\xd1\xc4\xc1\xa7\xd8g|\xab{\x9c\x9bq4nA\x06\xd2\x1as\x0c\xdb +\xc7\xd9\x00\x94\x01\x02'
+        b"?u\x1e\xae\xf5\xc3\xfa,F\x80'\xb6\x86\x00\xc0+\x1f\x89%\xdc2\x86^y\x1bV\xc8\xad\x03\x80<\xa2\x1cf\x89\x14\xeb\xc3~jxU\xc1NC{td"
+        b'~g\xea\xd8Gb\xb2j\xc7\xde\xa6R\x04A\x07\x00\xc1\xf4*\xc6Xd\xa40\x0f\xb8FY0\x89\x1d\xbb\xe0\xef\xc8\x8e\x14d\xd0\x8d\x02\x89\xe8\x00@O\x04i'
+        b'JASYi\x93\xf31\xb6\xa1T\x13\xe5i,\x89\xe6\xf7\xf7\xb9\xb4\xcd!\x83N\xf2Ie\x1d\x00\xa4\xe6\x91\xe6\x0f\xb2\xfb\x9c\xe6x\x7f\x1f5\x03\x05=S\x87'
+        b'\xb0\xf14\xb34\xbe\xe5\xbd,\xf1gKZv\xec\x0f\xdcg\xc1\xc5\xe8m\xe8\xc2\xcbF\x91F,\x06\x00\xf7\xfc\x8c\xf0p\xff\x7f@\xe3\xad0\x85\xa3\xba?\x0f\n'
+        b"?\x96\xfa\xe5\xf5\xd3\x0f\x9f\x98?x\xc5\xf1=\xe19G?\xe7\xbdt\x172\xa6'\xdbb\x00\xf8\xae+\xde\x7f\xdbx/\x1ef\xcc\xf4\xc9\xbd\xba\xaa\xe7\xac\xb9\x05"
+        b'5\x8f9\xc7\x82f;\xdd\x98\x1d/\xc8{\xe8\xa0\x9b\xc6\x89r1\x00\xbc\x85\x9b\xf7\xdf\xaa\xde\xaf\xb4\xa4\xf7*\x9f^\xcey\xe1\xea\xc3b\x00\xea\xf3z\x9e[\xd0'
+        b'\xd3-:\x03=j\xfd\xc2B\xc6\xbb$\xbf\x7f\x17k\x1e\x1c\xf8\xeaq\xd9\xd3\xa8\x89\'K\x9d\x00\x0cI\x8cE\x80\x10\x93\x85"\xef\x9df\x83\x930\r\xd1\xac\x08'
+        b"\x84#\rC\x8d'K\xb0\xed\x04\xa0N\x82\xb70\x8d\xb9\x8d\xealjj\x1d\xa2\xe5\x18'\xfbB\xb9\x15F\xd4%a\x06\xbd\xad\x9f,\r\nZ\xfet\xd8 B"
+        b'\xa8"\x8c\x1e\x91\x91\x85\x8d\xd2\x9d\x7f\xa9\x83\xa3W\xf8\xa1\xb4X\x9dWw\x00ri\xcd\xc6;\xa0~\x0e\xe0\x1d\x90|K\x0f3U\xafL\xcc\x9f\xeefNW\xc2'
+        b'`\xea\xac\xab\x00\xa0\x88\xcc\xb2d\xd2\xf3\xf8\x1a\xd7\x01c\xfc\xde\xd4G\x07\x91\xc8\xf3\xd7c\xaa\x00\xf8\xdd,\x06\x87\x90?\xc1_bD\xe7\xaf\x9bG\x1a<z\xa6'
+        b'\xef\xb9\x0e\x80\x93\xeby\xeaNt\xe9\x17=\xa6\x0e\x80\x0e\x9aK\x87\xb7\xf0\xb2\xeb\x00xs>-\xff\x89\xa9\x11a\xb5\xae\x030N\x91\xa6\x13i\xf1<>\xfa\x10'
+        b"5\xf5\\}K\xcf\xf8\xd0\xd4\x81_\x8d\x84k\x03\xd0S\xf6\x9a\xbe\x01@(6M'\xa5\xb5\x90\x8a<s\xcd\x18\xc5!\x88C\x1e\x81\x1fF\x008P\xe4\xc0\xa6"
+        b'\x85G\x03\x809Iv\xcc.\xd7\xc1\x8e\xaa\x82uh+\xe7\x81\x90Io\x00\x90X])\xb9\xbc\xc0\x08]\xa4\xe6\xa6z\xbd\x00\xcc\xa9\xb5\xc36\x9aD\xea\xff\r'
+        b'\x80[(\xf7\xd2\xce\x13\xf5\x8cf#\x91\xf9\xf0\xe7(.\xc4\x9c,\xa5\x9d`\xc6K\xff\x0e@R\x8d\xc0>\x89\xc3\xa9\xab5"\x13\x7fAB\xca\x91\xd5,O|'
+        b'\xfa\xa9\xb9\x17\xe6\x02\xadD\x9a\x14\xf7\x03\x90$\x95\x90q\x02\x7fe\x18\x052\xc5I?\xc7\xb7I\xb9\x16\x11\xd1s\xe9up\xfd\x00$\xd9Hk2\xe7W\x1f\xb5'
+        b'-"\xa2\'\x93L\x908\xf7_\xd3u@\x9e\xc9\xf5\xae\x93>\x9bv\x1d\x90g;\xcd5v\x80\xbc"\xb2tz\xa2e\x16\xc3l:\x0c\xad\xa8}^\r\x00\xf2'
+        b'\xe0}\xe1r\x9f\xb5\xb8\x01\x86\xb9\xd1\xfa\xbc\xba\x01\xe8\x0b73\xc9\x15\x82v-Lc\x9en\x00f\x96\xd6g\xde\x95\xbd\x1c\xca\x9fv\t\xb5\x05Z\xb6dic'
+        b'\x9e\xff\x10\x00=+]\xc3\xc5\xf8\x86s?\x9fR\xdd\xb7D\xa0\xbd8\x1f\x80N.\xa9\xb8\xd9\x00\xf4$W\xcd"\nbve\xcc\xa8\x11\x1d\xfb\x85e`\xc1s'
+        b'6\x00\xab%\x97$#\xc5\xec\xc8=\x89\xb0\x9c\xec\x04\xe0\xba\xd2\x89\x85H\xa0D\xedzT\x05\xc0\xd6\xffW(\x9fb:\x9dpU\xd6;\xe6\xf1\xa7\xb9\xcd\xc9~'
+        b"\xd6\x93\xa12\xe2FyBT\x01`\x1b\xff\x15\xc2>@/\x83\xb7\xf9\xb6\x87\xd3N\xe3\xcbSt\x19\xb1\x9d\xd2\x94'D\x15\x00\xec\xfe'w\xb1!\x05tI\xe9"
+        b'\n\x91\x14\xeeD%*\x9c\xd0\xc5\x0b\xce\x8eq\xe2\xabz\xa9j\xab\x00\xb0{\xfa\x85\x0c\xe1\xb77u\x12\x8d\x04\x1b\xaa:\x8e&\t@h\xfa\xcb\xc8\xb9&W['
+        b'\x11\xa3\x02\x00\xe7\xd4\xdd\xc6|\x10\xce\xb1\xd9\xb81&\xe3\xb77\x88\xe7\x9aP[Q\xff\xf2g\x83e\xa0\x9b\xcaW;\xe0\xa6\x16\xb24\xef\x1b\x0f\xc0\xd2\xc2\x83\xdf'
+        b'\xbf\x00\x00\x00\xff\xff\xab\xb1\xc9_\x00\x00\x00\x06IDAT\x03\x00\xb8H\x90\xaeP\x02\xd5\x96\x00\x00\x00\x00IEND\xaeB`\x82'
+    ),
+    'logout32white.png': (
+        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\x00\x00\x03eIDATx\x01\xb4\x97;h\x15'
+        b'A\x14\x86\xffY\x03Z\xa8\xd8\x88\x8a\n\x16b\x11\x10,\x04\x1b\x85\x80\xa0D\x8d\x85h\xf0\tZY%\x8d\xf67\xb7\xd6Bbc,T\x10\x15_\x8d\x89\x11\x05'
+        b'\xc1"\x85\xafB\x10-B\xc0\x80\x85\x8a\x8d\x10\xc1\xc2$\xe3wfv\xefc\xf3\xdaM\xae\x9b\xf3\xcf9s\xe6<\xfe\x99\xdd\xbb77Qzy\xef\xdb\xc1e\xf0'
+        b"\x1a\xcc)\xd3~:\xbf6\x8c\xa3/-SZ\x05\x02~\xcaW\xc8\xfc\x04.\x80]\xa0.>\x9a\xa9\x92\xe3/zjc'V\x05\x12\x7f\xc06\xecR\x92\x90\xb4"
+        b'Q\x89\xd8Al\x11G\xd5/\x17MS3\xd6\xe2R6\xae\xc0\x18\x00\xa5\xc4N\xe0b\xcc\xb0\x16\xb2\xfd\xf5\xba9\xaed\x16\xbf\xa4\xab \x93\x0e6t<\x9b\x14'
+        b'\xd1F\xa0\xa3ag]\xf4h,\xb8`\r\xe2{\t\xba\x062\xd9\x93\x19Et"\xaf\x1dq\xef\x12\xc5\x86\xb4\xb8\xeb~Lc+^\xed\xd1.6&r$\x15'
+        b'\x8b-\x10\x95m\xa5@h\x1a\x92Hi\xd2\x92y\xa4\x05\xd2r*xA \x8d,\x99\x98fej\xdcg\x1b\x91~f\xce"\xbaF\xc0\x17\x89\x9e#\x86gg'
+        b'\x1c\xfe],_\xc7\xeeF\x07\xe1\x13\xb1\x06\xdc\x04\x0f\xc0\xd1\xe0\xcc\r\x81\x805\xa7@n\xa9\xdc\x94\xc6C\xe0|.k\x0b\xf3\xb3\xe0\x18\x0f\xfb=H\x1c\xc4n'
+        b'\x92@`\xa9\xcd\x9b*6O\xbe\xd5\xa6Nm\xd8Fb/\xba&\x81\x80\xa0W\xf3\xb4\xd0\xe0D~LI\x879\xe1\xdfV\x16\xbd\nm$v\xa3\x83\xa4\x04\xfe'
+        b'\xdf\x19\xb497H\xf5\xfdt\xfb\x0eL\xd62\xdc\xe5v\xecD\xf3-`cI\x90\xdc\t\xfa\x8a\x82\xf2\xfb\xc0\x00D\xc6\xd2\xd3\xde\xcc\xfc\x0e\xf9\xdb\xd3\x13`Z'
+        b'PH:\xc3Q\x0e\x13^\x91|%j\xd5\xb5W\x85\x98\n1u\x9f\x94\xd9[\xc5\xc7\xd5\xb3(\xc9\xbe9\xfb#\x81\xe8\xc0WL\xd8I\x1aX\xb7R\x87\xa8\x8f'
+        b'8\xa0\xdc\xe5\x95\xb5q\xe9\xdb\xd7<Ip:\xb1\x18\xac\\\xd2\xcc)\x0f\xd6m\xbc\x07@uN8ek}\xf5\x18W\xa5\xcd\x18\x8dh\x86%\x8d\xfe\x95\xebM'
+        b"\x82Io'Gl1q\xce=\x03}\x05P\xb5\x18\xaa\xbe\xa0\xb1\xbd#\xb6zk\xe3\xf4\x15\xdf\xa9\xe5\xce}\x8c\xb7\xc0\x9c\x90\xc0\xd9r\xf1~\xd2\xde\x90\xcf\xd9"
+        b"\xdfz+N+{U\x9f\x84\xd8{\x9bG\x02f\xb1b\xaa\x95\xe0a\\'-{B\xcd\x95\xc0d\x82\xe1\x04\xcdG\xd0A\xea\x04\xc2ti\x03\r\xed\xd5\xdbX"
+        b'dC\xc3d\x12\xdb\x9a\xbfD\xd7\xa4e\x04h\xceM\xf4_\xbc\xf7\x87j\xd5\xa5qI\xb7$=\x04\xd6\xfc)\xbaIZB\x80\xa6\xe9\xbfu\xce\x8a\xdb\x7f\xd6\xa6'
+        b'\xc5Q\xff\x02\xe7@7x\x14\x9c\xb9\xa1%\x04\xacfhmFI@\x80\x93+\x99\xd4\xcap\x08,\x96{\x8e\x86\xed\x03 \xb9\x85\xf9\xa7\x10\xd0\x1b^\x12!\x8a'
+        b"{\xd9\x13\x8c\xf2C\x8fl\x1f\xc0M\xebm\x99t#0\x12\x92\xc9\x82}?$\x1a\x9fb\xbc\xf3\x0b\xf1\xf6\xc3\xe6H-\xca\x97'p\x83\xc6\xe1\x10\xd8\x80\xd5\x19"
+        b'\xa4\xe8\xc22\xed\xc3\xcfT^\xec\x97,)\xc0k\xd4\xb5\xb9\xc7\xc1.8$|<>\xd3\xb8\n\xa85K\x96\xb13w\xa6\xcd6\x90\x80`\xc5\x11c\x82\x93<'
+        b'\x8d.%v\x0b\x04\t\xfb\xd6\xda$\xa7+\x92>\xa8\xf1\xa2~\xe8\x8d\xce\xdcang\x16\x8dW\xf8\xab\xd4X\r\xdea7\xc9B\x93\x7f\x00\x00\x00\xff\xff\xc3\x88'
+        b'v\xd1\x00\x00\x00\x06IDAT\x03\x00\x95`x\xc9qu82\x00\x00\x00\x00IEND\xaeB`\x82'
+    ),
+    'password16.png': (
+        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\x00\x00\x00\tpHYs\x00\x00\x00v\x00\x00\x00'
+        b'v\x01N{&\x08\x00\x00\x00\x19tEXtSoftware\x00www.inkscape.org\x9b\xee<\x1a\x00\x00\x01!I'
+        b'DAT8\x8d\x95\xd2\xcf*Ea\x14\x05\xf0\x9f?u\xcb\xff\xc9MLDbH\xf1\x042U\x067S^@^\xc2#H<\x011`\xae\xbc\x80\x81\x90\x01'
+        b"%3\xdc\xc9\xcd\x9f\xe8N\xdc\x0c\xce\xbe\xfa\x1c\xe7\xdeX\xb5k\xb7\xbe\xb5\xd7\xb7\xf6wN\x87\xd6\x98\xc0b\xf4'\xb8o\xa3\xfd\x855\xd4\xb0\x1fU\xc3\xea_\x87"
+        b'\xc7c`&\xe1f\x83\x1b\xcf\x8b\xbb\n\x0c*\xe8\xc0V\xc2=a\x1e\x9f8O\xc5\x9d\x05\x06#x,\xe0\x1f0\xda:x6\xb8\x87\x17\xd4#rZ\xf58\xdb'
+        b'\x0b\xed\x0f\x94p\x8du\xf4\xb6\xb9\xa4\x0f\x1b\xa1-\xa5\x07K8j\x17/\x87\xe3\x98\xf9~\x83I\\\xfd\xc3\xe02f\xbe\r:\xd1\x88\xbe\x8c\xe5\xe8\xe7\xa2\x04W'
+        b"\x8e\xbe\xd1\x9c-\xfa\n\x15\x1c\xc8\xdeb3\xaa'\xb8J^\xdc]`\xb0+\xdb\xf1\x1d+\xb2\x7f\xe2\x03c\xa8\xe6\xc5\xcd\x04/\x18L\xe25\xff\x837\xbcF\xff"
+        b'\x98\xac9\x84\xe7\xd4h\x1aw\x18(H\x94\xc7`h\xa7\xd2\x15n\xb0\x833\x1c\xc6\xcdE\xe8\x8f\xb5\xb6qK\xb6_\x8a\x19,`\xb8\x85A\x15\xa7\xb8h\x12_'
+        b'q\x9a;H,(f\x00\x00\x00\x00\x00IEND\xaeB`\x82'
+    ),
+    'search16.png': (
+        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d'
+        b'\x88\x00\x00\x00\tpHYs\x00\x00\x00v\x00\x00\x00v\x01N{&\x08\x00\x00\x00\x19tEXtSoftware\x00www.inksc'
+        b'ape.org\x9b\xee<\x1a\x00\x00\x00\xecIDAT8\x8d\x95\xd2\xb12CA\x18\xc5\xf1\xdf\x18\x93\xc9\x13\xa0fB\x19}B\x95BR\x84\xb7\xf1\x00'
+        b'*z^ 3I\xa1V(\xa8\xe4\t\x8c"=F\'\x88\x19CA\xb1{M\xdc\xc9&\xeb_~\xe7~g\xcf\xde\xb3\xfc\xa5\x89\x01\x1e\xf0\x89\'\x9c\xa3e\x01'
+        b'\xcb8\xc5\x18\xc7\xd8\xc5\x06\x1a8\xc1\x0bz\xa8\xa6\x0c\xcep\x87\xf5\x84\xbe\x89\x11\xfa\xb3\xc4f<9\xb5\\P\x8b\xdfu\xca\xc2 \xc6\xce\xe1\x08\x17\xe5\xe1=v'
+        b'2\r\xeax-\x0f?\x84\x1f\x96\xc3*\xbeQ)\x06Kx\x8eB\x0ekx\xc7\xd7\xb4\xc1\r\x0e2\r\xf60\x8c)~i\t=o-X^\xc1#\xf6g\x89'
+        b'=\xa1\xe7\xda\x9c\xe5!\xaeR\xeeU\xe1\x91\x8c\x85\xaa\xeaqi\x1b\x87\xf1\xe4k\xbc\xa1;/fG\xe8y"\xdcs\x82\xcb\xa9\xd8\xdd\x1c\x93\x82Jb\xfe/\x93'
+        b'\x14m\xe1A\xe5\xb6\x97Lr\xfb\x03a\x972\xf0\x9b]q\xdb\x00\x00\x00\x00IEND\xaeB`\x82'
+    ),
+    'search32.png': (
+        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d'
+        b'\x88\x00\x00\x00\tpHYs\x00\x00\x00\xec\x00\x00\x00\xec\x01y(q\xbd\x00\x00\x00\x19tEXtSoftware\x00www.inksc'
+        b'ape.org\x9b\xee<\x1a\x00\x00\x02@IDATX\x85\xed\xd7\xcfo\xccA\x18\x06\xf0\xcfn[\x84+\x95\xfa\xd1\xd8(\x8d\x08\x12\x9c\x08\x0eD\x84'
+        b'\x86\x7f@OH\x08"q.\xe9\xdd\x81\xb8\xba9\x91\xe8M9hH8\xf4\xd2\x10\x07\x91\xf8\x15]\x12"MT%\xa4\xad\xec:\xccl\xbek\xb3\xdb~\xf7\xd7'
+        b'\xcd\x93Lv\x92}\xde\xe7}f\xe7\x9d\x99w3\x16G/\x8e\xe3\x08r\xe8\xc1\n|G\x1e\xe3\x18\xc5\x18\n)\xf4R\xa3\x1f#Q\xb4\x98b|\xc0Id\x9a'
+        b'M\x9c\xc10\xe6\xa3p\x01\x13\x18\xc2\x00vb\x1bN\xe02\x1e\xe1O\x99\x91\xc7\xe8n4\xf9r\xdc+\x13\x1b\xc3\xae\x14q\xdd\xb8\x86\xb9\x18\x97G_\xbd\xc93'
+        b'e\xc9\xe7q\xbe^\x01l\xc1\x9b\xa81\x895\xf5\x04\x0f\x97%?\xda@\xf2\x12\xba\xf1"j=A6MP\xbfd\xcf\x1bYy%r\x98\x8ezg\xd3\x04\x8c'
+        b'H\xf6\xbcU8\x155\xbf\x08\xb5U\x13\xeb\x85J/HWpi\xd1%\xd4AQ8\x9e5q!\x92&Z\x98\xbc\x84\xabQ\xfb\xc1B\xa4\xfb\x914\xd4\x06\x03'
+        b'{\xa2\xf6\x0c:k\x91^E\xd2\xb16\x18X*\xb9I7W#d\x85\xbb\x9dP,\xad\xc6,~\xc4y\xd5;!+<,%r;P\xd2\xed\xaae`:'
+        b'\xce{\xaa\x11\x9aD\x16+\xe3\xfcW-\xc2d\x9col\x83\x81>t\xc4\xf9\xdbZ\x06\xc6\xe3|\xa0\r\x06\x0e\xc6\xcf<\xbe\xd5"\x1d\x16\xaa\xf47V\xb5\xd8\xc0'
+        b'\xd3\xa8}c!RVh&\x8a\xb8\xd9\xc2\xe4{%\xfd\xc4\x8e\xc5\xc8\x83\x91<\x8b\xdd-H\xbe\x0c/\xa3\xe6\xdd4\x01\x19\xa1\x93)\xe2\xb3\xe6ND\x06\xb7\xa2'
+        b'\xd6\x94\xf0\xd6\xa4\xc2j\xa1X\x8ax\x87\xad\r$\xef\xc2mIGu\xba^\x81M\x92\x17l\x06\x97\xb0$e\xec\x01\xc9\xcf^\x1a\x1f\xb1\xa1^\x13k\x85N\xa6'
+        b'$\xf2\x1eW\xb0\xbd\x82\xd7)\x9c\xf3\x8bx&\xb9\xf3\xa7p\xa6l!\r\x99\xe8\xc09|\xf5\xef\x8a\xe6\xf0I\xd8\xa2\xb9\x8a\xef\n\xb8\x83uQ#\xd7\xac\tB'
+        b'\'3\x88\x87\xf8Y\x91\xb04&q]\xf5\xa3Vi"\xd7\x88\x89\x12:\x85\xdeq?\x0ea\x9ft\xfd\x7f.&o\x89\x89F\xd1+\xb9\xec\xf2\xda\xf3\xee\xfc7'
+        b'\x91\x1a\xe55\xf1\xba\xe9\x7f\xb2M\x98\x18\xc5\xf3\xbf\xa4\x83\xb2Yg\xe5\xe1j\x00\x00\x00\x00IEND\xaeB`\x82'
+    ),
+    'showpassword16.png': (
+        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d'
+        b'\x88\x00\x00\x00\tpHYs\x00\x00\x00v\x00\x00\x00v\x01N{&\x08\x00\x00\x00\x19tEXtSoftware\x00www.inksc'
+        b'ape.org\x9b\xee<\x1a\x00\x00\x00\xe6IDAT8\x8d\xd5\xd2=JCQ\x10\x05\xe0O\x1b}\x88\xc1J"\xdaha\xa1\xa9l\xc4\r\x88K\x08'
+        b'\xa8\x0b0[\x90\xb8\x95\x98\r\x08\x82`\x15\xfcil\xac\\\x80\xa9\x8che#J0\xbe\x14\x19\xe4\x12r\xb1\xce\xc0\xc0\xdc\xc3\x9c\xb9\xe70\xc3\xd4\xc7L\x06\xdf'
+        b'\xc0\x1e\xd6\xd0\xc7+\xee\xd1\xfbo\xe0\x0enPN\xc8\x1f\\a3G>\xc4\x17\xde\xd0\xc4\x16\n,\xa0\x863\xbc\xe3\x13\xf5q\xf2\x01\x06\xb8\xc6R`+h\xe3'
+        b"<jXF'l\xed\xa7\x03\x9e\xf1\x88\xb9\x04k'\xf2[\t\xbe\x88\xa7\xe0\x98\r\xb0\x08i\x83\xa4\xb1\xccX\xfd\xc6\x07\xe6S\xf08\x08\x17\xa8$\x16Z\x91\xd5"
+        b"\xc0*\xb8\xc4/\x8e\xc6'7\xc2[\x0f\xa7\xd8\x0eeE\xd4M\xa3u\xf6q\x92Qg\x17w&\xaf\xb1\xc4m\xf4\xfcE\xee\x90\xd6\x8d\x0ei5\xde/x@7"
+        b'\xf7\xf3\x14\xc7\x10\xfe\xe79C\x03\xeb\xd1\xd7\x00\x00\x00\x00IEND\xaeB`\x82'
+    ),
+    'userblack24.png': (
+        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\x00\x00\x02\x82IDATx\x01\xa4\x96;hT'
+        b'A\x14\x86\xbf\x9b\xc4DD\x14\x14m\xb4\xf0\x01*\x82\x0f\x14\x0b\xad\xc4\x14\x11lL\xa1\x10\xc1"\x8dX(\xa2\x856\x01#\xa2`\xa5h!\xa8!\xa5\xa0 J'
+        b'|4B\x08\x88\x8f\x10\xc1TQ1\x98FA\xb0\x90\xa0\x125\xbb\xebwn\xb6Hv\xef\xdd\r\xc9p\xfe\xf9gg\xfes\xfe\xbd3s\xd9m\xa0~\xdb\xaf\xe4'
+        b'\x86\xe8\x17\xe3\xe2\x83\xb8+\xbaE\xdd\xa8m\xd0\xc0MH\x9e%p\x02h\x11wLx+\xef\x10\xe7\xc5{\x9a\xd9$\xe7\x86\xfa\xdc\xb5+\x948\x0e\xc9\xfd\x12\xec'
+        b'a\ng\x8ap\xc4\xf1Fh<\x96\xc0r\xfe2\xe2\xe7\xa5"3\xf2\x0c\xf6\xa9>\xab\xc1-(\x1ev\xfcJTD\xe1\xb6\xc6+H\xf8\xe5\xc2U\x91\x19y\x06'
+        b"\x17U\xbf\x13\xe7D\xed(q\x12\x92\xceFh'\xa3\xe5\x19lu\xe1\xb5\xfa\x1f\xa2v,\xc4\xc3/\xe1\xd3l\xcb\x12Z\xa7b\xba\x99\xcd\xce,v\x7f\xdf\xc8\xf5"
+        b'c\x821`\xd4\xb3\x89<\x873\xa3\xda\xa0\xc4\x82\x90\x14\xe0O\xf0,\xa1<[Ym\xf0\x8f/e\xe9\xae2\xd7\xa3\xd5\n6\x88QQ\x15\xd5\x06\xf0]U\x9f'
+        b'he\t\xcb\xe4z\x11\xb7\x8c&x\x92%\xcc2P\xd7\xe8\xf5d+\xe3\\\xa3~\xbb\x0cI\xdf$\xbc \xa3\xe5\x18\x14\x1e\xab\xbd \x8e\x8a{b\xb7\xa8\x8cV'
+        b"'>\x8b\x16h>-gF\x8eA\xaa\xed\xb6\xef\x84\xe4\x907\xea%\tC\xc0u\xf1\xc0\xf1'H\x9e\x03c,d\xad\xf7!s\xff\xb1\xd52p9\x8d\x87i"
+        b'_b\xa7\xecKE\xbb\x97~=v\x1a\xafa\x82\xbd@\xeeY\xe5\x184E\xd2\x10\t\xbd&/\xf2%\xba$\x1f\x84E\xab\xe4\x80cb\xee\xa3\x9fC3(G'
+        b'\x8e43\xaa\r\x9aP8\xd9\xef\xb7\xdbI\t\xcf\xa1\xd4\x06t\x89G\xf0\xfb\xab\x1cpL\x97\xc6m4\x84\x06\x9f\x88~\xd7\xcc\xb5\x9f\x16\x95\x06-\x14B\x98\x0c'
+        b'\x9b\xbcB]\x9c\x83T#\x8a\x84&\xb4\xc3\x10\xb9x\xe8\x8e\xcaQi\xd0\x8b\x95\xdd\xdf\xed\xae\xc7\xfb \xcd*B\x1b9!\x8e-\x0bN1\xdd\xe0\x943\x1d4'
+        b'r@\x9e[L\xe5v\x98\x1c\xb5$\xdc\xc1\xa0\xc5\xac\x84$^\xaa\x1e\xb7\xe8)sm\x05"\xb7\xc7\xf4\xa8eM\xca\x06?\xd9\xe2\xb68\xcf@t\xf3\xc4@2'
+        b'U\xc0\x9a\x94\r\x1a\xc2 \x9d\x8d\xeb\x96\x0e\xe6\xd1\r\xa6\xc7X\xae9u\x06\xc5\xd4\xe0\x9bE\xe3\x1f\x834\xaf\x88\x1aQk\xda\x13\xc0:K\xc6\x8f\xb74\xffH'
+        b'`\x84bZ\x93\xff\x00\x00\x00\xff\xff\xfc\x0b\x07-\x00\x00\x00\x06IDAT\x03\x00\x08-\x83.\x8f;Pu\x00\x00\x00\x00IEND\xaeB`\x82'
+    ),
+    'username16.png': (
+        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d'
+        b'\x88\x00\x00\x00\tpHYs\x00\x00\x00v\x00\x00\x00v\x01N{&\x08\x00\x00\x00\x19tEXtSoftware\x00www.inksc'
+        b'ape.org\x9b\xee<\x1a\x00\x00\x01\x0bIDAT8\x8d\x95\xd2;KCA\x10\x86\xe1\'\x81\x807\x14\x15T\xbc\x14B,"v\xe2?\x08X\xa6'
+        b'\xb0\x11\xc4V,l\x95\xd4\xb6\xf6\x82\x8d\x9dh!\x82X\n\xd6^\x8a\x80\xa0"Z\x89\xe0\x05\x11\xb4\xd1.\x16\xe7$\x84x\xcej\xden\xe7\x9b\xf9vfgI'
+        b'f\x1e\xa7\xf8\xc2;\xf61\x95\x92\xfb\x8b\r\xdc\xa3\x84>\x8cc\x15o(\xfeU\\\xc4#z\x13\xb4Y<\xa1+d\xb0\x8b\x95\x80~$\x1a\xafN\xb6)!\x8f'
+        b"J\xc0\xa0\x82\x89\x90\xc1+F\x03\x06CqN*\xcb8F&A\x1b\x11=\xe4X\xc8\xa0\r\xe7\xd8DGC<\x8f\x0b\xac\x87\x8ak\xf4\xe3,n\xf5\x10'\xf8"
+        b'\xc6vRg\xcd\x81al\x89>\xcd\x01\xae\xe3\xf8$\xe6p\x89%<\'\xdd\\\xc0\x03\xd6\x90K\xd0s(\xc79\x85f\xb1\x13wXH\x9f\xac\xce"n\xd1\xde'
+        b'\x18,c\xe7\x1f\xc55\xf6\xe2N\xeb\xdc`\xba\x05\x83\x19\\\xd5\x0e=\xf8\x90\xbc\xfb42\xf8Dw\x16\x03xA\xb5\x05\x83\xaah\x13\x83?\xf6\xb6.\xc5g\x9f'
+        b'8\x93\x00\x00\x00\x00IEND\xaeB`\x82'
+    ),
+    'userwhite24.png': (
+        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\x00\x00\x02\x8dIDATx\x01\xac\x94;h\x14'
+        b'Q\x14\x86\xff\xb3D\x14\x11Demb\xe1\x0b\x15A\r\x8a\x85VA\x8b\x086\xa60\x10\xc1"\x8dX\x18\x82\x16\xda\x044H\x04+\x17-\x84h\xb0\x14\x14D'
+        b'\xf1\xd5\x08A\x10\x1f!\x82Vk|`\x1a\x85\x80\x88\x08\x16"\xc9\xf5;\xb3\xb3aggv\'d\xb3\x9c\x7f\xce\xb9\xf7\x9e\xf3\xff\xe7\xee\x9d;\x05\xe5\xfcB\x08'
+        b'\x87\xc050\x06~\x83Ip\x1b\\\xc8)\x8d\x96\x9b\n@r]\nO\xc9<\x05\x96\x82\x9b\xe0-\xd8\r\xce\xb3\xfe\x01l#nh\r\x05(\xbcL\xd5I\xc9'
+        b"\xeeJ\xdaof\x8e3\xf8c`+s'\xc0\x1a\x05\x95C\xf8\xb9\x928\xd32\x05 ?@\xf6Y\xcdj\x04\xb2\x1e\xf0\x8aq\xc2\x98\xbb\x01\x8a2\xfd\x91V]"
+        b"I,\xd6\x0c2\x05X\xbf\x08\xde\xa9\xa0s\xf8<\xeb'\xa1\x8f\xa6\xba\xf1)k$\xb0\x93\xcc\xd7t\xf8\x0b\x9fgc\x9c\x93\xe7\xec\xf2G=R\x02t\xb2\x9d\xa4"
+        b'\x15\xe0\r\xc85\x9a\x98\x92\xec\x8b$\xaf\xc3%-%\xc0\xf2\x92\xb8\xa3\xbf\xc4\xf3\xb5\x99F\x89Y\x02\xdf\xe2\xe4\xbd\xb1o\xea\xd8\xf1:\x1a\xda2+\xf9.R\xb9'
+        b')\x01\xb6\xfcC\xb2\x87\x92\x0eR\xbc\x1a\x9fg=\x9e\x00\xd1c\xf7\xf5`\xbe~*\x1a\x8f\xf0\xf4\x83.\xe1\xf3\xec\x92h\x88\xc6^(\xe3\x97)@\xf2#r\x87'
+        b"\xc0qvq\x07\xec#NX\x08\xff|\x87_\xb9h~\xc3O'\x16k\x06\x99\x02\xbe\x8e\x88\x7fk\xfa\xf8\x7f\x8f2~\x89\xc8\x04\xb8\n\xee\x81\xcfR\xdb3\xe6"
+        b'\xa7\xb8h\x1b\xc8\xcd\xfc\xffY\xe7*\xf9\xb3)\xec~\xf0\xf5\xa0=\xb8~\xe2n\xba\xdeD\x8c\xd3zI\x9d\x086<\xab\x02\t)\xa3\xc0\x8b&X\xb8\x05\x96\x9b'
+        b'4\xccg\xe3\x08q;q{\x1c\x0f\x13\x7fd\xces\xc6\xbd\x868e)\x81Jb\xe0vF\x1d\x0f\xb1\xfd.0hm\xf6\xc0\xcc\xbeG\xa8\xc4\x83\xc4]0r'
+        b"V\xc1w\xe4\x9f\xf3N\xc6\tK\x08@\xee\x07\x06\xb9\xbd'\xabhf~\x0e\x84\x8d\xad\x92cE2\xbc\x06\x91O\xce\xc1\xb0b\t\x01\xa6|\xbb\xa2\xa8\x03p\x1f"
+        b'\x98\x99\x87y.\xe8\xf0C\x916G\x1c\xd5\xb29\x01\xba\x1f\xe0\x00{Y8\x0c\x16f&\xaf\xed\x9d\ta\xa0J\x10\t@\xbe\x96\x89\x92I\xa3t\xf2\x84xA'
+        b"\x16\xd7\x8eBZ\x8a9\xe7^\xd3\x1d1\xe3\xf3\xd8\xb7\xe2\xaa\x1c\x11'b\x11\x17\x83 >\x9f\xe3\xd1\xa8\xb5G\x95\x03N\xd5\xee\xc0\xa6\x97\x99M\xb6\xc6-\x7fA"
+        b'\x9cc\x9a\xbb\x92\x10\xd8(\xa9\x0c\x16\xcb\xca\xb4\xee\x9c\xfa\x0f\x00\x00\xff\xff\x1d|\xf4\xc8\x00\x00\x00\x06IDAT\x03\x00\xe0\xa3\xdf!\xf1\xea\x00\xe1\x00\x00\x00\x00'
+        b'IEND\xaeB`\x82'
+    ),
+}
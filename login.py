@@ -1,8 +1,8 @@
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPixmap, QIcon
 from PyQt6.QtWidgets import QDialog, QMessageBox, QLineEdit
 from login_dialog import Ui_Dialog
 from database import AccountDatabase
+from resource_cache import get_icon, get_pixmap
 
 class LoginDialog(QDialog):
     def __init__(self):
@@ -29,8 +29,8 @@ class LoginDialog(QDialog):
         self.load_branch_combobox()
 
         # Show password buttons
-        self.showpass_icon = QIcon(f"icons/showpassword16.png")
-        self.hidepass_icon = QIcon(f"icons/hidepassword16.png")
+        self.showpass_icon = get_icon("showpassword16.png")
+        self.hidepass_icon = get_icon("hidepassword16.png")
         self.ui.showpassword_btn.setIcon(self.showpass_icon)
         self.ui.showpassword_btn.clicked.connect(self.showpassword)
         self.ui.showpassword_btn_2.setIcon(self.showpass_icon)
@@ -43,22 +43,40 @@ class LoginDialog(QDialog):
         # Determine which page to show
         self.handle_check_admin()
 
+    def reset(self):
+        # Ready the dialog for the next login (it is kept between sessions)
+        self.login_successful = False
+        self.logged_in_username = None
+        self.ui.userpassLogin_lineEdit.clear()
+        self.ui.adminPass_Login.clear()
+
+        # Branches may have been added or renamed, keep the last one chosen
+        last_branch = self.ui.branch_combobox.currentText()
+        self.load_branch_combobox()
+        self.ui.branch_combobox.setCurrentText(last_branch)
+
+        self.handle_check_admin()
+
+    def release(self):
+        # Close the account database (when the application exits)
+        self.db.close()
+
     def setup_icons(self):
         # Set logo
-        logo = QPixmap("icons/hotel64.png")
+        logo = get_pixmap("hotel64.png")
         self.ui.logo.setPixmap(logo)
 
         # Set branch icon
-        self.ui.pushButton_2.setIcon(QIcon("icons/branchwhite24.png"))
-        self.ui.user_btn.setIcon(QIcon("icons/branchblack24.png"))
+        self.ui.pushButton_2.setIcon(get_icon("branchwhite24.png"))
+        self.ui.user_btn.setIcon(get_icon("branchblack24.png"))
 
         # Set admin icons
-        self.ui.admin_btn.setIcon(QIcon("icons/adminblack24.png"))
-        self.ui.pushButton_6.setIcon(QIcon("icons/adminwhite24.png"))
+        self.ui.admin_btn.setIcon(get_icon("adminblack24.png"))
+        self.ui.pushButton_6.setIcon(get_icon("adminwhite24.png"))
 
         # Set input icons
-        self.ui.username_icon.setPixmap(QPixmap("icons/username16.png"))
-        password_icon = QPixmap("icons/password16.png")
+        self.ui.username_icon.setPixmap(get_pixmap("username16.png"))
+        password_icon = get_pixmap("password16.png")
         self.ui.password_icon.setPixmap(password_icon)
         self.ui.password_icon_2.setPixmap(password_icon)
         self.ui.password_icon_3.setPixmap(password_icon)
@@ -1,6 +1,6 @@
 # Form implementation generated from reading ui file 'login_dialog.ui'
 #
-# Created by: PyQt6 UI code generator 6.10.0
+# Created by: PyQt6 UI code generator 6.11.0
 #
 # WARNING: Any manual changes made to this file will be lost when pyuic6 is
 # run again.  Do not edit this file unless you know what you are doing.
@@ -59,7 +59,6 @@ class Ui_Dialog(object):
         self.logo = QtWidgets.QLabel(parent=self.frame)
         self.logo.setStyleSheet("background: transparent")
         self.logo.setText("")
-        self.logo.setPixmap(QtGui.QPixmap("../a1b7989f/hotel64.png"))
         self.logo.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         self.logo.setObjectName("logo")
         self.verticalLayout.addWidget(self.logo)
@@ -142,7 +141,6 @@ class Ui_Dialog(object):
         self.horizontalLayout_8.setObjectName("horizontalLayout_8")
         self.password_icon_3 = QtWidgets.QLabel(parent=self.frame_7)
         self.password_icon_3.setText("")
-        self.password_icon_3.setPixmap(QtGui.QPixmap("../392742d9/password16.png"))
         self.password_icon_3.setObjectName("password_icon_3")
         self.horizontalLayout_8.addWidget(self.password_icon_3)
         self.adminPassword_lineEdit = QtWidgets.QLineEdit(parent=self.frame_7)
@@ -163,9 +161,6 @@ class Ui_Dialog(object):
         self.showpassword_btn_3.setStyleSheet("background-color: transparent;\n"
 "border: none;")
         self.showpassword_btn_3.setText("")
-        icon = QtGui.QIcon()
-        icon.addPixmap(QtGui.QPixmap("../d746d753/hidepassword16.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
-        self.showpassword_btn_3.setIcon(icon)
         self.showpassword_btn_3.setAutoDefault(True)
         self.showpassword_btn_3.setObjectName("showpassword_btn_3")
         self.horizontalLayout_8.addWidget(self.showpassword_btn_3)
@@ -184,7 +179,6 @@ class Ui_Dialog(object):
         self.horizontalLayout_7.setObjectName("horizontalLayout_7")
         self.password_icon_4 = QtWidgets.QLabel(parent=self.frame_6)
         self.password_icon_4.setText("")
-        self.password_icon_4.setPixmap(QtGui.QPixmap("../392742d9/password16.png"))
         self.password_icon_4.setObjectName("password_icon_4")
         self.horizontalLayout_7.addWidget(self.password_icon_4)
         self.adminPassword_lineEdit_2 = QtWidgets.QLineEdit(parent=self.frame_6)
@@ -205,7 +199,6 @@ class Ui_Dialog(object):
         self.showpassword_btn_4.setStyleSheet("background-color: transparent;\n"
 "border: none;")
         self.showpassword_btn_4.setText("")
-        self.showpassword_btn_4.setIcon(icon)
         self.showpassword_btn_4.setAutoDefault(True)
         self.showpassword_btn_4.setObjectName("showpassword_btn_4")
         self.horizontalLayout_7.addWidget(self.showpassword_btn_4)
@@ -277,9 +270,6 @@ class Ui_Dialog(object):
         self.pushButton_2.setFont(font)
         self.pushButton_2.setStyleSheet("background-color: rgb(0, 0, 0);\n"
 "color: rgb(255, 255, 255);")
-        icon1 = QtGui.QIcon()
-        icon1.addPixmap(QtGui.QPixmap("../b5c92ba4/branchwhite24.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
-        self.pushButton_2.setIcon(icon1)
         self.pushButton_2.setIconSize(QtCore.QSize(24, 24))
         self.pushButton_2.setObjectName("pushButton_2")
         self.horizontalLayout_3.addWidget(self.pushButton_2)
@@ -288,9 +278,6 @@ class Ui_Dialog(object):
         font = QtGui.QFont()
         font.setPointSize(11)
         self.admin_btn.setFont(font)
-        icon2 = QtGui.QIcon()
-        icon2.addPixmap(QtGui.QPixmap("../429193cf/adminblack24.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.On)
-        self.admin_btn.setIcon(icon2)
         self.admin_btn.setIconSize(QtCore.QSize(24, 24))
         self.admin_btn.setObjectName("admin_btn")
         self.horizontalLayout_3.addWidget(self.admin_btn)
@@ -315,7 +302,6 @@ class Ui_Dialog(object):
         self.username_icon.setMinimumSize(QtCore.QSize(16, 16))
         self.username_icon.setStyleSheet("")
         self.username_icon.setText("")
-        self.username_icon.setPixmap(QtGui.QPixmap("../ae4c3c7b/branchblack24.png"))
         self.username_icon.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeading|QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignVCenter)
         self.username_icon.setObjectName("username_icon")
         self.formLayout.setWidget(0, QtWidgets.QFormLayout.ItemRole.LabelRole, self.username_icon)
@@ -348,7 +334,6 @@ class Ui_Dialog(object):
         self.horizontalLayout_2.setObjectName("horizontalLayout_2")
         self.password_icon = QtWidgets.QLabel(parent=self.frame_4)
         self.password_icon.setText("")
-        self.password_icon.setPixmap(QtGui.QPixmap("../392742d9/password16.png"))
         self.password_icon.setObjectName("password_icon")
         self.horizontalLayout_2.addWidget(self.password_icon)
         self.userpassLogin_lineEdit = QtWidgets.QLineEdit(parent=self.frame_4)
@@ -369,7 +354,6 @@ class Ui_Dialog(object):
         self.showpassword_btn.setStyleSheet("background-color: transparent;\n"
 "border: none;")
         self.showpassword_btn.setText("")
-        self.showpassword_btn.setIcon(icon)
         self.showpassword_btn.setAutoDefault(True)
         self.showpassword_btn.setObjectName("showpassword_btn")
         self.horizontalLayout_2.addWidget(self.showpassword_btn)
@@ -437,9 +421,6 @@ class Ui_Dialog(object):
         font = QtGui.QFont()
         font.setPointSize(11)
         self.user_btn.setFont(font)
-        icon3 = QtGui.QIcon()
-        icon3.addPixmap(QtGui.QPixmap("../ae4c3c7b/branchblack24.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
-        self.user_btn.setIcon(icon3)
         self.user_btn.setIconSize(QtCore.QSize(24, 24))
         self.user_btn.setObjectName("user_btn")
         self.horizontalLayout_4.addWidget(self.user_btn)
@@ -450,9 +431,6 @@ class Ui_Dialog(object):
         self.pushButton_6.setFont(font)
         self.pushButton_6.setStyleSheet("background-color: rgb(0, 0, 0);\n"
 "color: rgb(255, 255, 255);")
-        icon4 = QtGui.QIcon()
-        icon4.addPixmap(QtGui.QPixmap("../496ca0f3/adminwhite24.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.On)
-        self.pushButton_6.setIcon(icon4)
         self.pushButton_6.setIconSize(QtCore.QSize(24, 24))
         self.pushButton_6.setObjectName("pushButton_6")
         self.horizontalLayout_4.addWidget(self.pushButton_6)
@@ -478,7 +456,6 @@ class Ui_Dialog(object):
         self.horizontalLayout_5.setObjectName("horizontalLayout_5")
         self.password_icon_2 = QtWidgets.QLabel(parent=self.frame_2)
         self.password_icon_2.setText("")
-        self.password_icon_2.setPixmap(QtGui.QPixmap("../392742d9/password16.png"))
         self.password_icon_2.setObjectName("password_icon_2")
         self.horizontalLayout_5.addWidget(self.password_icon_2)
         self.adminPass_Login = QtWidgets.QLineEdit(parent=self.frame_2)
@@ -501,9 +478,6 @@ class Ui_Dialog(object):
         self.showpassword_btn_2.setStyleSheet("background-color: transparent;\n"
 "border: none;")
         self.showpassword_btn_2.setText("")
-        icon5 = QtGui.QIcon()
-        icon5.addPixmap(QtGui.QPixmap("../d746d753/hidepassword16.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.On)
-        self.showpassword_btn_2.setIcon(icon5)
         self.showpassword_btn_2.setAutoDefault(True)
         self.showpassword_btn_2.setObjectName("showpassword_btn_2")
         self.horizontalLayout_5.addWidget(self.showpassword_btn_2)
@@ -556,13 +530,3 @@ class Ui_Dialog(object):
         self.label_7.setText(_translate("Dialog", "Password"))
         self.adminPass_Login.setPlaceholderText(_translate("Dialog", "Enter your password"))
         self.login_btn_2.setText(_translate("Dialog", "Log In"))
-
-
-if __name__ == "__main__":
-    import sys
-    app = QtWidgets.QApplication(sys.argv)
-    Dialog = QtWidgets.QDialog()
-    ui = Ui_Dialog()
-    ui.setupUi(Dialog)
-    Dialog.show()
-    sys.exit(app.exec())
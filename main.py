@@ -1,27 +1,47 @@
-from PyQt6.QtGui import QPixmap, QIcon, QBrush, QColor
-from PyQt6.QtWidgets import QMainWindow, QMessageBox, QTableWidgetItem, QPushButton, QWidget, QHBoxLayout
+from PyQt6.QtCore import Qt, QCoreApplication, QDate, QDateTime, QTime, QTimer
+from PyQt6.QtWidgets import QMainWindow, QMessageBox
 from main_window import Ui_MainWindow
-from crud import CrudDialog
+from crud import CrudDialogFactory
 from database import HotelDatabase, AccountDatabase
+from table_models import RoomTableModel, ReservationTableModel, BranchTableModel, SearchFilterProxyModel, \
+    ActionButtonDelegate
+from search import SearchPipeline
+from change_events import ChangeNotifier, DatabaseWatcher
+from db_worker import DatabaseExecutor
+from resource_cache import get_icon, get_pixmap
+from search_query import ROOM_FIELDS, RESERVATION_FIELDS, is_structured_query
 import os
 
 class MainWindow(QMainWindow):
-    def __init__(self, username):
+    # How long to wait after the last keystroke before searching (ms)
+    SEARCH_DELAY_MS = 250
+    # Queries like "status:available price<2000" always run in the database.
+    # Set STAYBOOK_SEARCH=database to also search plain words in reservations
+    # with the full-text index instead of loading every reservation into memory
+    DATABASE_SEARCH = os.environ.get("STAYBOOK_SEARCH", "memory") == "database"
+    DATABASE_SEARCH_LIMIT = 500
+    # Rows read at a time when a table is loaded or scrolled
+    PAGE_SIZE = 200
+
+    def __init__(self, username=None):
         super().__init__()
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
 
-        # Expand Column Width
-        self.ui.tableWidget.setColumnWidth(0, 150)
-        self.ui.tableWidget_3.setColumnWidth(0, 200)
-
-        # Username for greetings
-        self.username = username
-        self.ui.username.setText(username.title())
-        if username == "Administrator":
-            self.db = None
-        else:
-            self.db = HotelDatabase(username)
+        # Set by start_session for the user logged in. The window itself is
+        # built once and kept between logins.
+        self.username = None
+        self.db = None
+        self.executor = None
+        self.dialogs = None
+        self.change_notifier = None
+        self.database_watcher = None
+
+        # Room status follows the reservations covering today, so it is
+        # worked out again when the day changes
+        self.day_timer = QTimer(self)
+        self.day_timer.setSingleShot(True)
+        self.day_timer.timeout.connect(self.start_new_day)
 
         # Connect buttons
         self.ui.room_btn.clicked.connect(self.showRooms)
@@ -30,15 +50,37 @@ class MainWindow(QMainWindow):
         self.ui.addreserve_btn.clicked.connect(self.showAddReservationDialog)
         self.ui.addbranch_btn.clicked.connect(self.showAddBranchDialog)
 
-        # Connect search fields for real-time filtering
-        self.ui.searchEdit_room.textChanged.connect(self.filter_rooms)
-        self.ui.searchEdit_reserve.textChanged.connect(self.filter_reservations)
-        self.ui.searchEdit_branch.textChanged.connect(self.filter_branches)
+        # Table models, each behind a search filter
+        self.room_model = RoomTableModel(self)
+        self.room_proxy = self.setup_table(self.ui.tableWidget, self.room_model,
+                                           self.edit_room_by_number, self.delete_room_by_number)
+        self.reservation_model = ReservationTableModel(self)
+        self.reservation_proxy = self.setup_table(self.ui.tableWidget_2, self.reservation_model,
+                                                  self.edit_reservation_by_id, self.delete_reservation_by_id)
+        self.branch_model = BranchTableModel(self)
+        self.branch_proxy = self.setup_table(self.ui.tableWidget_3, self.branch_model,
+                                             self.edit_branch_by_id, self.delete_branch_by_id)
+
+        # Search while typing, after a short pause and off the GUI thread
+        self.room_search = SearchPipeline(
+            self.room_model, self.room_proxy, self.SEARCH_DELAY_MS, self,
+            search_database=self.find_rooms,
+            load_all=self.display_rooms,
+            use_database=lambda text: is_structured_query(text, ROOM_FIELDS))
+        self.reservation_search = SearchPipeline(
+            self.reservation_model, self.reservation_proxy, self.SEARCH_DELAY_MS, self,
+            search_database=self.find_reservations,
+            load_all=self.display_reservations,
+            use_database=None if self.DATABASE_SEARCH else
+            lambda text: is_structured_query(text, RESERVATION_FIELDS))
+        self.branch_search = SearchPipeline(self.branch_model, self.branch_proxy, self.SEARCH_DELAY_MS, self)
+        self.ui.searchEdit_room.textChanged.connect(self.room_search.search)
+        self.ui.searchEdit_reserve.textChanged.connect(self.reservation_search.search)
+        self.ui.searchEdit_branch.textChanged.connect(self.branch_search.search)
 
-        # Store all data for filtering
-        self.all_rooms = []
-        self.all_reservations = []
-        self.all_branches = []
+        # Expand Column Width
+        self.ui.tableWidget.setColumnWidth(0, 150)
+        self.ui.tableWidget_3.setColumnWidth(0, 200)
 
         # Set icons and logo
         self.setup_icons()
@@ -46,6 +88,36 @@ class MainWindow(QMainWindow):
         # Logout button
         self.ui.logout_btn.clicked.connect(self.close)
 
+        if username:
+            self.start_session(username)
+
+    # ============== SESSION ==============
+
+    def start_session(self, username):
+        # Bind the window to the user who logged in
+        self.username = username
+        self.ui.username.setText(username.title())
+
+        # Quick lookups use self.db; loading tables and writing go through the
+        # executor, which runs them on a background thread with its own connection
+        if username == "Administrator":
+            self.db = None
+            self.executor = DatabaseExecutor(AccountDatabase, self)
+        else:
+            self.db = HotelDatabase(username)
+            self.executor = DatabaseExecutor(lambda: HotelDatabase(username), self)
+        self.executor.busy_changed.connect(self.show_busy)
+        # Add and edit dialogs are built once and reused
+        self.dialogs = CrudDialogFactory(username, self)
+
+        # Update the tables whenever the branch database is written
+        if self.db:
+            self.change_notifier = ChangeNotifier(self.db.db_path, self)
+            self.change_notifier.changes_ready.connect(self.apply_changes)
+            # Writes from other StayBook instances on the same branch file
+            self.database_watcher = DatabaseWatcher(self.db, self)
+            self.start_new_day()
+
         # Default page
         if username == "Administrator":
             self.ui.stackedWidget.setCurrentWidget(self.ui.Admin)
@@ -53,35 +125,131 @@ class MainWindow(QMainWindow):
         else:
             self.showRooms()
 
+    def start_new_day(self):
+        # Update the room status for today (the change bus updates the table),
+        # then wait for the next midnight. A second late so the database
+        # already sees the new date.
+        self.executor.submit(lambda db: db.refresh_all_room_status())
+        midnight = QDateTime(QDate.currentDate().addDays(1), QTime(0, 0))
+        self.day_timer.start(QDateTime.currentDateTime().msecsTo(midnight) + 1000)
+
+    def end_session(self):
+        # Close every connection of the user logged in, in order, and empty
+        # the tables so the next user never sees them
+        if self.username is None:
+            return
+        self.day_timer.stop()
+        if self.database_watcher:
+            self.database_watcher.stop()
+            self.database_watcher.deleteLater()
+            self.database_watcher = None
+        if self.change_notifier:
+            self.change_notifier.close()
+            self.change_notifier.deleteLater()
+            self.change_notifier = None
+        self.dialogs.close()
+        self.dialogs = None
+
+        # Finish the calls already sent and take their results now, while
+        # self.db is still open, so none arrives after the next login
+        self.executor.shutdown()
+        QCoreApplication.sendPostedEvents()
+        self.executor.deleteLater()
+        self.executor = None
+        if self.db:
+            self.db.close()
+            self.db = None
+        self.username = None
+
+        for search_edit, search, model in ((self.ui.searchEdit_room, self.room_search, self.room_model),
+                                           (self.ui.searchEdit_reserve, self.reservation_search,
+                                            self.reservation_model),
+                                           (self.ui.searchEdit_branch, self.branch_search, self.branch_model)):
+            search_edit.blockSignals(True)
+            search_edit.clear()
+            search_edit.blockSignals(False)
+            search.reset()
+            model.load([])
+        self.unsetCursor()
+
     def setup_icons(self):
         # Set logo
-        logo = QPixmap("icons/hotel64.png")
+        logo = get_pixmap("hotel64.png")
         self.ui.logo.setPixmap(logo)
 
         # Set add icons
-        add_icon = QIcon("icons/add32.png")
+        add_icon = get_icon("add32.png")
         self.ui.addroom_btn.setIcon(add_icon)
         self.ui.addreserve_btn.setIcon(add_icon)
         self.ui.addbranch_btn.setIcon(add_icon)
 
         # Set search icons
-        search_icon = QPixmap("icons/search16.png")
+        search_icon = get_pixmap("search16.png")
         self.ui.searchIcon_room.setPixmap(search_icon)
         self.ui.searchIcon_reserve.setPixmap(search_icon)
         self.ui.search_icon.setPixmap(search_icon)
 
         # Set logout icon
-        logout_icon = QIcon("icons/logout32white.png")
+        logout_icon = get_icon("logout32white.png")
         self.ui.logout_btn.setIcon(logout_icon)
 
+    def setup_table(self, table, model, edit_action, delete_action):
+        # Show a model in a table through a search filter and return the filter
+        proxy = SearchFilterProxyModel(self)
+        proxy.setSourceModel(model)
+        table.setModel(proxy)
+
+        # Edit and delete buttons are painted in the last column
+        delegate = ActionButtonDelegate(table)
+        table.setItemDelegateForColumn(model.columnCount() - 1, delegate)
+        delegate.edit_clicked.connect(lambda index: edit_action(proxy.row_key(index)))
+        delegate.delete_clicked.connect(lambda index: delete_action(proxy.row_key(index)))
+        return proxy
+
     def closeEvent(self, event):
         result = QMessageBox.question(self, "Confirm logout", "Are you sure you want to log out?",
                                       QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if result == QMessageBox.StandardButton.Yes:
+            # Release the connections before going back to login
+            self.end_session()
             event.accept()
         else:
             event.ignore()
 
+    def show_busy(self, busy):
+        # Busy cursor while the database thread has work, the window stays usable
+        if busy:
+            self.setCursor(Qt.CursorShape.BusyCursor)
+        else:
+            self.unsetCursor()
+
+    def apply_changes(self, changes):
+        # Patch only the rows a write touched instead of reloading the tables
+        # (called with the merged changes of the branch database)
+        models = {"room": self.room_model, "reservation": self.reservation_model}
+        reloads = {change.entity for change in changes if change.op == "reload"}
+        for change in changes:
+            model = models[change.entity]
+            if change.entity in reloads:
+                continue
+            if change.op == "insert":
+                model.insert_row(change.row)
+            elif change.op == "update":
+                model.update_row(change.key, change.row)
+            else:
+                model.remove_row(change.key)
+
+        # Changed rows may now match the search boxes differently
+        entities = {change.entity for change in changes}
+        if "room" in reloads:
+            self.display_rooms()
+        elif "room" in entities:
+            self.filter_rooms()
+        if "reservation" in reloads:
+            self.display_reservations()
+        elif "reservation" in entities:
+            self.filter_reservations()
+
     # ============== ROOMS SECTION ==============
 
     def showRooms(self):
@@ -89,150 +257,29 @@ class MainWindow(QMainWindow):
         self.display_rooms()
 
     def display_rooms(self):
-        # Get all rooms from database
-        self.all_rooms = self.db.get_all_rooms()
+        # Read the first page of rooms on the database thread, show it when it arrives
+        self.executor.submit(lambda db: db.iter_rooms(None, self.PAGE_SIZE), self.show_rooms)
+
+    def show_rooms(self, rooms):
+        # First page now and the rest on scroll
+        self.room_model.load_pages(rooms, self.fetch_room_page, self.PAGE_SIZE)
 
         # Show filtered rooms
         self.filter_rooms()
 
+    def fetch_room_page(self, last_room, callback):
+        # Read the rooms after last_room on the database thread
+        after_number = last_room['room_number']
+        self.executor.submit(lambda db: db.iter_rooms(after_number, self.PAGE_SIZE), callback)
+
     def filter_rooms(self):
-        # Get search text from search box
-        search_text = self.ui.searchEdit_room.text().lower().strip()
-
-        # Clear the table
-        self.ui.tableWidget.setRowCount(0)
-
-        # Filter rooms based on search
-        filtered_rooms = []
-        for room in self.all_rooms:
-            if self.room_match_search(room, search_text):
-                filtered_rooms.append(room)
-
-        # Set table row count
-        self.ui.tableWidget.setRowCount(len(filtered_rooms))
-
-        # Add each room to table
-        for row, room in enumerate(filtered_rooms):
-            # Get room data
-            room_number = str(room['room_number'])
-            room_type = str(room['type'])
-            price_rate = str(room['price_rate'])
-            status = str(room['status'])
-            capacity = str(room['capacity'])
-            description = str(room['description'])
-
-            # Add room data to table
-            self.ui.tableWidget.setItem(row, 0, QTableWidgetItem(room_number))
-            self.ui.tableWidget.setItem(row, 1, QTableWidgetItem(room_type))
-            self.ui.tableWidget.setItem(row, 2, QTableWidgetItem(price_rate))
-
-            # Add status with color
-            status_item = QTableWidgetItem(status)
-            self.set_status_color(status_item, status)
-            self.ui.tableWidget.setItem(row, 3, status_item)
-
-            self.ui.tableWidget.setItem(row, 4, QTableWidgetItem(capacity))
-            self.ui.tableWidget.setItem(row, 5, QTableWidgetItem(description))
-
-            # Create action buttons
-            edit_btn = self.create_edit_room_button(room_number)
-            delete_btn = self.create_delete_room_button(room_number)
-
-            # Add buttons to action widget
-            action_widget = QWidget()
-            action_layout = QHBoxLayout()
-            action_layout.setContentsMargins(0, 0, 0, 0)
-            action_layout.addWidget(edit_btn)
-            action_layout.addWidget(delete_btn)
-            action_widget.setLayout(action_layout)
-
-            # Add action widget to table
-            self.ui.tableWidget.setCellWidget(row, 6, action_widget)
-
-    def room_match_search(self, room, search_text):
-        # Convert all room data to lowercase for searching
-        room_number = str(room['room_number'] if room['room_number'] is not None else '').lower()
-        room_type = str(room['type'] if room['type'] is not None else '').lower()
-        price_rate = str(room['price_rate'] if room['price_rate'] is not None else '').lower()
-        status = str(room['status'] if room['status'] is not None else '').lower()
-        capacity = str(room['capacity'] if room['capacity'] is not None else '').lower()
-        description = str(room['description'] if room['description'] is not None else '').lower()
-
-        # If search text is empty, show all
-        if search_text == "":
-            return True
-
-        # Check if search text found in any field
-        if search_text in room_number:
-            return True
-        if search_text in room_type:
-            return True
-        if search_text in price_rate:
-            return True
-        if search_text in status:
-            return True
-        if search_text in capacity:
-            return True
-        if search_text in description:
-            return True
-
-        return False
-
-    def set_status_color(self, status_item, status):
-        # Set background color based on status
-        if status == "Available":
-            status_item.setBackground(QBrush(QColor(34, 177, 76)))  # Green
-        elif status == "Occupied":
-            status_item.setBackground(QBrush(QColor(255, 192, 0)))  # Orange
-        elif status == "Maintenance":
-            status_item.setBackground(QBrush(QColor(192, 0, 0)))  # Red
-
-        # Set white text
-        status_item.setForeground(QBrush(QColor(255, 255, 255)))
-
-    def create_edit_room_button(self, room_number):
-        # Create edit button for room
-        edit_btn = QPushButton()
-        edit_icon = QIcon("icons/edit16.png")
-        edit_btn.setIcon(edit_icon)
-        edit_btn.setMaximumWidth(60)
-
-        # Store room number in button
-        edit_btn.room_number = room_number
-
-        # Connect button click
-        edit_btn.clicked.connect(self.on_edit_room_clicked)
-
-        return edit_btn
-
-    def create_delete_room_button(self, room_number):
-        # Create delete button for room
-        delete_btn = QPushButton()
-        delete_icon = QIcon("icons/delete16.png")
-        delete_btn.setIcon(delete_icon)
-        delete_btn.setMaximumWidth(60)
-
-        # Store room number in button
-        delete_btn.room_number = room_number
-
-        # Connect button click
-        delete_btn.clicked.connect(self.on_delete_room_clicked)
-
-        return delete_btn
-
-    def on_edit_room_clicked(self):
-        # Get which button was clicked
-        sender_button = self.sender()
-        room_number = sender_button.room_number
-        # Call edit method
-        self.edit_room_by_number(room_number)
-
-    def on_delete_room_clicked(self):
-        # Get which button was clicked
-        sender_button = self.sender()
-        room_number = sender_button.room_number
-        # Call delete method
-        self.delete_room_by_number(room_number)
+        # Show only rooms matching the search box
+        self.room_search.search_now(self.ui.searchEdit_room.text())
+
+    def find_rooms(self, text, callback):
+        # Run a room search box query in SQL on the database thread
+        limit = self.DATABASE_SEARCH_LIMIT
+        self.executor.submit(lambda db: db.query_rooms(text, limit), callback)
 
     def edit_room_by_number(self, room_number):
         # Get the room data from database
@@ -240,8 +287,7 @@ class MainWindow(QMainWindow):
 
         if room:
             # Open the crud dialog in edit mode
-            crudDialog = CrudDialog(self.username, parent=self, edit_mode=True, room_data=room, dialog_type="room")
-            crudDialog.ui.stackedWidget.setCurrentWidget(crudDialog.ui.roomedit_page)
+            crudDialog = self.dialogs.open("room", edit_mode=True, room_data=room)
             crudDialog.exec()
         else:
             QMessageBox.warning(self, "Error", "Could not find room data")
@@ -253,19 +299,20 @@ class MainWindow(QMainWindow):
                                       QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
 
         if result == QMessageBox.StandardButton.Yes:
-            # Delete the room from database
-            success, message = self.db.delete_room(room_number)
-
-            if success:
-                QMessageBox.information(self, "Success", message)
-                self.display_rooms()
-            else:
-                QMessageBox.warning(self, "Error", message)
+            # Delete the room on the database thread
+            self.executor.submit(lambda db: db.delete_room(room_number), self.room_deleted)
+
+    def room_deleted(self, result):
+        # The table itself is updated through the change notifier
+        success, message, changes = result
+        if success:
+            QMessageBox.information(self, "Success", message)
+        else:
+            QMessageBox.warning(self, "Error", message)
 
     def showAddRoomDialog(self):
         # Open add room dialog
-        crudDialog = CrudDialog(self.username, parent=self, dialog_type="room")
-        crudDialog.ui.stackedWidget.setCurrentWidget(crudDialog.ui.roomadd_page)
+        crudDialog = self.dialogs.open("room")
         crudDialog.exec()
 
     # ============== RESERVATIONS SECTION ==============
@@ -275,154 +322,33 @@ class MainWindow(QMainWindow):
         self.display_reservations()
 
     def display_reservations(self):
-        # Get all reservations from database
-        self.all_reservations = self.db.get_all_reservations()
+        # Read the first page of reservations on the database thread, show it when it arrives
+        self.executor.submit(lambda db: db.iter_reservations(None, self.PAGE_SIZE), self.show_reservations)
+
+    def show_reservations(self, reservations):
+        # First page now and the rest on scroll
+        self.reservation_model.load_pages(reservations, self.fetch_reservation_page, self.PAGE_SIZE)
 
         # Show filtered reservations
         self.filter_reservations()
 
+    def fetch_reservation_page(self, last_reservation, callback):
+        # Read the reservations after last_reservation on the database thread
+        after_id = last_reservation['guest_id']
+        self.executor.submit(lambda db: db.iter_reservations(after_id, self.PAGE_SIZE), callback)
+
     def filter_reservations(self):
-        # Get search text from search box
-        search_text = self.ui.searchEdit_reserve.text().lower().strip()
-
-        # Clear the table
-        self.ui.tableWidget_2.setRowCount(0)
-
-        # Filter reservations based on search
-        filtered_reservations = []
-        for reservation in self.all_reservations:
-            if self.reservation_match_search(reservation, search_text):
-                filtered_reservations.append(reservation)
-
-        # Set table row count
-        self.ui.tableWidget_2.setRowCount(len(filtered_reservations))
-
-        # Add each reservation to table
-        for row, reservation in enumerate(filtered_reservations):
-            # Get reservation data
-            guest_id = str(reservation['guest_id'])
-            guest_name = str(reservation['guest_name'])
-            contact = str(reservation['contact'])
-            room_number = str(reservation['room_number'])
-            checkin_date = str(reservation['checkin_date'])
-            checkout_date = str(reservation['checkout_date'])
-            payment_status = str(reservation['payment_status'])
-
-            # Add reservation data to table
-            self.ui.tableWidget_2.setItem(row, 0, QTableWidgetItem(guest_id))
-            self.ui.tableWidget_2.setItem(row, 1, QTableWidgetItem(guest_name))
-            self.ui.tableWidget_2.setItem(row, 2, QTableWidgetItem(contact))
-            self.ui.tableWidget_2.setItem(row, 3, QTableWidgetItem(room_number))
-            self.ui.tableWidget_2.setItem(row, 4, QTableWidgetItem(checkin_date))
-            self.ui.tableWidget_2.setItem(row, 5, QTableWidgetItem(checkout_date))
-
-            # Add payment status with color
-            payment_status_item = QTableWidgetItem(payment_status)
-            self.set_payment_status_color(payment_status_item, payment_status)
-            self.ui.tableWidget_2.setItem(row, 6, payment_status_item)
-
-            # Create action buttons
-            edit_btn = self.create_edit_reservation_button(guest_id)
-            delete_btn = self.create_delete_reservation_button(guest_id)
-
-            # Add buttons to action widget
-            action_widget = QWidget()
-            action_layout = QHBoxLayout()
-            action_layout.setContentsMargins(0, 0, 0, 0)
-            action_layout.addWidget(edit_btn)
-            action_layout.addWidget(delete_btn)
-            action_widget.setLayout(action_layout)
-
-            # Add action widget to table
-            self.ui.tableWidget_2.setCellWidget(row, 7, action_widget)
-
-    def reservation_match_search(self, reservation, search_text):
-        # Convert all reservation data to lowercase for searching
-        guest_id = str(reservation['guest_id'] if reservation['guest_id'] is not None else '').lower()
-        guest_name = str(reservation['guest_name'] if reservation['guest_name'] is not None else '').lower()
-        contact = str(reservation['contact'] if reservation['contact'] is not None else '').lower()
-        room_number = str(reservation['room_number'] if reservation['room_number'] is not None else '').lower()
-        checkin_date = str(reservation['checkin_date'] if reservation['checkin_date'] is not None else '').lower()
-        checkout_date = str(reservation['checkout_date'] if reservation['checkout_date'] is not None else '').lower()
-        payment_status = str(reservation['payment_status'] if reservation['payment_status'] is not None else '').lower()
-
-        # If no search text, show all
-        if search_text == "":
-            return True
-
-        # Check if search text found in any field
-        if search_text in guest_id:
-            return True
-        if search_text in guest_name:
-            return True
-        if search_text in contact:
-            return True
-        if search_text in room_number:
-            return True
-        if search_text in checkin_date:
-            return True
-        if search_text in checkout_date:
-            return True
-        if search_text in payment_status:
-            return True
-
-        return False
-
-    def set_payment_status_color(self, payment_status_item, payment_status):
-        # Set background color based on payment status
-        if payment_status == "Paid":
-            payment_status_item.setBackground(QBrush(QColor(34, 177, 76)))  # Green
-        elif payment_status == "Pending":
-            payment_status_item.setBackground(QBrush(QColor(255, 192, 0)))  # Orange
-        elif payment_status == "Cancelled":
-            payment_status_item.setBackground(QBrush(QColor(192, 0, 0)))  # Red
-
-        # Set white text
-        payment_status_item.setForeground(QBrush(QColor(255, 255, 255)))
-
-    def create_edit_reservation_button(self, guest_id):
-        # Create edit button for reservation
-        edit_btn = QPushButton()
-        edit_icon = QIcon("icons/edit16.png")
-        edit_btn.setIcon(edit_icon)
-        edit_btn.setMaximumWidth(60)
-
-        # Store guest id in button
-        edit_btn.guest_id = guest_id
-
-        # Connect button click
-        edit_btn.clicked.connect(self.on_edit_reservation_clicked)
-
-        return edit_btn
-
-    def create_delete_reservation_button(self, guest_id):
-        # Create delete button for reservation
-        delete_btn = QPushButton()
-        delete_icon = QIcon("icons/delete16.png")
-        delete_btn.setIcon(delete_icon)
-        delete_btn.setMaximumWidth(60)
-
-        # Store guest id in button
-        delete_btn.guest_id = guest_id
-
-        # Connect button click
-        delete_btn.clicked.connect(self.on_delete_reservation_clicked)
-
-        return delete_btn
-
-    def on_edit_reservation_clicked(self):
-        # Get which button was clicked
-        sender_button = self.sender()
-        guest_id = sender_button.guest_id
-        # Call edit method
-        self.edit_reservation_by_id(guest_id)
-
-    def on_delete_reservation_clicked(self):
-        # Get which button was clicked
-        sender_button = self.sender()
-        guest_id = sender_button.guest_id
-        # Call delete method
-        self.delete_reservation_by_id(guest_id)
+        # Show only reservations matching the search box
+        self.reservation_search.search_now(self.ui.searchEdit_reserve.text())
+
+    def find_reservations(self, text, callback):
+        # Field queries go to SQL filters, plain words to the ranked full-text
+        # search, both on the database thread
+        limit = self.DATABASE_SEARCH_LIMIT
+        if is_structured_query(text, RESERVATION_FIELDS):
+            self.executor.submit(lambda db: db.query_reservations(text, limit), callback)
+        else:
+            self.executor.submit(lambda db: db.search_reservations(text, limit), callback)
 
     def edit_reservation_by_id(self, guest_id):
         # Get the reservation data from database
@@ -430,8 +356,7 @@ class MainWindow(QMainWindow):
 
         if reservation:
             # Open the crud dialog in edit mode
-            crudDialog = CrudDialog(self.username, parent=self, edit_mode=True, reservation_data=reservation, dialog_type="reservation")
-            crudDialog.ui.stackedWidget.setCurrentWidget(crudDialog.ui.page)
+            crudDialog = self.dialogs.open("reservation", edit_mode=True, reservation_data=reservation)
             crudDialog.exec()
         else:
             QMessageBox.warning(self, "Error", "Could not find reservation data")
@@ -443,142 +368,37 @@ class MainWindow(QMainWindow):
                                       QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
 
         if result == QMessageBox.StandardButton.Yes:
-            # Delete the reservation from database
-            success, message = self.db.delete_reservation(guest_id)
-
-            if success:
-                QMessageBox.information(self, "Success", message)
-                self.display_reservations()
-                self.display_rooms()
-            else:
-                QMessageBox.warning(self, "Error", message)
+            # Delete the reservation on the database thread
+            self.executor.submit(lambda db: db.delete_reservation(guest_id), self.reservation_deleted)
+
+    def reservation_deleted(self, result):
+        # Both tables are updated through the change notifier
+        success, message, changes = result
+        if success:
+            QMessageBox.information(self, "Success", message)
+        else:
+            QMessageBox.warning(self, "Error", message)
 
     def showAddReservationDialog(self):
         # Open add reservation dialog
-        crudDialog = CrudDialog(self.username, parent=self, dialog_type="reservation")
-        crudDialog.ui.stackedWidget.setCurrentWidget(crudDialog.ui.reserveadd_page)
+        crudDialog = self.dialogs.open("reservation")
         crudDialog.exec()
 
     # ============== BRANCHES SECTION ==============
 
     def display_branches(self):
-        # Get all branches from database
-        branch_db = AccountDatabase()
-        self.all_branches = branch_db.get_all_branches()
+        # Read branches on the database thread, show them when they arrive
+        self.executor.submit(lambda db: db.get_all_branches(), self.show_branches)
+
+    def show_branches(self, branches):
+        # One chunk, there are only a few
+        self.branch_model.load([branches])
         # Show filtered branches
         self.filter_branches()
 
     def filter_branches(self):
-        # Get search text from search box
-        search_text = self.ui.searchEdit_branch.text().lower().strip()
-
-        # Clear the table
-        self.ui.tableWidget_3.setRowCount(0)
-
-        # Filter branches based on search
-        filtered_branches = []
-        for branch in self.all_branches:
-            if self.branch_match_search(branch, search_text):
-                filtered_branches.append(branch)
-
-        # Set table row count
-        self.ui.tableWidget_3.setRowCount(len(filtered_branches))
-
-        # Add each branch to table
-        for row, branch in enumerate(filtered_branches):
-            # Get branch data
-            username = str(branch['username'])
-            password = str(branch['password'])
-            address = str(branch['address'])
-            contact = str(branch['contact'])
-
-            # Add branch data to table
-            self.ui.tableWidget_3.setItem(row, 0, QTableWidgetItem(username))
-            self.ui.tableWidget_3.setItem(row, 1, QTableWidgetItem(password))
-            self.ui.tableWidget_3.setItem(row, 2, QTableWidgetItem(address))
-            self.ui.tableWidget_3.setItem(row, 3, QTableWidgetItem(contact))
-
-            # Create action buttons
-            edit_btn = self.create_edit_branch_button(branch['uid'])
-            delete_btn = self.create_delete_branch_button(branch['uid'])
-
-            # Add buttons to action widget
-            action_widget = QWidget()
-            action_layout = QHBoxLayout()
-            action_layout.setContentsMargins(0, 0, 0, 0)
-            action_layout.addWidget(edit_btn)
-            action_layout.addWidget(delete_btn)
-            action_widget.setLayout(action_layout)
-
-            # Add action widget to table
-            self.ui.tableWidget_3.setCellWidget(row, 4, action_widget)
-
-    def branch_match_search(self, branch, search_text):
-        # Convert all branch data to lowercase for searching
-        username = str(branch['username'] if branch['username'] is not None else '').lower()
-        password = str(branch['password'] if branch['password'] is not None else '').lower()
-        address = str(branch['address'] if branch['address'] is not None else '').lower()
-        contact = str(branch['contact'] if branch['contact'] is not None else '').lower()
-
-        # If no search text, show all
-        if search_text == "":
-            return True
-
-        # Check if search text found in any field
-        if search_text in username:
-            return True
-        if search_text in password:
-            return True
-        if search_text in address:
-            return True
-        if search_text in contact:
-            return True
-
-        return False
-
-    def create_edit_branch_button(self, branch_id):
-        # Create edit button for branch
-        edit_btn = QPushButton()
-        edit_icon = QIcon("icons/edit16.png")
-        edit_btn.setIcon(edit_icon)
-        edit_btn.setMaximumWidth(60)
-
-        # Store branch id in button
-        edit_btn.branch_id = branch_id
-
-        # Connect button click
-        edit_btn.clicked.connect(self.on_edit_branch_clicked)
-
-        return edit_btn
-
-    def create_delete_branch_button(self, branch_id):
-        # Create delete button for branch
-        delete_btn = QPushButton()
-        delete_icon = QIcon("icons/delete16.png")
-        delete_btn.setIcon(delete_icon)
-        delete_btn.setMaximumWidth(60)
-
-        # Store branch id in button
-        delete_btn.branch_id = branch_id
-
-        # Connect button click
-        delete_btn.clicked.connect(self.on_delete_branch_clicked)
-
-        return delete_btn
-
-    def on_edit_branch_clicked(self):
-        # Get which button was clicked
-        sender_button = self.sender()
-        branch_id = sender_button.branch_id
-        # Call edit method
-        self.edit_branch_by_id(branch_id)
-
-    def on_delete_branch_clicked(self):
-        # Get which button was clicked
-        sender_button = self.sender()
-        branch_id = sender_button.branch_id
-        # Call delete method
-        self.delete_branch_by_id(branch_id)
+        # Show only branches matching the search box
+        self.branch_search.search_now(self.ui.searchEdit_branch.text())
 
     def edit_branch_by_id(self, branch_id):
         # Get the branch data from database
@@ -586,25 +406,25 @@ class MainWindow(QMainWindow):
         branch = branch_db.get_branch_by_id(branch_id)
 
         if branch:
-            old_username = branch['username']
-
-            # Open the crud dialog in edit mode
-            crudDialog = CrudDialog(self.username, parent=self, edit_mode=True, branch_data=branch, dialog_type="branch")
-            crudDialog.ui.stackedWidget.setCurrentWidget(crudDialog.ui.branchedit_page)
+            # Open the crud dialog in edit mode (the update may still be
+            # saving after it closes, branch_updated runs when it is saved)
+            crudDialog = self.dialogs.open("branch", edit_mode=True, branch_data=branch)
             crudDialog.exec()
-
-            # Get updated data after editing
-            new_branch = branch_db.get_branch_by_id(branch_id)
-
-            # If username changed, rename the database file
-            if new_branch and new_branch['username'] != old_username:
-                old_file = f"branch_database/{old_username}.db"
-                new_file = f"branch_database/{new_branch['username']}.db"
-
-                if os.path.exists(old_file):
-                    os.rename(old_file, new_file)
         else:
             QMessageBox.warning(self, "Error", "Could not find branch data")
+        branch_db.close()
+
+    def branch_updated(self, old_username, new_username):
+        # If username changed, rename the database file
+        if new_username != old_username:
+            old_file = f"branch_database/{old_username}.db"
+            new_file = f"branch_database/{new_username}.db"
+
+            # Move the WAL side files too so no committed data is left behind
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(old_file + suffix):
+                    os.rename(old_file + suffix, new_file + suffix)
+        self.display_branches()
 
     def delete_branch_by_id(self, branch_id):
         # Ask for confirmation
@@ -613,26 +433,25 @@ class MainWindow(QMainWindow):
                                       QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
 
         if result == QMessageBox.StandardButton.Yes:
-            # Delete the branch from database
-            branch_db = AccountDatabase()
-            branch = branch_db.get_branch_by_id(branch_id)
-            success = branch_db.delete_branch(branch_id)
-            
-            branch_username = branch['username']
-            branch_db_file = f"branch_database/{branch_username}.db"
-            
-            if success:
-                # Delete the branch database file
-                if os.path.exists(branch_db_file):
-                    os.remove(branch_db_file)
-                
-                QMessageBox.information(self, "Success", "Branch deleted successfully")
-                self.display_branches()
-            else:
-                QMessageBox.warning(self, "Error", "Error deleting branch")
+            # Delete the branch on the database thread
+            self.executor.submit(lambda db: (db.get_branch_by_id(branch_id), db.delete_branch(branch_id)),
+                                 self.branch_deleted)
+
+    def branch_deleted(self, result):
+        branch, success = result
+        if success and branch:
+            # Delete the branch database file and its WAL side files
+            branch_db_file = f"branch_database/{branch['username']}.db"
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(branch_db_file + suffix):
+                    os.remove(branch_db_file + suffix)
+
+            QMessageBox.information(self, "Success", "Branch deleted successfully")
+            self.display_branches()
+        else:
+            QMessageBox.warning(self, "Error", "Error deleting branch")
 
     def showAddBranchDialog(self):
         # Open add branch dialog
-        crudDialog = CrudDialog(self.username, parent=self, dialog_type="branch")
-        crudDialog.ui.stackedWidget.setCurrentWidget(crudDialog.ui.branchadd_page)
+        crudDialog = self.dialogs.open("branch")
         crudDialog.exec()
\ No newline at end of file
@@ -1,6 +1,6 @@
 # Form implementation generated from reading ui file 'main_window.ui'
 #
-# Created by: PyQt6 UI code generator 6.10.0
+# Created by: PyQt6 UI code generator 6.11.0
 #
 # WARNING: Any manual changes made to this file will be lost when pyuic6 is
 # run again.  Do not edit this file unless you know what you are doing.
@@ -37,7 +37,6 @@ class Ui_MainWindow(object):
 "border-radius: 10px;\n"
 "padding: 10px")
         self.logo.setText("")
-        self.logo.setPixmap(QtGui.QPixmap("../86a7a208/hotel64.png"))
         self.logo.setScaledContents(True)
         self.logo.setObjectName("logo")
         self.horizontalLayout_7.addWidget(self.logo)
@@ -101,9 +100,6 @@ class Ui_MainWindow(object):
 "QPushButton::hover{\n"
 "    background: rgba(255, 255, 255, 0.2);\n"
 "}")
-        icon = QtGui.QIcon()
-        icon.addPixmap(QtGui.QPixmap("../c954c837/logout32white.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.On)
-        self.logout_btn.setIcon(icon)
         self.logout_btn.setObjectName("logout_btn")
         self.horizontalLayout_7.addWidget(self.logout_btn)
         spacerItem3 = QtWidgets.QSpacerItem(20, 20, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
@@ -118,24 +114,12 @@ class Ui_MainWindow(object):
         self.verticalLayout_3.setObjectName("verticalLayout_3")
         self.gridLayout_5 = QtWidgets.QGridLayout()
         self.gridLayout_5.setObjectName("gridLayout_5")
-        self.tableWidget_3 = QtWidgets.QTableWidget(parent=self.Admin)
+        self.tableWidget_3 = QtWidgets.QTableView(parent=self.Admin)
         font = QtGui.QFont()
         font.setFamily("Open Sans")
         font.setPointSize(11)
         self.tableWidget_3.setFont(font)
         self.tableWidget_3.setObjectName("tableWidget_3")
-        self.tableWidget_3.setColumnCount(5)
-        self.tableWidget_3.setRowCount(0)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget_3.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget_3.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget_3.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget_3.setHorizontalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget_3.setHorizontalHeaderItem(4, item)
         self.tableWidget_3.horizontalHeader().setStretchLastSection(True)
         self.tableWidget_3.verticalHeader().setStretchLastSection(False)
         self.gridLayout_5.addWidget(self.tableWidget_3, 5, 1, 1, 1)
@@ -163,9 +147,6 @@ class Ui_MainWindow(object):
 "QPushButton::hover{\n"
 "    background-color: rgb(70, 70, 70);\n"
 "}")
-        icon1 = QtGui.QIcon()
-        icon1.addPixmap(QtGui.QPixmap("../c249255d/add32.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.On)
-        self.addbranch_btn.setIcon(icon1)
         self.addbranch_btn.setObjectName("addbranch_btn")
         self.horizontalLayout_9.addWidget(self.addbranch_btn)
         self.gridLayout_5.addLayout(self.horizontalLayout_9, 1, 1, 1, 1)
@@ -187,7 +168,6 @@ class Ui_MainWindow(object):
         self.horizontalLayout.setObjectName("horizontalLayout")
         self.search_icon = QtWidgets.QLabel(parent=self.frame)
         self.search_icon.setText("")
-        self.search_icon.setPixmap(QtGui.QPixmap("../915df00c/search16.png"))
         self.search_icon.setObjectName("search_icon")
         self.horizontalLayout.addWidget(self.search_icon)
         self.searchEdit_branch = QtWidgets.QLineEdit(parent=self.frame)
@@ -255,7 +235,6 @@ class Ui_MainWindow(object):
         self.horizontalLayout_2.setObjectName("horizontalLayout_2")
         self.searchIcon_room = QtWidgets.QLabel(parent=self.frame_2)
         self.searchIcon_room.setText("")
-        self.searchIcon_room.setPixmap(QtGui.QPixmap("../915df00c/search16.png"))
         self.searchIcon_room.setObjectName("searchIcon_room")
         self.horizontalLayout_2.addWidget(self.searchIcon_room)
         self.searchEdit_room = QtWidgets.QLineEdit(parent=self.frame_2)
@@ -289,34 +268,17 @@ class Ui_MainWindow(object):
 "QPushButton::hover{\n"
 "    background-color: rgb(70, 70, 70);\n"
 "}")
-        self.addroom_btn.setIcon(icon1)
         self.addroom_btn.setObjectName("addroom_btn")
         self.horizontalLayout_6.addWidget(self.addroom_btn)
         self.gridLayout_3.addLayout(self.horizontalLayout_6, 1, 2, 1, 1)
         spacerItem11 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
         self.gridLayout_3.addItem(spacerItem11, 4, 3, 1, 1)
-        self.tableWidget = QtWidgets.QTableWidget(parent=self.Rooms)
+        self.tableWidget = QtWidgets.QTableView(parent=self.Rooms)
         font = QtGui.QFont()
         font.setFamily("Poppins")
         font.setPointSize(11)
         self.tableWidget.setFont(font)
         self.tableWidget.setObjectName("tableWidget")
-        self.tableWidget.setColumnCount(7)
-        self.tableWidget.setRowCount(0)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(4, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(5, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(6, item)
         self.tableWidget.horizontalHeader().setStretchLastSection(True)
         self.tableWidget.verticalHeader().setStretchLastSection(False)
         self.gridLayout_3.addWidget(self.tableWidget, 4, 2, 1, 1)
@@ -359,30 +321,12 @@ class Ui_MainWindow(object):
         self.verticalLayout.setObjectName("verticalLayout")
         self.gridLayout_2 = QtWidgets.QGridLayout()
         self.gridLayout_2.setObjectName("gridLayout_2")
-        self.tableWidget_2 = QtWidgets.QTableWidget(parent=self.Reserve)
+        self.tableWidget_2 = QtWidgets.QTableView(parent=self.Reserve)
         font = QtGui.QFont()
         font.setFamily("Open Sans")
         font.setPointSize(11)
         self.tableWidget_2.setFont(font)
         self.tableWidget_2.setObjectName("tableWidget_2")
-        self.tableWidget_2.setColumnCount(8)
-        self.tableWidget_2.setRowCount(0)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget_2.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget_2.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget_2.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget_2.setHorizontalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget_2.setHorizontalHeaderItem(4, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget_2.setHorizontalHeaderItem(5, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget_2.setHorizontalHeaderItem(6, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidget_2.setHorizontalHeaderItem(7, item)
         self.tableWidget_2.horizontalHeader().setStretchLastSection(True)
         self.tableWidget_2.verticalHeader().setStretchLastSection(False)
         self.gridLayout_2.addWidget(self.tableWidget_2, 5, 1, 1, 1)
@@ -410,7 +354,6 @@ class Ui_MainWindow(object):
 "QPushButton::hover{\n"
 "    background-color: rgb(70, 70, 70);\n"
 "}")
-        self.addreserve_btn.setIcon(icon1)
         self.addreserve_btn.setObjectName("addreserve_btn")
         self.horizontalLayout_5.addWidget(self.addreserve_btn)
         self.gridLayout_2.addLayout(self.horizontalLayout_5, 1, 1, 1, 1)
@@ -432,7 +375,6 @@ class Ui_MainWindow(object):
         self.horizontalLayout_8.setObjectName("horizontalLayout_8")
         self.searchIcon_reserve = QtWidgets.QLabel(parent=self.frame_3)
         self.searchIcon_reserve.setText("")
-        self.searchIcon_reserve.setPixmap(QtGui.QPixmap("../915df00c/search16.png"))
         self.searchIcon_reserve.setObjectName("searchIcon_reserve")
         self.horizontalLayout_8.addWidget(self.searchIcon_reserve)
         self.searchEdit_reserve = QtWidgets.QLineEdit(parent=self.frame_3)
@@ -463,16 +405,6 @@ class Ui_MainWindow(object):
         self.welcome.setText(_translate("MainWindow", "<html><head/><body><p><span style=\" font-size:12pt;\">Welcome,</span></p></body></html>"))
         self.username.setText(_translate("MainWindow", "<html><head/><body><p><span style=\" font-size:12pt;\">Username</span></p></body></html>"))
         self.logout_btn.setText(_translate("MainWindow", "Log Out"))
-        item = self.tableWidget_3.horizontalHeaderItem(0)
-        item.setText(_translate("MainWindow", "Branch Name"))
-        item = self.tableWidget_3.horizontalHeaderItem(1)
-        item.setText(_translate("MainWindow", "Password"))
-        item = self.tableWidget_3.horizontalHeaderItem(2)
-        item.setText(_translate("MainWindow", "Location"))
-        item = self.tableWidget_3.horizontalHeaderItem(3)
-        item.setText(_translate("MainWindow", "Contact"))
-        item = self.tableWidget_3.horizontalHeaderItem(4)
-        item.setText(_translate("MainWindow", "Actions"))
         self.label_6.setText(_translate("MainWindow", "<html><head/><body><p><span style=\" font-size:16pt;\">Branch Management</span></p><p>Manage hotel branches\' account and details</p></body></html>"))
         self.addbranch_btn.setText(_translate("MainWindow", "Add Branch"))
         self.searchEdit_branch.setPlaceholderText(_translate("MainWindow", "Search"))
@@ -481,48 +413,8 @@ class Ui_MainWindow(object):
         self.searchEdit_room.setPlaceholderText(_translate("MainWindow", "Search"))
         self.label_5.setText(_translate("MainWindow", "<html><head/><body><p><span style=\" font-size:16pt;\">Room Management</span></p><p><span style=\" font-size:11pt;\">Manage hotel rooms and their details</span></p></body></html>"))
         self.addroom_btn.setText(_translate("MainWindow", " Add Room"))
-        item = self.tableWidget.horizontalHeaderItem(0)
-        item.setText(_translate("MainWindow", "Room Number"))
-        item = self.tableWidget.horizontalHeaderItem(1)
-        item.setText(_translate("MainWindow", "Type"))
-        item = self.tableWidget.horizontalHeaderItem(2)
-        item.setText(_translate("MainWindow", "Price_Rate"))
-        item = self.tableWidget.horizontalHeaderItem(3)
-        item.setText(_translate("MainWindow", "Status"))
-        item = self.tableWidget.horizontalHeaderItem(4)
-        item.setText(_translate("MainWindow", "Capacity"))
-        item = self.tableWidget.horizontalHeaderItem(5)
-        item.setText(_translate("MainWindow", "Description"))
-        item = self.tableWidget.horizontalHeaderItem(6)
-        item.setText(_translate("MainWindow", "Action"))
         self.room_btn.setText(_translate("MainWindow", "Room Management"))
         self.pushButton_2.setText(_translate("MainWindow", "Reservation"))
-        item = self.tableWidget_2.horizontalHeaderItem(0)
-        item.setText(_translate("MainWindow", "Guest_ID"))
-        item = self.tableWidget_2.horizontalHeaderItem(1)
-        item.setText(_translate("MainWindow", "Guest_Name"))
-        item = self.tableWidget_2.horizontalHeaderItem(2)
-        item.setText(_translate("MainWindow", "Contact"))
-        item = self.tableWidget_2.horizontalHeaderItem(3)
-        item.setText(_translate("MainWindow", "Room_Number"))
-        item = self.tableWidget_2.horizontalHeaderItem(4)
-        item.setText(_translate("MainWindow", "Check-in"))
-        item = self.tableWidget_2.horizontalHeaderItem(5)
-        item.setText(_translate("MainWindow", "Check-out"))
-        item = self.tableWidget_2.horizontalHeaderItem(6)
-        item.setText(_translate("MainWindow", "Payment"))
-        item = self.tableWidget_2.horizontalHeaderItem(7)
-        item.setText(_translate("MainWindow", "Action"))
         self.label_4.setText(_translate("MainWindow", "<html><head/><body><p><span style=\" font-size:16pt;\">Reservation Management</span></p><p><span style=\" font-size:11pt;\">Manage guest reservations and payments</span></p></body></html>"))
         self.addreserve_btn.setText(_translate("MainWindow", " Add Reservation"))
         self.searchEdit_reserve.setPlaceholderText(_translate("MainWindow", "Search"))
-
-
-if __name__ == "__main__":
-    import sys
-    app = QtWidgets.QApplication(sys.argv)
-    MainWindow = QtWidgets.QMainWindow()
-    ui = Ui_MainWindow()
-    ui.setupUi(MainWindow)
-    MainWindow.show()
-    sys.exit(app.exec())
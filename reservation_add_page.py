@@ -0,0 +1,149 @@
+# Form implementation generated from reading ui file 'reservation_add_page.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_ReservationAddPage(object):
+    def setupUi(self, ReservationAddPage):
+        ReservationAddPage.setObjectName("ReservationAddPage")
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        ReservationAddPage.setFont(font)
+        self.verticalLayout_9 = QtWidgets.QVBoxLayout(ReservationAddPage)
+        self.verticalLayout_9.setObjectName("verticalLayout_9")
+        self.header_3 = QtWidgets.QFrame(parent=ReservationAddPage)
+        self.header_3.setStyleSheet("background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:0.931, y2:0, stop:0.265957 rgba(102, 173, 255, 255), stop:0.547872 rgba(55, 111, 186, 255), stop:1 rgba(16, 36, 62, 255));\n"
+"color: rgb(255, 255, 255);\n"
+"border: None;\n"
+"")
+        self.header_3.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.header_3.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.header_3.setObjectName("header_3")
+        self.verticalLayout_7 = QtWidgets.QVBoxLayout(self.header_3)
+        self.verticalLayout_7.setObjectName("verticalLayout_7")
+        self.label_15 = QtWidgets.QLabel(parent=self.header_3)
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        self.label_15.setFont(font)
+        self.label_15.setObjectName("label_15")
+        self.verticalLayout_7.addWidget(self.label_15)
+        self.label_17 = QtWidgets.QLabel(parent=self.header_3)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.label_17.setFont(font)
+        self.label_17.setObjectName("label_17")
+        self.verticalLayout_7.addWidget(self.label_17)
+        self.verticalLayout_9.addWidget(self.header_3)
+        self.line_3 = QtWidgets.QFrame(parent=ReservationAddPage)
+        self.line_3.setFrameShape(QtWidgets.QFrame.Shape.HLine)
+        self.line_3.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
+        self.line_3.setObjectName("line_3")
+        self.verticalLayout_9.addWidget(self.line_3)
+        self.body_3 = QtWidgets.QHBoxLayout()
+        self.body_3.setObjectName("body_3")
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.body_3.addItem(spacerItem)
+        self.verticalLayout_8 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_8.setObjectName("verticalLayout_8")
+        self.label_3 = QtWidgets.QLabel(parent=ReservationAddPage)
+        self.label_3.setObjectName("label_3")
+        self.verticalLayout_8.addWidget(self.label_3)
+        self.name_add = QtWidgets.QLineEdit(parent=ReservationAddPage)
+        self.name_add.setObjectName("name_add")
+        self.verticalLayout_8.addWidget(self.name_add)
+        self.label_18 = QtWidgets.QLabel(parent=ReservationAddPage)
+        self.label_18.setObjectName("label_18")
+        self.verticalLayout_8.addWidget(self.label_18)
+        self.contact_add = QtWidgets.QLineEdit(parent=ReservationAddPage)
+        self.contact_add.setObjectName("contact_add")
+        self.verticalLayout_8.addWidget(self.contact_add)
+        self.horizontalLayout_5 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_5.setObjectName("horizontalLayout_5")
+        self.verticalLayout_10 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_10.setObjectName("verticalLayout_10")
+        self.label_19 = QtWidgets.QLabel(parent=ReservationAddPage)
+        self.label_19.setObjectName("label_19")
+        self.verticalLayout_10.addWidget(self.label_19)
+        self.roomnum_add = QtWidgets.QComboBox(parent=ReservationAddPage)
+        self.roomnum_add.setObjectName("roomnum_add")
+        self.verticalLayout_10.addWidget(self.roomnum_add)
+        self.label_21 = QtWidgets.QLabel(parent=ReservationAddPage)
+        self.label_21.setObjectName("label_21")
+        self.verticalLayout_10.addWidget(self.label_21)
+        self.checkindate_add = QtWidgets.QDateEdit(parent=ReservationAddPage)
+        self.checkindate_add.setObjectName("checkindate_add")
+        self.verticalLayout_10.addWidget(self.checkindate_add)
+        self.horizontalLayout_5.addLayout(self.verticalLayout_10)
+        self.verticalLayout_11 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_11.setObjectName("verticalLayout_11")
+        self.label_20 = QtWidgets.QLabel(parent=ReservationAddPage)
+        self.label_20.setObjectName("label_20")
+        self.verticalLayout_11.addWidget(self.label_20)
+        self.payment_add = QtWidgets.QComboBox(parent=ReservationAddPage)
+        self.payment_add.setObjectName("payment_add")
+        self.payment_add.addItem("")
+        self.payment_add.addItem("")
+        self.payment_add.addItem("")
+        self.verticalLayout_11.addWidget(self.payment_add)
+        self.label_22 = QtWidgets.QLabel(parent=ReservationAddPage)
+        self.label_22.setObjectName("label_22")
+        self.verticalLayout_11.addWidget(self.label_22)
+        self.checkoutdate_add = QtWidgets.QDateEdit(parent=ReservationAddPage)
+        self.checkoutdate_add.setObjectName("checkoutdate_add")
+        self.verticalLayout_11.addWidget(self.checkoutdate_add)
+        self.horizontalLayout_5.addLayout(self.verticalLayout_11)
+        self.verticalLayout_8.addLayout(self.horizontalLayout_5)
+        self.body_3.addLayout(self.verticalLayout_8)
+        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.body_3.addItem(spacerItem1)
+        self.verticalLayout_9.addLayout(self.body_3)
+        self.footer_3 = QtWidgets.QHBoxLayout()
+        self.footer_3.setObjectName("footer_3")
+        spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.footer_3.addItem(spacerItem2)
+        self.cancel_btn_3 = QtWidgets.QPushButton(parent=ReservationAddPage)
+        self.cancel_btn_3.setObjectName("cancel_btn_3")
+        self.footer_3.addWidget(self.cancel_btn_3)
+        self.addreserve_btn = QtWidgets.QPushButton(parent=ReservationAddPage)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.addreserve_btn.setFont(font)
+        self.addreserve_btn.setStyleSheet("background-color: rgb(0, 0, 0);\n"
+"color: rgb(255, 255, 255);")
+        self.addreserve_btn.setObjectName("addreserve_btn")
+        self.footer_3.addWidget(self.addreserve_btn)
+        spacerItem3 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.footer_3.addItem(spacerItem3)
+        self.verticalLayout_9.addLayout(self.footer_3)
+
+        self.retranslateUi(ReservationAddPage)
+        QtCore.QMetaObject.connectSlotsByName(ReservationAddPage)
+        ReservationAddPage.setTabOrder(self.name_add, self.contact_add)
+        ReservationAddPage.setTabOrder(self.contact_add, self.roomnum_add)
+        ReservationAddPage.setTabOrder(self.roomnum_add, self.payment_add)
+        ReservationAddPage.setTabOrder(self.payment_add, self.checkindate_add)
+        ReservationAddPage.setTabOrder(self.checkindate_add, self.checkoutdate_add)
+        ReservationAddPage.setTabOrder(self.checkoutdate_add, self.cancel_btn_3)
+        ReservationAddPage.setTabOrder(self.cancel_btn_3, self.addreserve_btn)
+
+    def retranslateUi(self, ReservationAddPage):
+        _translate = QtCore.QCoreApplication.translate
+        self.label_15.setText(_translate("ReservationAddPage", "Add New Reservation"))
+        self.label_17.setText(_translate("ReservationAddPage", "Enter details for the new reservation"))
+        self.label_3.setText(_translate("ReservationAddPage", "Guest Name"))
+        self.label_18.setText(_translate("ReservationAddPage", "Contact"))
+        self.label_19.setText(_translate("ReservationAddPage", "Room Number"))
+        self.label_21.setText(_translate("ReservationAddPage", "Check-in Date"))
+        self.label_20.setText(_translate("ReservationAddPage", "Payment Status"))
+        self.payment_add.setItemText(0, _translate("ReservationAddPage", "Paid"))
+        self.payment_add.setItemText(1, _translate("ReservationAddPage", "Pending"))
+        self.payment_add.setItemText(2, _translate("ReservationAddPage", "Cancelled"))
+        self.label_22.setText(_translate("ReservationAddPage", "Check-out Date"))
+        self.cancel_btn_3.setText(_translate("ReservationAddPage", "Cancel"))
+        self.addreserve_btn.setText(_translate("ReservationAddPage", "Add Reservation"))
@@ -0,0 +1,149 @@
+# Form implementation generated from reading ui file 'reservation_edit_page.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_ReservationEditPage(object):
+    def setupUi(self, ReservationEditPage):
+        ReservationEditPage.setObjectName("ReservationEditPage")
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        ReservationEditPage.setFont(font)
+        self.verticalLayout_16 = QtWidgets.QVBoxLayout(ReservationEditPage)
+        self.verticalLayout_16.setObjectName("verticalLayout_16")
+        self.header_4 = QtWidgets.QFrame(parent=ReservationEditPage)
+        self.header_4.setStyleSheet("background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:0.931, y2:0, stop:0.265957 rgba(102, 173, 255, 255), stop:0.547872 rgba(55, 111, 186, 255), stop:1 rgba(16, 36, 62, 255));\n"
+"color: rgb(255, 255, 255);\n"
+"border: None;\n"
+"")
+        self.header_4.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.header_4.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.header_4.setObjectName("header_4")
+        self.verticalLayout_12 = QtWidgets.QVBoxLayout(self.header_4)
+        self.verticalLayout_12.setObjectName("verticalLayout_12")
+        self.label_23 = QtWidgets.QLabel(parent=self.header_4)
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        self.label_23.setFont(font)
+        self.label_23.setObjectName("label_23")
+        self.verticalLayout_12.addWidget(self.label_23)
+        self.label_24 = QtWidgets.QLabel(parent=self.header_4)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.label_24.setFont(font)
+        self.label_24.setObjectName("label_24")
+        self.verticalLayout_12.addWidget(self.label_24)
+        self.verticalLayout_16.addWidget(self.header_4)
+        self.line_4 = QtWidgets.QFrame(parent=ReservationEditPage)
+        self.line_4.setFrameShape(QtWidgets.QFrame.Shape.HLine)
+        self.line_4.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
+        self.line_4.setObjectName("line_4")
+        self.verticalLayout_16.addWidget(self.line_4)
+        self.body_4 = QtWidgets.QHBoxLayout()
+        self.body_4.setObjectName("body_4")
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.body_4.addItem(spacerItem)
+        self.verticalLayout_13 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_13.setObjectName("verticalLayout_13")
+        self.label_25 = QtWidgets.QLabel(parent=ReservationEditPage)
+        self.label_25.setObjectName("label_25")
+        self.verticalLayout_13.addWidget(self.label_25)
+        self.name_edit = QtWidgets.QLineEdit(parent=ReservationEditPage)
+        self.name_edit.setObjectName("name_edit")
+        self.verticalLayout_13.addWidget(self.name_edit)
+        self.label_26 = QtWidgets.QLabel(parent=ReservationEditPage)
+        self.label_26.setObjectName("label_26")
+        self.verticalLayout_13.addWidget(self.label_26)
+        self.contact_edit = QtWidgets.QLineEdit(parent=ReservationEditPage)
+        self.contact_edit.setObjectName("contact_edit")
+        self.verticalLayout_13.addWidget(self.contact_edit)
+        self.horizontalLayout_6 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_6.setObjectName("horizontalLayout_6")
+        self.verticalLayout_14 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_14.setObjectName("verticalLayout_14")
+        self.label_27 = QtWidgets.QLabel(parent=ReservationEditPage)
+        self.label_27.setObjectName("label_27")
+        self.verticalLayout_14.addWidget(self.label_27)
+        self.roomnum_edit = QtWidgets.QComboBox(parent=ReservationEditPage)
+        self.roomnum_edit.setObjectName("roomnum_edit")
+        self.verticalLayout_14.addWidget(self.roomnum_edit)
+        self.label_28 = QtWidgets.QLabel(parent=ReservationEditPage)
+        self.label_28.setObjectName("label_28")
+        self.verticalLayout_14.addWidget(self.label_28)
+        self.checkindate_edit = QtWidgets.QDateEdit(parent=ReservationEditPage)
+        self.checkindate_edit.setObjectName("checkindate_edit")
+        self.verticalLayout_14.addWidget(self.checkindate_edit)
+        self.horizontalLayout_6.addLayout(self.verticalLayout_14)
+        self.verticalLayout_15 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_15.setObjectName("verticalLayout_15")
+        self.label_29 = QtWidgets.QLabel(parent=ReservationEditPage)
+        self.label_29.setObjectName("label_29")
+        self.verticalLayout_15.addWidget(self.label_29)
+        self.payment_edit = QtWidgets.QComboBox(parent=ReservationEditPage)
+        self.payment_edit.setObjectName("payment_edit")
+        self.payment_edit.addItem("")
+        self.payment_edit.addItem("")
+        self.payment_edit.addItem("")
+        self.verticalLayout_15.addWidget(self.payment_edit)
+        self.label_30 = QtWidgets.QLabel(parent=ReservationEditPage)
+        self.label_30.setObjectName("label_30")
+        self.verticalLayout_15.addWidget(self.label_30)
+        self.checkoutdate_edit = QtWidgets.QDateEdit(parent=ReservationEditPage)
+        self.checkoutdate_edit.setObjectName("checkoutdate_edit")
+        self.verticalLayout_15.addWidget(self.checkoutdate_edit)
+        self.horizontalLayout_6.addLayout(self.verticalLayout_15)
+        self.verticalLayout_13.addLayout(self.horizontalLayout_6)
+        self.body_4.addLayout(self.verticalLayout_13)
+        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.body_4.addItem(spacerItem1)
+        self.verticalLayout_16.addLayout(self.body_4)
+        self.footer_4 = QtWidgets.QHBoxLayout()
+        self.footer_4.setObjectName("footer_4")
+        spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.footer_4.addItem(spacerItem2)
+        self.cancel_btn_4 = QtWidgets.QPushButton(parent=ReservationEditPage)
+        self.cancel_btn_4.setObjectName("cancel_btn_4")
+        self.footer_4.addWidget(self.cancel_btn_4)
+        self.addreserve_btn_2 = QtWidgets.QPushButton(parent=ReservationEditPage)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.addreserve_btn_2.setFont(font)
+        self.addreserve_btn_2.setStyleSheet("background-color: rgb(0, 0, 0);\n"
+"color: rgb(255, 255, 255);")
+        self.addreserve_btn_2.setObjectName("addreserve_btn_2")
+        self.footer_4.addWidget(self.addreserve_btn_2)
+        spacerItem3 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.footer_4.addItem(spacerItem3)
+        self.verticalLayout_16.addLayout(self.footer_4)
+
+        self.retranslateUi(ReservationEditPage)
+        QtCore.QMetaObject.connectSlotsByName(ReservationEditPage)
+        ReservationEditPage.setTabOrder(self.name_edit, self.contact_edit)
+        ReservationEditPage.setTabOrder(self.contact_edit, self.roomnum_edit)
+        ReservationEditPage.setTabOrder(self.roomnum_edit, self.payment_edit)
+        ReservationEditPage.setTabOrder(self.payment_edit, self.checkindate_edit)
+        ReservationEditPage.setTabOrder(self.checkindate_edit, self.checkoutdate_edit)
+        ReservationEditPage.setTabOrder(self.checkoutdate_edit, self.cancel_btn_4)
+        ReservationEditPage.setTabOrder(self.cancel_btn_4, self.addreserve_btn_2)
+
+    def retranslateUi(self, ReservationEditPage):
+        _translate = QtCore.QCoreApplication.translate
+        self.label_23.setText(_translate("ReservationEditPage", "Edit Reservation"))
+        self.label_24.setText(_translate("ReservationEditPage", "Update reservation information"))
+        self.label_25.setText(_translate("ReservationEditPage", "Guest Name"))
+        self.label_26.setText(_translate("ReservationEditPage", "Contact"))
+        self.label_27.setText(_translate("ReservationEditPage", "Room Number"))
+        self.label_28.setText(_translate("ReservationEditPage", "Check-in Date"))
+        self.label_29.setText(_translate("ReservationEditPage", "Payment Status"))
+        self.payment_edit.setItemText(0, _translate("ReservationEditPage", "Paid"))
+        self.payment_edit.setItemText(1, _translate("ReservationEditPage", "Pending"))
+        self.payment_edit.setItemText(2, _translate("ReservationEditPage", "Cancelled"))
+        self.label_30.setText(_translate("ReservationEditPage", "Check-out Date"))
+        self.cancel_btn_4.setText(_translate("ReservationEditPage", "Cancel"))
+        self.addreserve_btn_2.setText(_translate("ReservationEditPage", "Update Reservation"))
@@ -0,0 +1,66 @@
+import os
+from PyQt6.QtGui import QBrush, QColor, QIcon, QPixmap
+from icons_rc import ICONS
+
+# ============== IMAGES ==============
+
+# The icons folder next to this file, used for images missing from the bundle
+ICON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icons")
+
+# Every image is decoded once, on first use, and shared by all windows and
+# tables. Only use these after the QApplication exists.
+icon_cache = {}
+pixmap_cache = {}
+
+
+def icon_path(name):
+    return os.path.join(ICON_DIR, name)
+
+
+def load_pixmap(name):
+    # Decode an image from the bundled bytes (icons_rc.py), or read the file
+    # if it was added after the bundle was last built
+    data = ICONS.get(name)
+    if data is None:
+        return QPixmap(icon_path(name))
+    pixmap = QPixmap()
+    pixmap.loadFromData(data)
+    return pixmap
+
+
+def get_pixmap(name):
+    # Get the shared QPixmap of an icon, e.g. "hotel64.png"
+    pixmap = pixmap_cache.get(name)
+    if pixmap is None:
+        pixmap = load_pixmap(name)
+        pixmap_cache[name] = pixmap
+    return pixmap
+
+
+def get_icon(name):
+    # Get the shared QIcon of an icon, e.g. "edit16.png"
+    icon = icon_cache.get(name)
+    if icon is None:
+        icon = QIcon(get_pixmap(name))
+        icon_cache[name] = icon
+    return icon
+
+# ============== BRUSHES ==============
+
+# Built once, table cells return these instead of making new ones
+GREEN = QBrush(QColor(34, 177, 76))
+ORANGE = QBrush(QColor(255, 192, 0))
+RED = QBrush(QColor(192, 0, 0))
+WHITE_TEXT = QBrush(QColor(255, 255, 255))
+
+ROOM_STATUS_BRUSHES = {
+    "Available": GREEN,
+    "Occupied": ORANGE,
+    "Maintenance": RED,
+}
+
+PAYMENT_STATUS_BRUSHES = {
+    "Paid": GREEN,
+    "Pending": ORANGE,
+    "Cancelled": RED,
+}
@@ -0,0 +1,179 @@
+# Form implementation generated from reading ui file 'room_add_page.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_RoomAddPage(object):
+    def setupUi(self, RoomAddPage):
+        RoomAddPage.setObjectName("RoomAddPage")
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        RoomAddPage.setFont(font)
+        self.verticalLayout = QtWidgets.QVBoxLayout(RoomAddPage)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.header_2 = QtWidgets.QFrame(parent=RoomAddPage)
+        self.header_2.setStyleSheet("background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:0.931, y2:0, stop:0.265957 rgba(102, 173, 255, 255), stop:0.547872 rgba(55, 111, 186, 255), stop:1 rgba(16, 36, 62, 255));\n"
+"color: rgb(255, 255, 255);\n"
+"border: None;\n"
+"")
+        self.header_2.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.header_2.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.header_2.setObjectName("header_2")
+        self.verticalLayout_4 = QtWidgets.QVBoxLayout(self.header_2)
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.label_9 = QtWidgets.QLabel(parent=self.header_2)
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        self.label_9.setFont(font)
+        self.label_9.setObjectName("label_9")
+        self.verticalLayout_4.addWidget(self.label_9)
+        self.label_10 = QtWidgets.QLabel(parent=self.header_2)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.label_10.setFont(font)
+        self.label_10.setObjectName("label_10")
+        self.verticalLayout_4.addWidget(self.label_10)
+        self.verticalLayout.addWidget(self.header_2)
+        self.line_2 = QtWidgets.QFrame(parent=RoomAddPage)
+        self.line_2.setFrameShape(QtWidgets.QFrame.Shape.HLine)
+        self.line_2.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
+        self.line_2.setObjectName("line_2")
+        self.verticalLayout.addWidget(self.line_2)
+        self.body_2 = QtWidgets.QHBoxLayout()
+        self.body_2.setObjectName("body_2")
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.body_2.addItem(spacerItem)
+        self.verticalLayout_5 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_5.setObjectName("verticalLayout_5")
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.formLayout_4 = QtWidgets.QFormLayout()
+        self.formLayout_4.setObjectName("formLayout_4")
+        self.label_11 = QtWidgets.QLabel(parent=RoomAddPage)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.label_11.setFont(font)
+        self.label_11.setObjectName("label_11")
+        self.formLayout_4.setWidget(0, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_11)
+        self.label_12 = QtWidgets.QLabel(parent=RoomAddPage)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.label_12.setFont(font)
+        self.label_12.setObjectName("label_12")
+        self.formLayout_4.setWidget(1, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_12)
+        self.roomtype_add = QtWidgets.QComboBox(parent=RoomAddPage)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.roomtype_add.setFont(font)
+        self.roomtype_add.setObjectName("roomtype_add")
+        self.roomtype_add.addItem("")
+        self.roomtype_add.addItem("")
+        self.roomtype_add.addItem("")
+        self.roomtype_add.addItem("")
+        self.roomtype_add.addItem("")
+        self.formLayout_4.setWidget(1, QtWidgets.QFormLayout.ItemRole.FieldRole, self.roomtype_add)
+        self.status_add = QtWidgets.QComboBox(parent=RoomAddPage)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.status_add.setFont(font)
+        self.status_add.setObjectName("status_add")
+        self.status_add.addItem("")
+        self.status_add.addItem("")
+        self.formLayout_4.setWidget(0, QtWidgets.QFormLayout.ItemRole.FieldRole, self.status_add)
+        self.horizontalLayout_3.addLayout(self.formLayout_4)
+        self.formLayout_5 = QtWidgets.QFormLayout()
+        self.formLayout_5.setObjectName("formLayout_5")
+        self.price_add = QtWidgets.QLineEdit(parent=RoomAddPage)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.price_add.setFont(font)
+        self.price_add.setObjectName("price_add")
+        self.formLayout_5.setWidget(0, QtWidgets.QFormLayout.ItemRole.FieldRole, self.price_add)
+        self.label_13 = QtWidgets.QLabel(parent=RoomAddPage)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.label_13.setFont(font)
+        self.label_13.setObjectName("label_13")
+        self.formLayout_5.setWidget(1, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_13)
+        self.capacity_add = QtWidgets.QLineEdit(parent=RoomAddPage)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.capacity_add.setFont(font)
+        self.capacity_add.setObjectName("capacity_add")
+        self.formLayout_5.setWidget(1, QtWidgets.QFormLayout.ItemRole.FieldRole, self.capacity_add)
+        self.label_14 = QtWidgets.QLabel(parent=RoomAddPage)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.label_14.setFont(font)
+        self.label_14.setObjectName("label_14")
+        self.formLayout_5.setWidget(0, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_14)
+        self.horizontalLayout_3.addLayout(self.formLayout_5)
+        self.verticalLayout_5.addLayout(self.horizontalLayout_3)
+        self.label_16 = QtWidgets.QLabel(parent=RoomAddPage)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.label_16.setFont(font)
+        self.label_16.setObjectName("label_16")
+        self.verticalLayout_5.addWidget(self.label_16)
+        self.description_add = QtWidgets.QTextEdit(parent=RoomAddPage)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.description_add.setFont(font)
+        self.description_add.setObjectName("description_add")
+        self.verticalLayout_5.addWidget(self.description_add)
+        self.body_2.addLayout(self.verticalLayout_5)
+        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.body_2.addItem(spacerItem1)
+        self.verticalLayout.addLayout(self.body_2)
+        self.footer_2 = QtWidgets.QHBoxLayout()
+        self.footer_2.setObjectName("footer_2")
+        spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.footer_2.addItem(spacerItem2)
+        self.cancel_btn_2 = QtWidgets.QPushButton(parent=RoomAddPage)
+        self.cancel_btn_2.setObjectName("cancel_btn_2")
+        self.footer_2.addWidget(self.cancel_btn_2)
+        self.addroom_btn = QtWidgets.QPushButton(parent=RoomAddPage)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.addroom_btn.setFont(font)
+        self.addroom_btn.setStyleSheet("background-color: rgb(0, 0, 0);\n"
+"color: rgb(255, 255, 255);")
+        self.addroom_btn.setObjectName("addroom_btn")
+        self.footer_2.addWidget(self.addroom_btn)
+        spacerItem3 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.footer_2.addItem(spacerItem3)
+        self.verticalLayout.addLayout(self.footer_2)
+
+        self.retranslateUi(RoomAddPage)
+        QtCore.QMetaObject.connectSlotsByName(RoomAddPage)
+        RoomAddPage.setTabOrder(self.status_add, self.roomtype_add)
+        RoomAddPage.setTabOrder(self.roomtype_add, self.price_add)
+        RoomAddPage.setTabOrder(self.price_add, self.capacity_add)
+        RoomAddPage.setTabOrder(self.capacity_add, self.description_add)
+        RoomAddPage.setTabOrder(self.description_add, self.cancel_btn_2)
+        RoomAddPage.setTabOrder(self.cancel_btn_2, self.addroom_btn)
+
+    def retranslateUi(self, RoomAddPage):
+        _translate = QtCore.QCoreApplication.translate
+        self.label_9.setText(_translate("RoomAddPage", "Add New Room"))
+        self.label_10.setText(_translate("RoomAddPage", "Enter details for the new room"))
+        self.label_11.setText(_translate("RoomAddPage", "Status"))
+        self.label_12.setText(_translate("RoomAddPage", "Room Type:"))
+        self.roomtype_add.setItemText(0, _translate("RoomAddPage", "Single"))
+        self.roomtype_add.setItemText(1, _translate("RoomAddPage", "Double"))
+        self.roomtype_add.setItemText(2, _translate("RoomAddPage", "Twin"))
+        self.roomtype_add.setItemText(3, _translate("RoomAddPage", "Deluxe"))
+        self.roomtype_add.setItemText(4, _translate("RoomAddPage", "Suite"))
+        self.status_add.setItemText(0, _translate("RoomAddPage", "Available"))
+        self.status_add.setItemText(1, _translate("RoomAddPage", "Maintenance"))
+        self.label_13.setText(_translate("RoomAddPage", "Capacity"))
+        self.label_14.setText(_translate("RoomAddPage", "Price/Night"))
+        self.label_16.setText(_translate("RoomAddPage", "Description"))
+        self.cancel_btn_2.setText(_translate("RoomAddPage", "Cancel"))
+        self.addroom_btn.setText(_translate("RoomAddPage", "Add Room"))
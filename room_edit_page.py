@@ -0,0 +1,179 @@
+# Form implementation generated from reading ui file 'room_edit_page.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_RoomEditPage(object):
+    def setupUi(self, RoomEditPage):
+        RoomEditPage.setObjectName("RoomEditPage")
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        RoomEditPage.setFont(font)
+        self.verticalLayout_6 = QtWidgets.QVBoxLayout(RoomEditPage)
+        self.verticalLayout_6.setObjectName("verticalLayout_6")
+        self.header = QtWidgets.QFrame(parent=RoomEditPage)
+        self.header.setStyleSheet("background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:0.931, y2:0, stop:0.265957 rgba(102, 173, 255, 255), stop:0.547872 rgba(55, 111, 186, 255), stop:1 rgba(16, 36, 62, 255));\n"
+"color: rgb(255, 255, 255);\n"
+"border: None;\n"
+"")
+        self.header.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.header.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.header.setObjectName("header")
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.header)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.label = QtWidgets.QLabel(parent=self.header)
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        self.label.setFont(font)
+        self.label.setObjectName("label")
+        self.verticalLayout_3.addWidget(self.label)
+        self.label_2 = QtWidgets.QLabel(parent=self.header)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.label_2.setFont(font)
+        self.label_2.setObjectName("label_2")
+        self.verticalLayout_3.addWidget(self.label_2)
+        self.verticalLayout_6.addWidget(self.header)
+        self.line = QtWidgets.QFrame(parent=RoomEditPage)
+        self.line.setFrameShape(QtWidgets.QFrame.Shape.HLine)
+        self.line.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
+        self.line.setObjectName("line")
+        self.verticalLayout_6.addWidget(self.line)
+        self.body = QtWidgets.QHBoxLayout()
+        self.body.setObjectName("body")
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.body.addItem(spacerItem)
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.formLayout = QtWidgets.QFormLayout()
+        self.formLayout.setObjectName("formLayout")
+        self.label_4 = QtWidgets.QLabel(parent=RoomEditPage)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.label_4.setFont(font)
+        self.label_4.setObjectName("label_4")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_4)
+        self.roomtype_edit = QtWidgets.QComboBox(parent=RoomEditPage)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.roomtype_edit.setFont(font)
+        self.roomtype_edit.setObjectName("roomtype_edit")
+        self.roomtype_edit.addItem("")
+        self.roomtype_edit.addItem("")
+        self.roomtype_edit.addItem("")
+        self.roomtype_edit.addItem("")
+        self.roomtype_edit.addItem("")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.ItemRole.FieldRole, self.roomtype_edit)
+        self.label_7 = QtWidgets.QLabel(parent=RoomEditPage)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.label_7.setFont(font)
+        self.label_7.setObjectName("label_7")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_7)
+        self.status_edit = QtWidgets.QComboBox(parent=RoomEditPage)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.status_edit.setFont(font)
+        self.status_edit.setObjectName("status_edit")
+        self.status_edit.addItem("")
+        self.status_edit.addItem("")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.ItemRole.FieldRole, self.status_edit)
+        self.horizontalLayout.addLayout(self.formLayout)
+        self.formLayout_3 = QtWidgets.QFormLayout()
+        self.formLayout_3.setObjectName("formLayout_3")
+        self.price_edit = QtWidgets.QLineEdit(parent=RoomEditPage)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.price_edit.setFont(font)
+        self.price_edit.setObjectName("price_edit")
+        self.formLayout_3.setWidget(0, QtWidgets.QFormLayout.ItemRole.FieldRole, self.price_edit)
+        self.label_6 = QtWidgets.QLabel(parent=RoomEditPage)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.label_6.setFont(font)
+        self.label_6.setObjectName("label_6")
+        self.formLayout_3.setWidget(1, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_6)
+        self.capacity_edit = QtWidgets.QLineEdit(parent=RoomEditPage)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.capacity_edit.setFont(font)
+        self.capacity_edit.setObjectName("capacity_edit")
+        self.formLayout_3.setWidget(1, QtWidgets.QFormLayout.ItemRole.FieldRole, self.capacity_edit)
+        self.label_5 = QtWidgets.QLabel(parent=RoomEditPage)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.label_5.setFont(font)
+        self.label_5.setObjectName("label_5")
+        self.formLayout_3.setWidget(0, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_5)
+        self.horizontalLayout.addLayout(self.formLayout_3)
+        self.verticalLayout_2.addLayout(self.horizontalLayout)
+        self.label_8 = QtWidgets.QLabel(parent=RoomEditPage)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.label_8.setFont(font)
+        self.label_8.setObjectName("label_8")
+        self.verticalLayout_2.addWidget(self.label_8)
+        self.description_edit = QtWidgets.QTextEdit(parent=RoomEditPage)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.description_edit.setFont(font)
+        self.description_edit.setObjectName("description_edit")
+        self.verticalLayout_2.addWidget(self.description_edit)
+        self.body.addLayout(self.verticalLayout_2)
+        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.body.addItem(spacerItem1)
+        self.verticalLayout_6.addLayout(self.body)
+        self.footer = QtWidgets.QHBoxLayout()
+        self.footer.setObjectName("footer")
+        spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.footer.addItem(spacerItem2)
+        self.cancel_btn = QtWidgets.QPushButton(parent=RoomEditPage)
+        self.cancel_btn.setObjectName("cancel_btn")
+        self.footer.addWidget(self.cancel_btn)
+        self.updateroom_btn = QtWidgets.QPushButton(parent=RoomEditPage)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.updateroom_btn.setFont(font)
+        self.updateroom_btn.setStyleSheet("background-color: rgb(0, 0, 0);\n"
+"color: rgb(255, 255, 255);")
+        self.updateroom_btn.setObjectName("updateroom_btn")
+        self.footer.addWidget(self.updateroom_btn)
+        spacerItem3 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.footer.addItem(spacerItem3)
+        self.verticalLayout_6.addLayout(self.footer)
+
+        self.retranslateUi(RoomEditPage)
+        QtCore.QMetaObject.connectSlotsByName(RoomEditPage)
+        RoomEditPage.setTabOrder(self.status_edit, self.roomtype_edit)
+        RoomEditPage.setTabOrder(self.roomtype_edit, self.price_edit)
+        RoomEditPage.setTabOrder(self.price_edit, self.capacity_edit)
+        RoomEditPage.setTabOrder(self.capacity_edit, self.description_edit)
+        RoomEditPage.setTabOrder(self.description_edit, self.cancel_btn)
+        RoomEditPage.setTabOrder(self.cancel_btn, self.updateroom_btn)
+
+    def retranslateUi(self, RoomEditPage):
+        _translate = QtCore.QCoreApplication.translate
+        self.label.setText(_translate("RoomEditPage", "Edit Room"))
+        self.label_2.setText(_translate("RoomEditPage", "Update room information"))
+        self.label_4.setText(_translate("RoomEditPage", "Room Type:"))
+        self.roomtype_edit.setItemText(0, _translate("RoomEditPage", "Single"))
+        self.roomtype_edit.setItemText(1, _translate("RoomEditPage", "Double"))
+        self.roomtype_edit.setItemText(2, _translate("RoomEditPage", "Twin"))
+        self.roomtype_edit.setItemText(3, _translate("RoomEditPage", "Deluxe"))
+        self.roomtype_edit.setItemText(4, _translate("RoomEditPage", "Suite"))
+        self.label_7.setText(_translate("RoomEditPage", "Status"))
+        self.status_edit.setItemText(0, _translate("RoomEditPage", "Available"))
+        self.status_edit.setItemText(1, _translate("RoomEditPage", "Maintenance"))
+        self.label_6.setText(_translate("RoomEditPage", "Capacity"))
+        self.label_5.setText(_translate("RoomEditPage", "Price/Night"))
+        self.label_8.setText(_translate("RoomEditPage", "Description"))
+        self.cancel_btn.setText(_translate("RoomEditPage", "Cancel"))
+        self.updateroom_btn.setText(_translate("RoomEditPage", "Update Room"))
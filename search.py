@@ -0,0 +1,302 @@
+from bisect import bisect_right
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+# Put between fields and rows so a search never matches across two of them
+FIELD_SEPARATOR = "\x1f"
+ROW_SEPARATOR = "\x1e"
+
+
+# ============== SEARCH INDEX ==============
+
+class SearchIndex:
+    # This class keep one lowercased text per row, made when rows are loaded,
+    # so a search is a substring scan instead of converting every column on
+    # every keystroke. Rows are stored by primary key so edits can update them.
+
+    def __init__(self, fields):
+        self.fields = fields
+        self.texts = {}
+        self.snapshot_cache = None
+
+    def row_text(self, row):
+        # Lowercase every field once and join them
+        values = []
+        for field in self.fields:
+            value = row[field]
+            values.append(str(value if value is not None else '').lower())
+        return FIELD_SEPARATOR.join(values)
+
+    def clear(self):
+        self.texts = {}
+        self.snapshot_cache = None
+
+    def add_rows(self, rows, key_field):
+        # Index new rows (or re-index changed ones)
+        for row in rows:
+            self.texts[row[key_field]] = self.row_text(row)
+        self.snapshot_cache = None
+
+    def update_row(self, key, row):
+        # Re-index one edited row
+        self.texts[key] = self.row_text(row)
+        self.snapshot_cache = None
+
+    def remove_row(self, key):
+        # Drop one deleted row
+        if self.texts.pop(key, None) is not None:
+            self.snapshot_cache = None
+
+    def snapshot(self):
+        # Get (all row texts in one string, start offset of each row, row keys,
+        # row texts). Kept until the index changes, and never changed afterwards,
+        # so it can be scanned on another thread.
+        if self.snapshot_cache is None:
+            keys = list(self.texts)
+            texts = list(self.texts.values())
+            starts = []
+            offset = 0
+            for text in texts:
+                starts.append(offset)
+                offset += len(text) + 1
+            self.snapshot_cache = (ROW_SEPARATOR.join(texts), starts, keys, texts)
+        return self.snapshot_cache
+
+
+def find_matches(snapshot, search_text, is_cancelled=None):
+    # Return the positions (in the snapshot) of the rows containing the search
+    # text (already lowercased), or None if the search was cancelled midway
+    blob, starts, keys, texts = snapshot
+    matches = []
+    position = blob.find(search_text)
+    while position != -1:
+        row = bisect_right(starts, position) - 1
+        matches.append(row)
+
+        # Check for cancellation every so often, not on every match
+        if is_cancelled and len(matches) % 1024 == 0 and is_cancelled():
+            return None
+
+        # Continue from the start of the next row
+        if row + 1 < len(starts):
+            position = blob.find(search_text, starts[row + 1])
+        else:
+            position = -1
+    return matches
+
+
+def narrow_matches(snapshot, previous_matches, search_text, is_cancelled=None):
+    # Same as find_matches, but only check rows that matched a shorter search
+    # contained in this one (every row matching "joh" also matches "jo")
+    texts = snapshot[3]
+    matches = []
+    for count, row in enumerate(previous_matches):
+        if is_cancelled and count % 1024 == 0 and is_cancelled():
+            return None
+        if search_text in texts[row]:
+            matches.append(row)
+    return matches
+
+
+def match_keys(snapshot, matches):
+    # Convert snapshot positions to row keys
+    keys = snapshot[2]
+    return {keys[row] for row in matches}
+
+
+class SearchTask(QRunnable):
+    # This class run one search on a worker thread
+
+    def __init__(self, pipeline, generation, snapshot, search_text, previous_matches=None):
+        super().__init__()
+        self.pipeline = pipeline
+        self.generation = generation
+        self.snapshot = snapshot
+        self.search_text = search_text
+        self.previous_matches = previous_matches
+
+    def run(self):
+        is_cancelled = lambda: self.pipeline.is_cancelled(self.generation)
+        if self.previous_matches is not None:
+            matches = narrow_matches(self.snapshot, self.previous_matches, self.search_text, is_cancelled)
+        else:
+            matches = find_matches(self.snapshot, self.search_text, is_cancelled)
+        if matches is not None:
+            # Signal is queued back to the GUI thread
+            self.pipeline.results_ready.emit(self.generation, matches)
+
+
+# ============== SEARCH PIPELINE ==============
+
+class SearchPipeline(QObject):
+    # This class filter one table while the user types: it waits until typing
+    # pauses, searches on a worker thread and applies the result in one go.
+    # Every new search cancels the one before it. When the text only grows,
+    # only the rows of the last result are checked again.
+    #
+    # With search_database (text, callback: runs the search off the GUI thread
+    # and calls callback(rows) back on it) and load_all (reload every row),
+    # searches for which use_database(text) is true (all, if not given) run in
+    # the database instead and the table shows only their result.
+
+    results_ready = pyqtSignal(int, object)
+
+    def __init__(self, model, proxy, delay_ms=250, parent=None, search_database=None, load_all=None,
+                 use_database=None):
+        super().__init__(parent)
+        self.model = model
+        self.proxy = proxy
+        self.search_database = search_database
+        self.load_all = load_all
+        self.use_database = use_database
+        self.search_text = ""
+        # Bumped on every search, older searches see the change and stop
+        self.generation = 0
+
+        # Last applied search: (text, index snapshot, matching positions)
+        self.last_search = None
+        # Search running on a worker: (generation, text, index snapshot)
+        self.running_search = None
+        # True while the model holds a database result instead of every row.
+        # Cleared only when the model is actually reloaded (model_reset).
+        self.showing_database_result = False
+        self.model.modelReset.connect(self.model_reset)
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay_ms)
+        self.timer.timeout.connect(self.start_search)
+        self.results_ready.connect(self.apply_results)
+
+    def set_delay(self, delay_ms):
+        # Change how long to wait after the last keystroke
+        self.timer.setInterval(delay_ms)
+
+    def reset(self):
+        # Forget the current search and any running one (the table is being
+        # emptied, e.g. on logout)
+        self.timer.stop()
+        self.generation += 1
+        self.search_text = ""
+        self.last_search = None
+        self.running_search = None
+        self.showing_database_result = False
+        self.proxy.set_matches(None)
+
+    def is_cancelled(self, generation):
+        return generation != self.generation
+
+    def database_wanted(self):
+        # Should the current text be searched in the database?
+        if self.search_database is None:
+            return False
+        return self.use_database is None or self.use_database(self.search_text)
+
+    def previous_matches(self, snapshot):
+        # Get the last result if it can be narrowed down for the current text:
+        # same rows as before and the old text is part of the new one
+        if self.last_search is None:
+            return None
+        last_text, last_snapshot, last_matches = self.last_search
+        if last_snapshot is snapshot and last_text in self.search_text:
+            return last_matches
+        return None
+
+    def model_reset(self):
+        # The model got new rows, apply_database_result sets the flag again
+        # when they are a database result
+        self.showing_database_result = False
+
+    def restore_all_rows(self):
+        # If the model only holds a database result, reload every row.
+        # load_all re-applies the current search itself (through search_now).
+        if not self.showing_database_result:
+            return False
+        self.load_all()
+        return True
+
+    def search(self, text):
+        # Called on every keystroke: restart the wait before searching
+        self.search_text = text.strip().lower()
+        self.generation += 1
+        if not self.search_text:
+            # Clearing the search is instant
+            self.timer.stop()
+            self.last_search = None
+            self.proxy.set_matches(None)
+            self.restore_all_rows()
+            return
+        self.timer.start()
+
+    def search_now(self, text):
+        # Search right away (used after the table is reloaded or patched)
+        self.search_text = text.strip().lower()
+        self.generation += 1
+        self.timer.stop()
+        if not self.search_text:
+            self.last_search = None
+            self.proxy.set_matches(None)
+            self.restore_all_rows()
+            return
+        if self.database_wanted():
+            self.show_database_result()
+            return
+        if self.restore_all_rows():
+            return
+        # Pages still being read arrive first, the search runs after them
+        generation = self.generation
+        self.model.fetch_all(lambda: self.filter_loaded_rows(generation))
+
+    def filter_loaded_rows(self, generation):
+        # Search every row right here, once they are all loaded
+        if self.is_cancelled(generation):
+            return
+        snapshot = self.model.search_index.snapshot()
+        previous_matches = self.previous_matches(snapshot)
+        if previous_matches is not None:
+            matches = narrow_matches(snapshot, previous_matches, self.search_text)
+        else:
+            matches = find_matches(snapshot, self.search_text)
+        self.last_search = (self.search_text, snapshot, matches)
+        self.proxy.set_matches(match_keys(snapshot, matches))
+
+    def show_database_result(self):
+        # Let the database search, the result is shown by apply_database_result
+        generation = self.generation
+        self.search_database(self.search_text, lambda rows: self.apply_database_result(generation, rows))
+
+    def apply_database_result(self, generation, rows):
+        # Show only what the database found, unless the search was replaced
+        # while it ran
+        if self.is_cancelled(generation):
+            return
+        self.last_search = None
+        self.proxy.set_matches(None)
+        self.model.load([rows])
+        self.showing_database_result = True
+
+    def start_search(self):
+        if self.database_wanted():
+            self.show_database_result()
+            return
+        if self.restore_all_rows():
+            return
+
+        # Search every row, so load the ones not fetched yet, then hand the index to a worker
+        generation = self.generation
+        self.model.fetch_all(lambda: self.search_loaded_rows(generation))
+
+    def search_loaded_rows(self, generation):
+        if self.is_cancelled(generation):
+            return
+        snapshot = self.model.search_index.snapshot()
+        self.running_search = (self.generation, self.search_text, snapshot)
+        task = SearchTask(self, self.generation, snapshot, self.search_text, self.previous_matches(snapshot))
+        QThreadPool.globalInstance().start(task)
+
+    def apply_results(self, generation, matches):
+        # Ignore results of searches that were replaced while running
+        if self.is_cancelled(generation) or self.running_search[0] != generation:
+            return
+        search_text, snapshot = self.running_search[1:]
+        self.last_search = (search_text, snapshot, matches)
+        self.proxy.set_matches(match_keys(snapshot, matches))
@@ -0,0 +1,160 @@
+import re
+import shlex
+
+# ============== FIELDS ==============
+
+# Words the user can type before ":" (or <, >, =) and the column they mean.
+# Kinds: "number" and "date" allow ranges and comparisons, "choice" is one of
+# a few capitalized values (Available, Paid, Suite...), "text" is a contains match.
+ROOM_FIELDS = {
+    "number": ("room_number", "number"),
+    "room": ("room_number", "number"),
+    "type": ("type", "choice"),
+    "price": ("price_rate", "number"),
+    "status": ("status", "choice"),
+    "capacity": ("capacity", "number"),
+    "description": ("description", "text"),
+    "desc": ("description", "text"),
+}
+
+RESERVATION_FIELDS = {
+    "id": ("guest_id", "number"),
+    "guest": ("guest_name", "text"),
+    "name": ("guest_name", "text"),
+    "contact": ("contact", "text"),
+    "room": ("room_number", "number"),
+    "checkin": ("checkin_date", "date"),
+    "checkout": ("checkout_date", "date"),
+    "payment": ("payment_status", "choice"),
+    "status": ("payment_status", "choice"),
+}
+
+# Columns plain words are looked for in (when there is no full-text index)
+ROOM_TEXT_COLUMNS = ("room_number", "type", "price_rate", "status", "capacity", "description")
+RESERVATION_TEXT_COLUMNS = ("guest_id", "guest_name", "contact", "room_number", "checkin_date",
+                            "checkout_date", "payment_status")
+
+FILTER_PATTERN = re.compile(r"^(?P<field>[A-Za-z_]+)(?P<op><=|>=|<|>|=|:)(?P<value>.*)$")
+COMPARISONS = {"<": "<", "<=": "<=", ">": ">", ">=": ">=", "=": "=", ":": "="}
+
+# ============== PARSER ==============
+
+def split_words(text):
+    # Split on spaces but keep "quoted words" together
+    try:
+        return shlex.split(text)
+    except ValueError:
+        # Unbalanced quote, just split on spaces
+        return text.split()
+
+
+def convert_value(value, kind):
+    # Turn a typed value into what the column stores, or None if it does not fit
+    if kind == "number":
+        try:
+            return float(value) if "." in value else int(value)
+        except ValueError:
+            return None
+    if kind == "choice":
+        return value.capitalize()
+    return value
+
+
+def parse_filter(word, fields):
+    # Parse one "field:value" style word into (column, kind, operator, values),
+    # or None when it is a plain word
+    found = FILTER_PATTERN.match(word)
+    if not found or found.group("field").lower() not in fields:
+        return None
+    column, kind = fields[found.group("field").lower()]
+    op = found.group("op")
+    value = found.group("value")
+    if not value:
+        return None
+
+    # Ranges: checkin:2026-10-01..2026-10-07, price:1000.., capacity:..4
+    if op == ":" and ".." in value and kind in ("number", "date"):
+        low, high = value.split("..", 1)
+        low = convert_value(low, kind) if low else None
+        high = convert_value(high, kind) if high else None
+        if low is None and high is None:
+            return None
+        return column, kind, "range", (low, high)
+
+    if op != ":" and op != "=" and kind not in ("number", "date"):
+        return None
+    converted = convert_value(value, kind)
+    if converted is None:
+        return None
+    if kind == "text":
+        return column, kind, "contains", (converted,)
+    return column, kind, COMPARISONS[op], (converted,)
+
+
+def parse_query(text, fields):
+    # Split search text into (list of filters, list of plain words)
+    filters = []
+    words = []
+    for word in split_words(text):
+        parsed = parse_filter(word, fields)
+        if parsed:
+            filters.append(parsed)
+        else:
+            words.append(word)
+    return filters, words
+
+
+def is_structured_query(text, fields):
+    # True if the text has at least one field filter
+    filters, words = parse_query(text, fields)
+    return bool(filters)
+
+# ============== SQL COMPILER ==============
+
+def escape_like(value):
+    # Make % and _ typed by the user match literally
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def compile_query(filters, words, text_columns, full_text=None):
+    # Build a parameterized WHERE clause. full_text is (sql, make_param) used for
+    # the plain words instead of LIKE, e.g. an FTS5 sub-select.
+    conditions = []
+    params = []
+
+    for column, kind, op, values in filters:
+        if op == "range":
+            low, high = values
+            if low is not None and high is not None:
+                conditions.append(f"{column} BETWEEN ? AND ?")
+                params.extend([low, high])
+            elif low is not None:
+                conditions.append(f"{column} >= ?")
+                params.append(low)
+            else:
+                conditions.append(f"{column} <= ?")
+                params.append(high)
+        elif op == "contains":
+            conditions.append(f"{column} LIKE ? ESCAPE '\\'")
+            params.append(f"%{escape_like(values[0])}%")
+        else:
+            conditions.append(f"{column} {op} ?")
+            params.append(values[0])
+
+    if words:
+        if full_text:
+            sql, make_param = full_text
+            param = make_param(" ".join(words))
+            if param:
+                conditions.append(sql)
+                params.append(param)
+        else:
+            # Every word must be found in at least one column
+            for word in words:
+                pattern = f"%{escape_like(word)}%"
+                either = " OR ".join(f"{column} LIKE ? ESCAPE '\\'" for column in text_columns)
+                conditions.append(f"({either})")
+                params.extend([pattern] * len(text_columns))
+
+    where = " AND ".join(conditions) if conditions else "1"
+    return where, params
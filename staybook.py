@@ -3,22 +3,59 @@ from PyQt6.QtWidgets import QApplication
 from login import LoginDialog
 from main import MainWindow
 
+
+class SessionManager:
+    # This class keep one login dialog and one main window for the whole run.
+    # Logging out closes the user's database connections and empties the
+    # tables; logging in binds the same window to the next user's database,
+    # so a shift change does not build the windows again.
+
+    def __init__(self, app):
+        self.app = app
+        self.login_dialog = None
+        self.main_window = None
+
+    def login(self):
+        # Show the login dialog, return the username or None if cancelled
+        if self.login_dialog is None:
+            self.login_dialog = LoginDialog() #Make an instance of LoginDialog
+        else:
+            self.login_dialog.reset()
+        self.login_dialog.exec() # Show login dialog
+        if self.login_dialog.login_successful:
+            return self.login_dialog.logged_in_username #Entered username from login.py
+        return None
+
+    def start_session(self, username):
+        # If login successful, show main window
+        if self.main_window is None:
+            self.main_window = MainWindow()
+        self.main_window.start_session(username) #Share username with main
+        self.main_window.show()
+
+    def run(self):
+        while True: # Naka loop ja para mabalikan ta ya una nga line nga login_dialog
+            username = self.login()
+            if username is None:
+                # Exit if login was cancelled
+                break
+            self.start_session(username)
+            self.app.exec()  # Jang syntax ngaja means ga run ya application kag ma run lang gid,
+                             # kung mag untat ja mabalik kita sa login page tungod sa while loop
+        self.close()
+
+    def close(self):
+        # Close the connections still open before exiting
+        if self.main_window:
+            self.main_window.end_session()
+        if self.login_dialog:
+            self.login_dialog.release()
+
+
 if __name__ == "__main__":
     # Create the application
     app = QApplication(sys.argv)
 
-    while True: # Naka loop ja para mabalikan ta ya una nga line nga login_dialog
-        login_dialog = LoginDialog() #Make an instance of LoginDialog
-        # Login_dialog can initialize the database inside its __init__
-        login_dialog.exec() # Show login dialog
-        if login_dialog.login_successful:
-            username = login_dialog.logged_in_username #Entered username from login.py
-            # If login successful, show main window
-            main_window = MainWindow(username) #Share username with main
-            main_window.show()
-            app.exec()  # Jang syntax ngaja means ga run ya application kag ma run lang gid,
-                        # kung mag untat ja mabalik kita sa login page tungod sa while loop
-
-        else:
-            # Exit if login was cancelled
-            sys.exit(0)
\ No newline at end of file
+    session_manager = SessionManager(app)
+    session_manager.run()
+    sys.exit(0)
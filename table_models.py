@@ -0,0 +1,371 @@
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel, QEvent, QRect, QSize, pyqtSignal
+from PyQt6.QtWidgets import QApplication, QStyle, QStyledItemDelegate, QStyleOptionButton
+from search import SearchIndex
+from resource_cache import get_icon, WHITE_TEXT, ROOM_STATUS_BRUSHES, PAYMENT_STATUS_BRUSHES
+
+
+# ============== BASE TABLE MODEL ==============
+
+class RowTableModel(QAbstractTableModel):
+    # This class show database rows in a table view and load them chunk by chunk.
+    # Rows come either from an in-memory list of chunks (load) or page by page
+    # from the database thread (load_pages).
+
+    # List of (row field, header text). A field of None is the action column.
+    COLUMNS = []
+    # Field that identify a row (primary key)
+    KEY = None
+    # Field whose value decide the cell color, and value -> background brush
+    COLOR_FIELD = None
+    COLORS = {}
+    TEXT_COLOR = WHITE_TEXT
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []
+        # Primary key -> model row, so patches and page merges need no scan
+        self.row_numbers = {}
+        self.chunks = None
+        # Database paging: fetch_page(last_row, callback) reads the page after
+        # last_row on the database thread and calls callback with its rows
+        self.fetch_page = None
+        self.page_size = 0
+        self.last_page_row = None
+        self.fetching = False
+        # Bumped on every reload, so a page read for the old rows is ignored
+        self.page_generation = 0
+        # Rows deleted while pages are pending (a page read before the delete
+        # must not bring them back) and callbacks waiting for every page
+        self.removed_keys = set()
+        self.loaded_callbacks = []
+        # Lowercased text of every loaded row, for the search boxes
+        self.search_index = SearchIndex([field for field, header in self.COLUMNS if field is not None])
+
+    def reset_rows(self):
+        self.beginResetModel()
+        self.rows = []
+        self.row_numbers = {}
+        self.chunks = None
+        self.fetch_page = None
+        self.last_page_row = None
+        self.fetching = False
+        self.page_generation += 1
+        self.removed_keys = set()
+        self.loaded_callbacks = []
+        self.search_index.clear()
+        self.endResetModel()
+
+    def load(self, chunks):
+        # Replace the rows with a new source (any iterable of lists of rows).
+        # Only the first chunk is read now, the view asks for more on scroll.
+        self.reset_rows()
+        self.chunks = iter(chunks)
+        self.fetchMore()
+
+    def load_pages(self, first_page, fetch_page, page_size):
+        # Replace the rows with the first page of a database table. The next
+        # pages are read with fetch_page when the view scrolls.
+        self.reset_rows()
+        self.page_size = page_size
+        if len(first_page) == page_size:
+            self.fetch_page = fetch_page
+        self.add_rows(first_page)
+        if first_page:
+            self.last_page_row = first_page[-1]
+
+    def canFetchMore(self, parent=QModelIndex()):
+        # More rows are available until the chunk or page source runs out
+        if parent.isValid():
+            return False
+        return self.chunks is not None or (self.fetch_page is not None and not self.fetching)
+
+    def fetchMore(self, parent=QModelIndex()):
+        # Append the next chunk of rows, or ask for the next page
+        if parent.isValid():
+            return
+        if self.chunks is None:
+            if self.fetch_page is not None and not self.fetching:
+                self.fetching = True
+                generation = self.page_generation
+                self.fetch_page(self.last_page_row, lambda rows: self.add_page(generation, rows))
+            return
+        chunk = next(self.chunks, None)
+        if not chunk:
+            self.chunks = None
+            return
+        self.add_rows(chunk)
+
+    def add_rows(self, rows):
+        # Append rows, leaving out any a change already patched in (those are
+        # at least as new) or deleted since the source was read
+        first = len(self.rows)
+        new_rows = []
+        numbers = {}
+        for values in rows:
+            key = values[self.KEY]
+            if key not in self.row_numbers and key not in numbers and key not in self.removed_keys:
+                numbers[key] = first + len(new_rows)
+                new_rows.append(values)
+        if not new_rows:
+            return
+        self.beginInsertRows(QModelIndex(), first, first + len(new_rows) - 1)
+        self.rows.extend(new_rows)
+        self.row_numbers.update(numbers)
+        self.search_index.add_rows(new_rows, self.KEY)
+        self.endInsertRows()
+
+    def add_page(self, generation, rows):
+        # A page read on the database thread arrived
+        if generation != self.page_generation:
+            return
+        self.fetching = False
+        if rows:
+            self.last_page_row = rows[-1]
+        if len(rows) < self.page_size:
+            self.fetch_page = None
+        self.add_rows(rows)
+
+        if self.fetch_page is None:
+            self.removed_keys = set()
+            callbacks = self.loaded_callbacks
+            self.loaded_callbacks = []
+            for callback in callbacks:
+                callback()
+        elif self.loaded_callbacks:
+            self.fetchMore()
+
+    def is_fully_loaded(self):
+        return self.chunks is None and self.fetch_page is None
+
+    def fetch_all(self, callback=None):
+        # Load every remaining row (needed before searching all rows), then
+        # call callback. Pages come from the database thread, so callback may
+        # run later; it is dropped if the table is reloaded meanwhile.
+        while self.chunks is not None:
+            self.fetchMore()
+        if self.fetch_page is None:
+            if callback:
+                callback()
+            return
+        if callback:
+            self.loaded_callbacks.append(callback)
+        self.fetchMore()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        # Show column names on top
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.COLUMNS[section][1]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        field = self.COLUMNS[index.column()][0]
+        if field is None:
+            return None
+        value = self.rows[index.row()][field]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return "" if value is None else str(value)
+
+        # Colored status cells with white text
+        if field == self.COLOR_FIELD:
+            if role == Qt.ItemDataRole.BackgroundRole:
+                return self.COLORS.get(value)
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return self.TEXT_COLOR
+        return None
+
+    def find_row(self, key):
+        # Get the model row holding a primary key, or -1 if it is not loaded
+        return self.row_numbers.get(key, -1)
+
+    def insert_row(self, values):
+        # Add one new row at the end. If a page still to come holds it too,
+        # that copy is left out when the page arrives.
+        # A row already shown is updated instead (the same write can be reported twice).
+        if self.find_row(values[self.KEY]) != -1:
+            self.update_row(values[self.KEY], values)
+            return
+        self.removed_keys.discard(values[self.KEY])
+        row = len(self.rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.rows.append(values)
+        self.row_numbers[values[self.KEY]] = row
+        self.search_index.update_row(values[self.KEY], values)
+        self.endInsertRows()
+
+    def update_row(self, key, values):
+        # Replace one loaded row in place and repaint only its cells.
+        # A row not shown yet is added like a new one.
+        row = self.find_row(key)
+        if row == -1:
+            self.insert_row(values)
+            return
+        self.rows[row] = values
+        self.search_index.update_row(key, values)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.COLUMNS) - 1))
+
+    def remove_row(self, key):
+        # Take one deleted row out of the table
+        if not self.is_fully_loaded():
+            self.removed_keys.add(key)
+        row = self.find_row(key)
+        if row == -1:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.rows[row]
+        del self.row_numbers[key]
+        # The rows after it move up one
+        for number in range(row, len(self.rows)):
+            self.row_numbers[self.rows[number][self.KEY]] = number
+        self.search_index.remove_row(key)
+        self.endRemoveRows()
+
+    def row_data(self, row):
+        # Get the database row shown at a model row
+        return self.rows[row]
+
+    def row_key(self, row):
+        # Get the primary key of a model row
+        return self.rows[row][self.KEY]
+
+
+# ============== TABLE MODELS ==============
+
+class RoomTableModel(RowTableModel):
+    # Rooms table
+    COLUMNS = [
+        ("room_number", "Room Number"),
+        ("type", "Type"),
+        ("price_rate", "Price_Rate"),
+        ("status", "Status"),
+        ("capacity", "Capacity"),
+        ("description", "Description"),
+        (None, "Action"),
+    ]
+    KEY = "room_number"
+    COLOR_FIELD = "status"
+    COLORS = ROOM_STATUS_BRUSHES
+
+
+class ReservationTableModel(RowTableModel):
+    # Reservations table
+    COLUMNS = [
+        ("guest_id", "Guest_ID"),
+        ("guest_name", "Guest_Name"),
+        ("contact", "Contact"),
+        ("room_number", "Room_Number"),
+        ("checkin_date", "Check-in"),
+        ("checkout_date", "Check-out"),
+        ("payment_status", "Payment"),
+        (None, "Action"),
+    ]
+    KEY = "guest_id"
+    COLOR_FIELD = "payment_status"
+    COLORS = PAYMENT_STATUS_BRUSHES
+
+
+class BranchTableModel(RowTableModel):
+    # Branches table (admin only)
+    COLUMNS = [
+        ("username", "Branch Name"),
+        ("password", "Password"),
+        ("address", "Location"),
+        ("contact", "Contact"),
+        (None, "Actions"),
+    ]
+    KEY = "uid"
+
+
+# ============== SEARCH FILTER ==============
+
+class SearchFilterProxyModel(QSortFilterProxyModel):
+    # This class hide rows that are not in the latest search result
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Primary keys of the rows to show, or None to show every row
+        self.matches = None
+
+    def set_matches(self, matches):
+        # Show only the rows with the given keys (None shows all) in one update
+        self.matches = matches
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        return self.matches is None or self.sourceModel().row_key(source_row) in self.matches
+
+    def row_key(self, index):
+        # Get the primary key of the source row behind a view index
+        return self.sourceModel().row_key(self.mapToSource(index).row())
+
+
+# ============== ACTION COLUMN ==============
+
+class ActionButtonDelegate(QStyledItemDelegate):
+    # This class paint edit and delete buttons in a cell instead of creating
+    # real button widgets for every row. Clicks are found by position.
+
+    edit_clicked = pyqtSignal(QModelIndex)
+    delete_clicked = pyqtSignal(QModelIndex)
+
+    BUTTON_WIDTH = 60
+    SPACING = 6
+    MARGIN = 2
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.edit_icon = get_icon("edit16.png")
+        self.delete_icon = get_icon("delete16.png")
+
+    def button_rects(self, rect):
+        # Get the edit and delete button areas inside a cell, side by side in the middle
+        width = min(self.BUTTON_WIDTH, (rect.width() - self.SPACING) // 2)
+        height = rect.height() - 2 * self.MARGIN
+        left = rect.left() + (rect.width() - 2 * width - self.SPACING) // 2
+        top = rect.top() + self.MARGIN
+        edit_rect = QRect(left, top, width, height)
+        delete_rect = QRect(left + width + self.SPACING, top, width, height)
+        return edit_rect, delete_rect
+
+    def paint(self, painter, option, index):
+        # Draw the cell background, then the two buttons on top
+        super().paint(painter, option, index)
+        style = option.widget.style() if option.widget else QApplication.style()
+        edit_rect, delete_rect = self.button_rects(option.rect)
+        for rect, icon in ((edit_rect, self.edit_icon), (delete_rect, self.delete_icon)):
+            button = QStyleOptionButton()
+            button.rect = rect
+            button.icon = icon
+            button.iconSize = QSize(16, 16)
+            button.state = QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_Raised
+            style.drawControl(QStyle.ControlElement.CE_PushButton, button, painter, option.widget)
+
+    def sizeHint(self, option, index):
+        # Wide enough for both buttons
+        size = super().sizeHint(option, index)
+        return QSize(2 * self.BUTTON_WIDTH + self.SPACING, size.height())
+
+    def editorEvent(self, event, model, option, index):
+        # Emit a click signal when the mouse is released over a button
+        if event.type() == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton:
+            edit_rect, delete_rect = self.button_rects(option.rect)
+            position = event.position().toPoint()
+            if edit_rect.contains(position):
+                self.edit_clicked.emit(index)
+                return True
+            if delete_rect.contains(position):
+                self.delete_clicked.emit(index)
+                return True
+        return super().editorEvent(event, model, option, index)
@@ -0,0 +1,49 @@
+import os
+import tempfile
+import unittest
+from database import HotelDatabase
+
+
+class BulkOperationTest(unittest.TestCase):
+    # Check that rows added in bulk end up like rows added one at a time
+
+    def setUp(self):
+        # Branch files are made under the current folder, use a temporary one
+        self.old_cwd = os.getcwd()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.temp_dir.name)
+        self.db = HotelDatabase("bulk_test")
+
+    def tearDown(self):
+        self.db.close()
+        os.chdir(self.old_cwd)
+        self.temp_dir.cleanup()
+
+    def test_missing_dict_keys_get_column_defaults(self):
+        # A room given without a status is Available, as with a plain INSERT
+        added, errors = self.db.add_rooms_bulk([{'type': 'A'}, {'type': 'B', 'status': 'Maintenance'}])
+        self.assertEqual((added, errors), (2, []))
+        rooms = self.db.get_all_rooms()
+        self.assertEqual([room['status'] for room in rooms], ['Available', 'Maintenance'])
+        self.assertEqual([room['type'] for room in self.db.find_available_rooms("2026-01-01", "2026-01-02")],
+                         ['A'])
+
+    def test_missing_dict_keys_without_default_are_null(self):
+        self.db.add_rooms_bulk([('Single', 1000, 1, '', 'Available')])
+        added, errors = self.db.add_reservations_bulk([{'guest_name': 'guest', 'room_number': 1,
+                                                        'checkin_date': '2026-01-01',
+                                                        'checkout_date': '2026-01-02'}])
+        self.assertEqual((added, errors), (1, []))
+        self.assertIsNone(self.db.get_reservation_by_id(1)['payment_status'])
+
+    def test_tuples_are_kept_as_given(self):
+        added, errors = self.db.add_rooms_bulk([('Single', 1000, 1, 'first', 'Available'),
+                                                ('Double', 2000, 2, 'second', 'Maintenance')])
+        self.assertEqual((added, errors), (2, []))
+        rooms = self.db.get_all_rooms()
+        self.assertEqual([(room['type'], room['status']) for room in rooms],
+                         [('Single', 'Available'), ('Double', 'Maintenance')])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import os
+import tempfile
+import unittest
+from database import HotelDatabase
+
+
+class PagingTest(unittest.TestCase):
+    # Check that reading a table page by page gives every row once, in order
+
+    def setUp(self):
+        # Branch files are made under the current folder, use a temporary one
+        self.old_cwd = os.getcwd()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.temp_dir.name)
+        self.db = HotelDatabase("paging_test")
+
+    def tearDown(self):
+        self.db.close()
+        os.chdir(self.old_cwd)
+        self.temp_dir.cleanup()
+
+    def all_pages(self, chunks):
+        return [row['room_number'] for chunk in chunks for row in chunk]
+
+    def test_rooms_by_status_with_null_values(self):
+        statuses = [None, 'Occupied', None, 'Available', None, 'Maintenance', 'Available', None, None]
+        self.db.add_rooms_bulk(('Single', 1000, 1, '', status) for status in statuses)
+        expected = [row['room_number'] for row in
+                    self.db.conn.execute("SELECT room_number FROM rooms ORDER BY status, room_number")]
+        for chunk_size in range(1, len(statuses) + 2):
+            self.assertEqual(self.all_pages(self.db.iter_room_chunks(chunk_size, "status")), expected,
+                             f"chunk size {chunk_size}")
+
+    def test_page_after_a_null_value(self):
+        self.db.add_rooms_bulk(('Single', 1000, 1, '', status) for status in [None, None, 'Available'])
+        rooms = self.db.iter_rooms(1, 10, "status", None)
+        self.assertEqual([room['room_number'] for room in rooms], [2, 3])
+
+    def test_other_order_needs_the_last_value(self):
+        self.db.add_rooms_bulk([('Single', 1000, 1, '', 'Available')])
+        with self.assertRaises(ValueError):
+            self.db.iter_rooms(1, 10, "status")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+import os
+import tempfile
+import unittest
+from database import HotelDatabase
+
+
+class QueryPlanTest(unittest.TestCase):
+    # Check that the lookups the windows run on every click search an index
+    # (or the primary key) instead of reading the whole table. The SQL is
+    # recorded while the real methods run, so the test follows the code.
+
+    def setUp(self):
+        # Branch files are made under the current folder, use a temporary one
+        self.old_cwd = os.getcwd()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.temp_dir.name)
+        self.db = HotelDatabase("plan_test")
+
+    def tearDown(self):
+        self.db.close()
+        os.chdir(self.old_cwd)
+        self.temp_dir.cleanup()
+
+    def plan(self, sql, params=()):
+        # Get the plan lines, e.g. "SEARCH rooms USING INDEX idx_rooms_status (status=?)"
+        return [row[3] for row in self.db.conn.execute("EXPLAIN QUERY PLAN " + sql, params)]
+
+    def plan_of(self, call):
+        # Run call() and get the plan lines of every statement it ran
+        statements = []
+        self.db.conn.set_trace_callback(statements.append)
+        try:
+            call()
+        finally:
+            self.db.conn.set_trace_callback(None)
+        lines = []
+        for sql in statements:
+            if sql.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE")):
+                lines.extend(self.plan(sql))
+        self.assertTrue(lines, "no query was run")
+        return lines
+
+    def assert_indexed(self, lines, table):
+        # Every step reading the table must search an index or the primary key
+        steps = [line for line in lines if f" {table}" in line]
+        self.assertTrue(steps, f"{table} is not read: {lines}")
+        for line in steps:
+            self.assertFalse(line.startswith("SCAN"), f"{table} is scanned: {lines}")
+            self.assertTrue("USING" in line and ("INDEX" in line or "PRIMARY KEY" in line),
+                            f"{table} is not searched by key: {lines}")
+
+    def assert_index_order(self, lines):
+        # A page must come out of the index in order, not be sorted after reading every match
+        self.assertFalse([line for line in lines if "TEMP B-TREE" in line], f"rows are sorted: {lines}")
+
+    def test_get_available_rooms(self):
+        lines = self.plan_of(self.db.get_available_rooms)
+        self.assert_indexed(lines, "rooms")
+
+    def test_get_room_by_number(self):
+        lines = self.plan_of(lambda: self.db.get_room_by_number(1))
+        self.assert_indexed(lines, "rooms")
+
+    def test_get_reservation_by_id(self):
+        lines = self.plan_of(lambda: self.db.get_reservation_by_id(1))
+        self.assert_indexed(lines, "reservations")
+
+    def test_delete_room_foreign_key_check(self):
+        # Deleting a room looks for reservations still pointing at it
+        self.db.add_room("Single", 1000, 1, "", "Available")
+        lines = self.plan("DELETE FROM rooms WHERE room_number = 1")
+        self.assert_indexed(lines, "rooms")
+        self.assert_indexed(lines, "reservations")
+
+    def test_find_available_rooms(self):
+        # Every room is a candidate, so rooms is read whole on purpose; the
+        # overlap check run for each room must not read every reservation
+        lines = self.plan_of(lambda: self.db.find_available_rooms("2026-01-01", "2026-01-03"))
+        self.assert_indexed(lines, "reservations")
+
+    # ============== PAGING ==============
+
+    def test_iter_rooms_by_number(self):
+        lines = self.plan_of(lambda: self.db.iter_rooms(3, 10))
+        self.assert_indexed(lines, "rooms")
+        self.assert_index_order(lines)
+
+    def test_iter_rooms_by_status(self):
+        # The first page walks the index from the start, the next ones search it
+        lines = self.plan_of(lambda: self.db.iter_rooms(None, 10, "status"))
+        self.assertTrue(all("USING INDEX idx_rooms_status" in line for line in lines), lines)
+        self.assert_index_order(lines)
+        for after_value in ("Available", None):
+            lines = self.plan_of(lambda: self.db.iter_rooms(3, 10, "status", after_value))
+            self.assert_indexed(lines, "rooms")
+            self.assert_index_order(lines)
+
+    def test_iter_reservations_by_checkin_date(self):
+        lines = self.plan_of(lambda: self.db.iter_reservations(None, 10, "checkin_date"))
+        self.assertTrue(all("USING INDEX idx_reservations_checkin" in line for line in lines), lines)
+        self.assert_index_order(lines)
+        for after_value in ("2026-01-01", None):
+            lines = self.plan_of(lambda: self.db.iter_reservations(3, 10, "checkin_date", after_value))
+            self.assert_indexed(lines, "reservations")
+            self.assert_index_order(lines)
+
+    # ============== ROOM STATUS ==============
+
+    def test_refresh_room_status(self):
+        # Run for the room of every reservation written
+        lines = self.plan(self.db.REFRESH_ROOM_STATUS_SQL, (1,))
+        self.assert_indexed(lines, "rooms")
+        self.assert_indexed(lines, "reservations")
+
+    def test_refresh_all_room_status(self):
+        # Run at every login and midnight: every room is checked, but each
+        # check must not read every reservation
+        lines = self.plan_of(self.db.refresh_all_room_status)
+        self.assert_indexed(lines, "reservations")
+
+    # ============== SEARCH BOX FILTERS ==============
+
+    def test_query_rooms_field_filters(self):
+        for text in ("status:available", "room:3"):
+            lines = self.plan_of(lambda: self.db.query_rooms(text))
+            self.assert_indexed(lines, "rooms")
+
+    def test_query_reservations_field_filters(self):
+        for text in ("id:3", "room:3", "checkin:2026-10-01..2026-10-07"):
+            lines = self.plan_of(lambda: self.db.query_reservations(text))
+            self.assert_indexed(lines, "reservations")
+
+
+if __name__ == "__main__":
+    unittest.main()